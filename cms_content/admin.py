@@ -1,4 +1,7 @@
 from django.contrib import admin
+from django.utils.html import format_html
+
+from .thumbnails import thumbnail_url
 from .models import (
     PageContent,
     CallToAction,
@@ -12,13 +15,26 @@ from .models import (
     Capability,
 )
 
+def thumbnail_column(field_name):
+    """Build a list_display column showing a small thumbnail of an image field."""
+    @admin.display(description='Image')
+    def thumbnail(obj):
+        image = getattr(obj, field_name)
+        if not image:
+            return ''
+        return format_html(
+            '<img src="{}" alt="" style="max-width: 80px; max-height: 60px;" loading="lazy">',
+            thumbnail_url(image.name, 160, 120),
+        )
+    return thumbnail
+
 class CallToActionInline(admin.TabularInline):
     model = CallToAction
     extra = 1
     readonly_fields = ('created_at', 'updated_at')
 
 class PageContentAdmin(admin.ModelAdmin):
-    list_display = ('page_name', 'section_identifier', 'title', 'order', 'created_at', 'updated_at')
+    list_display = ('page_name', 'section_identifier', 'title', thumbnail_column('background_image'), 'order', 'created_at', 'updated_at')
     list_filter = ('page_name', 'section_identifier')
     search_fields = ('page_name', 'section_identifier', 'title', 'body_text')
     inlines = [CallToActionInline]
@@ -41,7 +57,7 @@ class ProductSectionInline(admin.StackedInline):
     readonly_fields = ('created_at', 'updated_at')
 
 class ProductAdmin(admin.ModelAdmin):
-    list_display = ('name', 'url_slug', 'order', 'created_at', 'updated_at')
+    list_display = ('name', thumbnail_column('hero_image'), 'url_slug', 'order', 'created_at', 'updated_at')
     search_fields = ('name', 'short_description', 'main_description', 'conclusion_text')
     prepopulated_fields = {'url_slug': ('name',)}
     inlines = [ProductImageInline, ProductSectionInline]
@@ -60,7 +76,7 @@ class ProductAdmin(admin.ModelAdmin):
     )
 
 class ServiceAdmin(admin.ModelAdmin):
-    list_display = ('name', 'url_slug', 'order', 'created_at', 'updated_at')
+    list_display = ('name', thumbnail_column('image'), 'url_slug', 'order', 'created_at', 'updated_at')
     search_fields = ('name', 'short_description')
     prepopulated_fields = {'url_slug': ('name',)}
     readonly_fields = ('created_at', 'updated_at')
@@ -76,7 +92,7 @@ class TimelineEventAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at', 'updated_at')
 
 class CapabilityAdmin(admin.ModelAdmin):
-    list_display = ('title', 'order', 'created_at', 'updated_at')
+    list_display = ('title', thumbnail_column('image'), 'order', 'created_at', 'updated_at')
     search_fields = ('title', 'description')
     readonly_fields = ('created_at', 'updated_at')
 
@@ -96,7 +112,7 @@ class CallToActionAdmin(admin.ModelAdmin):
 admin.site.register(CallToAction, CallToActionAdmin)
 
 class ProductImageAdmin(admin.ModelAdmin):
-    list_display = ('product', 'alt_text', 'order', 'created_at', 'updated_at')
+    list_display = ('product', thumbnail_column('image'), 'alt_text', 'order', 'created_at', 'updated_at')
     readonly_fields = ('created_at', 'updated_at')
 admin.site.register(ProductImage, ProductImageAdmin)
 
@@ -0,0 +1,154 @@
+import itertools
+import time
+from dataclasses import dataclass
+
+from django.db import models, transaction
+from django.utils import timezone
+
+from .search import get_search_backend
+from .versioning import bump_content_version
+
+
+@dataclass
+class UpsertStats:
+    model: str
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    seconds: float = 0.0
+
+    def __str__(self):
+        return (
+            f'{self.model}: {self.created} created, {self.updated} updated, '
+            f'{self.unchanged} unchanged in {self.seconds:.2f}s'
+        )
+
+
+class BulkUpserter:
+    """Create or update rows of one model, matched on a natural key, in batches.
+
+    Records are taken batch_size at a time. For each batch the matching
+    rows are fetched with one query on the first key field, compared with
+    the incoming values, and only new or changed rows are written, with
+    bulk_create and bulk_update. Only one batch of records is held at a
+    time; upsert() does collect the resulting rows, one per distinct key,
+    since callers need their ids. Foreign keys are passed
+    as <field>_id values, which callers resolve from the rows an earlier
+    upsert() returned.
+    """
+
+    def __init__(self, model, key, batch_size=500):
+        self.model = model
+        self.key = tuple(key)
+        self.batch_size = batch_size
+        self.stats = UpsertStats(model.__name__)
+        self.has_updated_at = any(field.name == 'updated_at' for field in model._meta.concrete_fields)
+
+    def row_key(self, row):
+        return tuple(getattr(row, name) for name in self.key)
+
+    def existing(self, keys):
+        """Return the stored rows with the given natural keys, keyed by natural key."""
+        rows = self.model.objects.filter(**{f'{self.key[0]}__in': {key[0] for key in keys}})
+        return {self.row_key(row): row for row in rows if self.row_key(row) in keys}
+
+    def clean(self, values):
+        # Compare values as the model field would store them, so "3" and 3 match.
+        cleaned = {}
+        for name, value in values.items():
+            field = self.model._meta.get_field(name)
+            value = field.to_python(value)
+            if value is None and isinstance(field, models.FileField):
+                # An empty file field saves as '', never NULL.
+                value = ''
+            cleaned[name] = value
+        return cleaned
+
+    def upsert(self, records):
+        """Write an iterable of field value dicts. Returns their rows keyed by natural key."""
+        result = {}
+        records = iter(records)
+        while batch := list(itertools.islice(records, self.batch_size)):
+            result.update(self.upsert_batch(batch))
+        return result
+
+    def upsert_batch(self, records):
+        started = time.perf_counter()
+        records = [self.clean(values) for values in records]
+        keys = {tuple(values[name] for name in self.key) for values in records}
+        rows = self.existing(keys)
+        created, updated, changed_fields = {}, {}, set()
+        for values in records:
+            key = tuple(values[name] for name in self.key)
+            row = rows.get(key)
+            if row is None:
+                row = rows[key] = created[key] = self.model(**values)
+            else:
+                changed = [name for name, value in values.items() if getattr(row, name) != value]
+                for name in changed:
+                    setattr(row, name, values[name])
+                if changed and key not in created:
+                    updated[key] = row
+                    changed_fields.update(changed)
+                elif key not in created and key not in updated:
+                    self.stats.unchanged += 1
+
+        self.model.objects.bulk_create(created.values(), batch_size=self.batch_size)
+        if updated:
+            if self.has_updated_at:
+                # bulk_update() skips auto_now, and conditional GETs rely on updated_at.
+                now = timezone.now()
+                for row in updated.values():
+                    row.updated_at = now
+                changed_fields.add('updated_at')
+            self.model.objects.bulk_update(updated.values(), sorted(changed_fields), batch_size=self.batch_size)
+        if created and next(iter(created.values())).pk is None:
+            # Databases that cannot return ids from bulk inserts: read them back.
+            rows.update(self.existing(set(created)))
+
+        self.stats.created += len(created)
+        self.stats.updated += len(updated)
+        self.stats.seconds += time.perf_counter() - started
+        return rows
+
+
+class BulkImport:
+    """Run a set of bulk upserts in one transaction, then refresh derived data.
+
+    Bulk writes send no post_save signals, so on success the content
+    version is bumped once and the search index rebuilt, as the signals
+    would have done row by row.
+    """
+
+    def __init__(self, batch_size=500):
+        self.batch_size = batch_size
+        self.upserters = []
+        self.seconds = 0.0
+
+    def upserter(self, model, key):
+        upserter = BulkUpserter(model, key, batch_size=self.batch_size)
+        self.upserters.append(upserter)
+        return upserter
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        self.atomic = transaction.atomic()
+        self.atomic.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None and any(u.stats.created or u.stats.updated for u in self.upserters):
+            try:
+                bump_content_version()
+                get_search_backend().rebuild()
+            except BaseException as error:
+                self.atomic.__exit__(type(error), error, error.__traceback__)
+                raise
+        self.seconds = time.perf_counter() - self.started
+        return self.atomic.__exit__(exc_type, exc_value, traceback)
+
+    def report(self):
+        """Yield one line per model and a total."""
+        for upserter in self.upserters:
+            yield str(upserter.stats)
+        yield f'Finished in {self.seconds:.2f}s.'
@@ -0,0 +1,157 @@
+"""Read and write content bundles, a compact format for copying CMS content between sites.
+
+A bundle is a sequence of length-prefixed frames: a one-byte type, a four-byte
+big-endian payload length, then the payload.
+
+    H  header: JSON {"format", "models"}
+    M  start of a model: JSON {"model", "fields", "files"}
+    K  zlib-compressed JSON list of every primary key of the model
+    R  zlib-compressed JSON list of rows, each a list of field values in "fields" order.
+       File field values are [name, sha256] pairs, the digest null when the file is missing.
+    B  a media file: its 32-byte SHA-256 then its content, written once per distinct
+       content before the rows that refer to it
+    E  end: JSON {"rows", "blobs"}, so a truncated bundle is detected
+
+Rows are written per model in dependency order, from querysets read with
+iterator(chunk_size=...), so neither side holds a whole table in memory.
+Media files are copied in and out of B frames CHUNK_SIZE bytes at a time.
+"""
+import hashlib
+import json
+import struct
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+MAGIC = b'CMSBUNDLE'
+FORMAT = 1
+FRAME_HEADER = struct.Struct('>cI')
+COMPRESSION_LEVEL = 6
+CHUNK_SIZE = 1 << 20
+
+
+class BundleError(ValueError):
+    pass
+
+
+def bundle_fields(model):
+    """Concrete fields a bundle carries for model. Timestamps set automatically stay per site."""
+    return [
+        field for field in model._meta.concrete_fields
+        if not getattr(field, 'auto_now', False) and not getattr(field, 'auto_now_add', False)
+    ]
+
+
+class BundleWriter:
+    def __init__(self, file):
+        self.file = file
+        self.rows = 0
+        self.blobs = 0
+        self.digests = set()
+        self.file.write(MAGIC)
+
+    def frame(self, kind, payload):
+        self.file.write(FRAME_HEADER.pack(kind, len(payload)))
+        self.file.write(payload)
+
+    def json_frame(self, kind, data):
+        self.frame(kind, json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':')).encode())
+
+    def compressed_frame(self, kind, data):
+        payload = json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':')).encode()
+        self.frame(kind, zlib.compress(payload, COMPRESSION_LEVEL))
+
+    def header(self, models):
+        self.json_frame(b'H', {'format': FORMAT, 'models': [model._meta.label for model in models]})
+
+    def start_model(self, model, fields, files, pks):
+        self.json_frame(b'M', {'model': model._meta.label, 'fields': fields, 'files': files})
+        self.compressed_frame(b'K', pks)
+
+    def write_rows(self, rows):
+        self.compressed_frame(b'R', rows)
+        self.rows += len(rows)
+
+    def write_blob(self, digest, file, size):
+        """Copy size bytes of a media file from file, in chunks, unless one with the same content was written already."""
+        if digest in self.digests:
+            return
+        self.digests.add(digest)
+        self.file.write(FRAME_HEADER.pack(b'B', 32 + size))
+        self.file.write(bytes.fromhex(digest))
+        copied = 0
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b''):
+            copied += len(chunk)
+            self.file.write(chunk)
+        if copied != size:
+            raise BundleError('Media file changed while it was written.')
+        self.blobs += 1
+
+    def close(self):
+        self.json_frame(b'E', {'rows': self.rows, 'blobs': self.blobs})
+
+
+def read_exact(file, size):
+    data = file.read(size)
+    if len(data) != size:
+        raise BundleError('Bundle is truncated.')
+    return data
+
+
+def read_chunks(file, size):
+    """Yield the next size bytes of file in pieces of at most CHUNK_SIZE."""
+    while size:
+        chunk = read_exact(file, min(size, CHUNK_SIZE))
+        size -= len(chunk)
+        yield chunk
+
+
+def read_frames(file):
+    """Yield (kind, payload) for each frame of a bundle, checking its framing and end frame.
+
+    A media file's payload is (sha256, chunks): its content is read from the
+    bundle, a chunk at a time, only as chunks is iterated.
+    """
+    if file.read(len(MAGIC)) != MAGIC:
+        raise BundleError('Not a content bundle.')
+    counts = {'rows': 0, 'blobs': 0}
+    while True:
+        kind, size = FRAME_HEADER.unpack(read_exact(file, FRAME_HEADER.size))
+        if kind == b'B':
+            if size < 32:
+                raise BundleError('Bundle is corrupt.')
+            digest = read_exact(file, 32).hex()
+            chunks = read_chunks(file, size - 32)
+            counts['blobs'] += 1
+            yield kind, (digest, chunks)
+            # Skip whatever part of the file the caller did not read.
+            for _chunk in chunks:
+                pass
+            continue
+        payload = read_exact(file, size)
+        if kind == b'E':
+            if json.loads(payload) != counts:
+                raise BundleError('Bundle is incomplete.')
+            return
+        if kind in (b'K', b'R'):
+            payload = json.loads(zlib.decompress(payload))
+            if kind == b'R':
+                counts['rows'] += len(payload)
+        elif kind in (b'H', b'M'):
+            payload = json.loads(payload)
+            if kind == b'H' and payload['format'] != FORMAT:
+                raise BundleError(f"Unsupported bundle format {payload['format']}.")
+        else:
+            raise BundleError(f'Unknown frame type {kind!r}.')
+        yield kind, payload
+
+
+def file_sha256(storage, name):
+    """Return the SHA-256 of a stored file, or None if it does not exist."""
+    if not name or not storage.exists(name):
+        return None
+    digest = hashlib.sha256()
+    with storage.open(name, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
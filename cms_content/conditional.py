@@ -0,0 +1,128 @@
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.db.models import Max, OuterRef, Subquery
+from django.views.decorators.http import condition
+
+from .models import Blog, CaseStudy, Product, ProductImage, ProductSection, ProductSectionItem, Service, WhitePaper
+from .versioning import get_content_version
+
+# Last-modified times read at one content version, keyed by (function, arguments).
+# Every content write bumps the version, which empties it.
+_memo_version = None
+_memo = {}
+
+
+def latest(*timestamps):
+    timestamps = [timestamp for timestamp in timestamps if timestamp is not None]
+    return max(timestamps) if timestamps else None
+
+
+def menu_last_modified():
+    # base.html lists every product in the navigation menu.
+    return Product.objects.aggregate(latest=Max('updated_at'))['latest']
+
+
+def newest(queryset):
+    """Subquery for the latest updated_at among queryset's rows."""
+    return Subquery(queryset.order_by('-updated_at').values('updated_at')[:1])
+
+
+def product_last_modified(url_slug):
+    # One subquery per table: joining images, sections and items together
+    # would multiply their rows.
+    dates = Product.objects.filter(url_slug=url_slug).annotate(
+        images_updated=newest(ProductImage.objects.filter(product=OuterRef('pk'))),
+        sections_updated=newest(ProductSection.objects.filter(product=OuterRef('pk'))),
+        items_updated=newest(ProductSectionItem.objects.filter(section__product=OuterRef('pk'))),
+    ).values('updated_at', 'images_updated', 'sections_updated', 'items_updated').first()
+    if dates is None:
+        return None
+    return latest(menu_last_modified(), *dates.values())
+
+
+def service_last_modified(url_slug):
+    modified = Service.objects.filter(url_slug=url_slug).aggregate(latest=Max('updated_at'))['latest']
+    if modified is None:
+        return None
+    return latest(menu_last_modified(), modified)
+
+
+def blog_last_modified(slug):
+    modified = Blog.objects.filter(url_slug=slug).aggregate(latest=Max('updated_at'))['latest']
+    if modified is None:
+        return None
+    return latest(menu_last_modified(), modified)
+
+
+def case_studies_last_modified():
+    return latest(menu_last_modified(), CaseStudy.objects.aggregate(latest=Max('updated_at'))['latest'])
+
+
+def white_papers_last_modified():
+    return latest(menu_last_modified(), WhitePaper.objects.aggregate(latest=Max('updated_at'))['latest'])
+
+
+def memoised_last_modified(func, *args, **kwargs):
+    """Return func(*args, **kwargs), computed once per content version.
+
+    Pages that do not exist are not remembered, so made-up URLs cannot grow the memo.
+    """
+    global _memo_version, _memo
+    version = get_content_version()
+    if version != _memo_version:
+        _memo_version, _memo = version, {}
+    key = (func, args, tuple(sorted(kwargs.items())))
+    memo = _memo
+    if key not in memo:
+        modified = func(*args, **kwargs)
+        if modified is None:
+            return None
+        memo[key] = modified
+    return memo[key]
+
+
+def clear_last_modified():
+    """Forget every memoised last-modified time in this process."""
+    global _memo_version, _memo
+    _memo_version, _memo = None, {}
+
+
+def content_condition(last_modified_func):
+    """Answer conditional GETs for a page from the updated_at of its rows.
+
+    Last-Modified is the newest updated_at of every row the page renders.
+    Deleting a row does not move that timestamp, so the ETag also carries
+    the content version, which every save and delete bumps. Both are
+    memoised per content version, so revalidating a cached page costs no
+    queries.
+
+    condition() calls these functions synchronously even around an async
+    view, so for those they are run in a thread first and their results
+    kept on the request.
+    """
+    def last_modified(request, *args, **kwargs):
+        if not hasattr(request, '_content_last_modified'):
+            request._content_last_modified = memoised_last_modified(last_modified_func, *args, **kwargs)
+        return request._content_last_modified
+
+    def etag(request, *args, **kwargs):
+        if not hasattr(request, '_content_etag'):
+            modified = last_modified(request, *args, **kwargs)
+            request._content_etag = None if modified is None else f'{get_content_version()}-{int(modified.timestamp())}'
+        return request._content_etag
+
+    conditional = condition(etag_func=etag, last_modified_func=last_modified)
+
+    def decorator(view):
+        conditional_view = conditional(view)
+        if not iscoroutinefunction(view):
+            return conditional_view
+
+        @wraps(view)
+        async def inner(request, *args, **kwargs):
+            await sync_to_async(etag)(request, *args, **kwargs)
+            return await conditional_view(request, *args, **kwargs)
+        return inner
+
+    return decorator
@@ -0,0 +1,408 @@
+"""Extract CMS records from the original static site's HTML templates.
+
+Each template is parsed on its own into a list of {"model", "fields"}
+records, so files can be parsed in worker processes. This module does not
+import Django. ExportWriter merges the per-file results into an export for
+populate_cms_data.
+"""
+import importlib.util
+import json
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+STATIC_TAG_RE = re.compile(r"{% static '([^']+)' %}")
+STATIC_URL_RE = re.compile(r"url\({% static '([^']+)' %}\)")
+CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+# Sections of extracted_content.json, in the order populate_cms_data loads them.
+SECTIONS = {
+    'cms_content.PageContent': 'page_contents',
+    'cms_content.Product': 'products',
+    'cms_content.Service': 'services',
+    'cms_content.Feature': 'features',
+    'cms_content.TimelineEvent': 'timeline_events',
+    'cms_content.Capability': 'capabilities',
+    'cms_content.CallToAction': 'call_to_actions',
+    'cms_content.ProductSection': 'products',
+    'cms_content.ProductImage': 'products',
+    'cms_content.ProductSectionItem': 'products',
+}
+
+
+def default_parser():
+    """lxml's parser when it is installed, else the slower pure Python one."""
+    return 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+
+def clean_text(text):
+    """Drop control characters that cannot appear in JSON strings, keeping tabs and newlines."""
+    return CONTROL_CHARS_RE.sub('', text) if text else ''
+
+
+def tag_text(tag):
+    return clean_text(tag.get_text(strip=True)) if tag else ''
+
+
+def static_path(src):
+    """Turn a {% static %} tag or /static/ URL into a static file path."""
+    return clean_text(STATIC_TAG_RE.sub(r'\1', src or '').replace('/static/', ''))
+
+
+def style_image(style):
+    match = STATIC_URL_RE.search(style or '')
+    return clean_text(match.group(1)) if match else ''
+
+
+def product_slug(name):
+    return clean_text(name.lower().replace(' ', '-').replace('(', '').replace(')', '').replace(':', ''))
+
+
+def record(model, fields):
+    return {'model': f'cms_content.{model}', 'fields': fields}
+
+
+def extract_index(soup):
+    """Products listed in the home page's portfolio slider."""
+    records = []
+    slider = soup.find('div', class_='portfolio-slider-5')
+    if not slider:
+        return records
+    for block in slider.find_all('div', class_='col pl-5 pr-5'):
+        title = block.find('h4', class_='title')
+        category = block.find('span', class_='category')
+        link = block.find('a', class_='portfolio-image')
+        name = tag_text(title.find('a') if title else None)
+        short_description = tag_text(category.find('a') if category else None)
+        hero_image = style_image(link.get('style')) if link else ''
+        if name and short_description and hero_image and link.get('href'):
+            records.append(record('Product', {
+                'name': name,
+                'short_description': short_description,
+                'hero_image': hero_image,
+                'hero_image_alt_text': name,
+                'main_description': '',
+                'conclusion_text': '',
+                'url_slug': product_slug(name),
+                'order': len(records),
+            }))
+    return records
+
+
+def section_items(heading):
+    """Yield the <li>s of the list, or the paragraphs, following a section heading."""
+    element = heading.next_sibling
+    while element:
+        if element.name == 'ul':
+            yield from element.find_all('li')
+            return
+        if element.name == 'p':
+            yield element
+        element = element.next_sibling
+        if element and element.name == 'h3' and 'mt-4' in element.get('class', []):
+            return
+
+
+def extract_product_page(soup):
+    """A product's descriptions, carousel images, and sections from its detail page."""
+    title = soup.find('div', class_='product-hero-title')
+    name = tag_text(title.find('h1') if title else None)
+    if not name:
+        return []
+    slug = product_slug(name)
+    product = {'name': name, 'hero_image_alt_text': name, 'url_slug': slug}
+    records = [record('Product', product)]
+
+    content = soup.find('div', class_='col-lg-5 col-12')
+    paragraphs = content.find_all('p') if content else []
+    if paragraphs:
+        product['main_description'] = tag_text(paragraphs[0])
+        if len(paragraphs) > 1:
+            product['conclusion_text'] = tag_text(paragraphs[-1])
+
+    carousel = soup.find('div', class_='carousel-inner')
+    for order, img in enumerate(carousel.find_all('img') if carousel else []):
+        records.append(record('ProductImage', {
+            'product': slug,
+            'image': static_path(img.get('src')),
+            'alt_text': clean_text(img.get('alt', '')),
+            'order': order,
+        }))
+
+    for section_order, heading in enumerate(content.find_all('h3', class_='mt-4') if content else []):
+        section_title = tag_text(heading)
+        records.append(record('ProductSection', {'product': slug, 'title': section_title, 'order': section_order}))
+        for item_order, item in enumerate(section_items(heading)):
+            # Items keep their inline HTML.
+            records.append(record('ProductSectionItem', {
+                'product': slug,
+                'section': section_title,
+                'text': clean_text(str(item)),
+                'order': item_order,
+            }))
+    return records
+
+
+def extract_about(soup):
+    """The about page's sections, capabilities, features, timeline and call to action."""
+    records = []
+
+    hero = soup.find('div', class_='section-wrap', style=re.compile(r'images/about/banner.png'))
+    if hero:
+        records.append(record('PageContent', {
+            'page_name': 'about',
+            'section_identifier': 'hero_section',
+            'title': tag_text(hero.find('h2', class_='block-title')),
+            'subtitle': tag_text(hero.find('p', class_='lead')),
+            'body_text': '',
+            'background_image': style_image(hero.get('style')),
+            'background_image_alt_text': 'About Page Banner',
+            'order': 0,
+        }))
+
+    what_we_do = soup.find('div', class_='section-wrap bg-light-grey')
+    for order, card in enumerate(what_we_do.find_all('div', class_='card') if what_we_do else []):
+        image = card.find('div', style=re.compile(r'background-image'))
+        records.append(record('Capability', {
+            'title': tag_text(card.find('h5')),
+            'description': tag_text(card.find('p')),
+            'image': style_image(image.get('style')) if image else '',
+            'image_alt_text': tag_text(card.find('h5')),
+            'order': order,
+        }))
+
+    mission_vision = soup.find('div', class_='section-wrap', style=re.compile(r'images/bg/service-bg.png'))
+    columns = mission_vision.find_all('div', class_='col-lg-6') if mission_vision else []
+    sections = [(1, 'mission_section', 'Mission Background'), (2, 'vision_section', 'Vision Background')]
+    for (order, identifier, alt_text), column in zip(sections, columns):
+        records.append(record('PageContent', {
+            'page_name': 'about',
+            'section_identifier': identifier,
+            'title': tag_text(column.find('h3')),
+            'body_text': tag_text(column.find('p')),
+            'background_image': 'images/bg/service-bg.png',
+            'background_image_alt_text': alt_text,
+            'order': order,
+        }))
+
+    why = soup.find('div', class_='section-wrap bg-grey pt-80 pb-80')
+    if why:
+        records.append(record('PageContent', {
+            'page_name': 'about',
+            'section_identifier': 'why_choose_section',
+            'title': tag_text(why.find('h3', class_='block-title')),
+            'order': 3,
+        }))
+        for order, box in enumerate(why.find_all('div', class_='feature-box')):
+            icon = box.find('i')
+            records.append(record('Feature', {
+                'title': tag_text(box.find('h5')),
+                'description': tag_text(box.find('p')),
+                'icon_class': clean_text(' '.join(icon.get('class', []))) if icon else '',
+                'order': order,
+            }))
+
+    journey = soup.find('div', class_='section-wrap section pt-80 pb-80', style=False, recursive=False)
+    if journey:
+        records.append(record('PageContent', {
+            'page_name': 'about',
+            'section_identifier': 'journey_section',
+            'title': tag_text(journey.find('h3', class_='block-title')),
+            'order': 4,
+        }))
+        for order, column in enumerate(journey.find_all('div', class_='col-md-3')):
+            year = tag_text(column.find('strong'))
+            records.append(record('TimelineEvent', {
+                'year': int(year) if year else 0,
+                'description': tag_text(column.find('p', class_='small')),
+                'order': order,
+            }))
+
+    cta = soup.find('div', class_='section-wrap section bg-dark text-white pt-100 pb-100')
+    if cta:
+        records.append(record('PageContent', {
+            'page_name': 'about',
+            'section_identifier': 'cta_section',
+            'title': tag_text(cta.find('h3', class_='block-title')),
+            'body_text': tag_text(cta.find('p', class_='text-white')),
+            'order': 5,
+        }))
+        for order, button in enumerate(cta.find_all('a', class_=re.compile(r'btn'))):
+            records.append(record('CallToAction', {
+                'page_content': 'about_cta_section',
+                'button_text': tag_text(button),
+                'button_url': clean_text(button.get('href', '')),
+                'order': order,
+            }))
+    return records
+
+
+def extract_service(soup):
+    """The services page's hero and service cards."""
+    records = []
+    hero = soup.find('div', class_='col-12 col-lg-8 text-center mb-80')
+    if hero:
+        records.append(record('PageContent', {
+            'page_name': 'service',
+            'section_identifier': 'hero_section',
+            'title': tag_text(hero.find('h2', class_='block-title')),
+            'subtitle': tag_text(hero.find('p', class_='lead')),
+            'order': 0,
+        }))
+
+    for order, card in enumerate(soup.find_all('a', class_='service-card')):
+        image = card.find('img')
+        records.append(record('Service', {
+            'name': tag_text(card.find('h4')),
+            'short_description': tag_text(card.find('p', class_='text-muted')),
+            'image': static_path(image.get('src', '')) if image else '',
+            'image_alt_text': clean_text(image.get('alt', '')) if image else '',
+            'url_slug': clean_text(card.get('href', '').strip('/').replace('service-', '')),
+            'order': order,
+        }))
+    return records
+
+
+# Template name patterns and their extractors, in the order their records are written.
+EXTRACTORS = (
+    (re.compile(r'index\.html'), extract_index),
+    (re.compile(r'product(\d+)\.html'), extract_product_page),
+    (re.compile(r'about\.html'), extract_about),
+    (re.compile(r'service\.html'), extract_service),
+)
+
+
+def source_files(directory):
+    """Return the templates under directory that have an extractor, in extraction order."""
+    found = []
+    for path in Path(directory).rglob('*.html'):
+        for rank, (pattern, _extractor) in enumerate(EXTRACTORS):
+            match = pattern.fullmatch(path.name)
+            if match:
+                number = int(match.group(1)) if match.groups() else 0
+                found.append(((rank, number, str(path)), path))
+    return [path for _sort_key, path in sorted(found)]
+
+
+def extract_file(path, parser='html.parser'):
+    """Parse one template and return its records."""
+    path = Path(path)
+    for pattern, extractor in EXTRACTORS:
+        if pattern.fullmatch(path.name):
+            return extractor(BeautifulSoup(path.read_text(encoding='utf-8'), parser))
+    return []
+
+
+def manifest_path(output):
+    """The manifest kept next to an export: extracted_content.json -> extracted_content.manifest.json."""
+    return Path(output).with_suffix('.manifest.json')
+
+
+def load_manifest(path):
+    """Return {template name: {"sha256", "parser", "records"}} from an earlier run, or {}."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(path, manifest):
+    # Written to a temporary file and renamed, so an interrupted run leaves the old manifest.
+    path = Path(path)
+    fd, temp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+class ExportWriter:
+    """Write extracted records to a JSON Lines file as they arrive, or to sectioned JSON.
+
+    Records for one product come from the home page and from its detail
+    page. Each Product record is merged into the fields seen so far for its
+    slug, so every product is written once and complete, and carousel images
+    that repeat the hero image are dropped. In JSON Lines the products come
+    first, ahead of the records that refer to them; the rest are streamed to
+    a scratch file meanwhile. A .json output is the sectioned
+    extracted_content.json format and is written on close().
+
+    The export is written to a temporary file renamed over the output on
+    close(), so a failed or interrupted run leaves the previous export.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lines = self.path.suffix == '.jsonl'
+        self.body = tempfile.TemporaryFile('w+', encoding='utf-8') if self.lines else None
+        self.products = {}
+        self.sections = {section: [] for section in dict.fromkeys(SECTIONS.values())}
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self.body is not None:
+            self.body.close()
+
+    def merge_product(self, fields):
+        product = self.products.get(fields['url_slug'])
+        if product is None:
+            # A copy, so the caller's records (kept in the manifest) stay as extracted.
+            product = self.products[fields['url_slug']] = {'order': len(self.products), **fields}
+        else:
+            product.update({name: value for name, value in fields.items() if value not in ('', None)})
+        return product
+
+    def write(self, records):
+        for entry in records:
+            fields = entry['fields']
+            if entry['model'] == 'cms_content.Product':
+                known = fields['url_slug'] in self.products
+                fields = self.merge_product(fields)
+                if known:
+                    # Merged into the record already buffered.
+                    continue
+                entry = {'model': entry['model'], 'fields': fields}
+                if self.lines:
+                    self.count += 1
+                    continue
+            elif entry['model'] == 'cms_content.ProductImage':
+                product = self.products.get(fields['product'], {})
+                if fields['image'] == product.get('hero_image'):
+                    continue
+            self.count += 1
+            if self.lines:
+                self.body.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            else:
+                self.sections[SECTIONS[entry['model']]].append(entry)
+
+    def close(self):
+        fd, temp = tempfile.mkstemp(dir=self.path.parent, prefix=f'.{self.path.name}.')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                if self.lines:
+                    for fields in self.products.values():
+                        f.write(json.dumps({'model': 'cms_content.Product', 'fields': fields}, ensure_ascii=False) + '\n')
+                    self.body.seek(0)
+                    shutil.copyfileobj(self.body, f)
+                else:
+                    json.dump(self.sections, f, indent=2, ensure_ascii=False)
+            os.replace(temp, self.path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+        finally:
+            if self.body is not None:
+                self.body.close()
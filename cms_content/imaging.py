@@ -0,0 +1,126 @@
+"""Pillow helpers for re-encoding images.
+
+Nothing here touches Django models, so the functions can run in worker
+processes started by a ProcessPoolExecutor.
+"""
+import functools
+import io
+import os
+
+from PIL import ExifTags, Image, ImageOps, features
+
+# Best compression first; <picture> offers sources to the browser in this order.
+MIME_TYPES = {
+    'avif': 'image/avif',
+    'webp': 'image/webp',
+}
+
+# Formats for clients that accept none of the above.
+FALLBACK_MIME_TYPES = {
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+}
+
+
+@functools.cache
+def supported_formats():
+    """Return the rendition formats this Pillow build can encode."""
+    return tuple(image_format for image_format in MIME_TYPES if features.check(image_format))
+
+
+def open_image(source):
+    """Open a path or bytes as an upright RGB or RGBA image."""
+    with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as image:
+        image = ImageOps.exif_transpose(image)
+        return image.convert('RGBA' if image.has_transparency_data else 'RGB')
+
+
+def encode(image, image_format, quality):
+    # Nothing is copied over from the source, which drops EXIF and ICC data.
+    return encode_options(image, image_format.upper(), quality=quality)
+
+
+def resize_to_width(image, width):
+    if width >= image.width:
+        return image
+    height = max(1, round(image.height * width / image.width))
+    return image.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def render_renditions(source, widths, formats, quality):
+    """Encode an image at each width in each format.
+
+    Returns (format, width, height, data) tuples. Widths past the source's
+    own width collapse into a single rendition at that width, so images are
+    never upscaled.
+    """
+    image = open_image(source)
+    renditions = []
+    for width in sorted({min(width, image.width) for width in widths}):
+        resized = resize_to_width(image, width)
+        for image_format in formats:
+            renditions.append((image_format, resized.width, resized.height, encode(resized, image_format, quality)))
+    return renditions
+
+
+def render_thumbnail(source, width, height, image_format, quality):
+    """Encode an image scaled down to fit within width x height."""
+    image = open_image(source)
+    image.thumbnail((width, height), Image.Resampling.LANCZOS)
+    if image_format == 'jpeg':
+        image = image.convert('RGB')
+    return encode(image, image_format, quality)
+
+
+def webp_sibling(name):
+    """Name of the WebP copy written next to an optimised static image."""
+    return f'{name}.webp'
+
+
+def optimize_static_image(path, quality):
+    """Recompress a PNG or JPEG in place and write a WebP copy beside it.
+
+    PNGs are recompressed losslessly. JPEGs keep their quantisation tables
+    unless EXIF orientation has to be baked in. EXIF and other metadata are
+    dropped; colour profiles are kept. Either file is only written if it is
+    smaller than the original. Returns the WebP path, or None if it would
+    not be smaller.
+    """
+    original_size = os.path.getsize(path)
+    with Image.open(path) as image:
+        image.load()
+        icc_profile = image.info.get('icc_profile')
+        rotated = image.getexif().get(ExifTags.Base.Orientation, 1) != 1
+        upright = ImageOps.exif_transpose(image) if rotated else image
+        if image.format == 'PNG':
+            data = encode_options(upright, 'PNG', optimize=True, icc_profile=icc_profile)
+        elif image.format == 'JPEG' and not rotated:
+            data = encode_options(
+                image, 'JPEG', quality='keep', optimize=True, progressive=True, icc_profile=icc_profile,
+            )
+        else:
+            data = encode_options(
+                upright.convert('RGB'), 'JPEG', quality=min(quality + 15, 95),
+                optimize=True, progressive=True, icc_profile=icc_profile,
+            )
+        webp = encode_options(
+            upright.convert('RGBA' if upright.has_transparency_data else 'RGB'), 'WEBP',
+            quality=quality, method=6, icc_profile=icc_profile,
+        )
+    if len(data) < original_size or rotated:
+        write_file(path, data)
+    if len(webp) >= min(len(data), original_size):
+        return None
+    write_file(webp_sibling(path), webp)
+    return webp_sibling(path)
+
+
+def encode_options(image, image_format, **options):
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **{key: value for key, value in options.items() if value is not None})
+    return buffer.getvalue()
+
+
+def write_file(path, data):
+    with open(path, 'wb') as image_file:
+        image_file.write(data)
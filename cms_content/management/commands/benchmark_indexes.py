@@ -0,0 +1,158 @@
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from cms_content.models import (
+    Blog,
+    CallToAction,
+    PageContent,
+    Product,
+    ProductImage,
+    ProductSection,
+    ProductSectionItem,
+    Service,
+)
+
+# Children per parent in the generated content: images and sections per
+# product, items per section, sections per page and buttons per section.
+FAN_OUT = 10
+INSERT_BATCH_SIZE = 5000
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ('Times the queries behind the public pages, with and without the ordering indexes, '
+            'on generated content. Nothing is kept: every run is rolled back.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000],
+                            help='Rows to generate in each benchmarked table, one run per value (default: 10000 100000).')
+        parser.add_argument('--repeat', type=int, default=20,
+                            help='Times each query is run; the median is reported (default: 20).')
+        parser.add_argument('--plans', action='store_true', help='Print each query plan.')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        for rows in options['rows']:
+            try:
+                with transaction.atomic():
+                    self.benchmark(rows, options)
+                    raise Rollback
+            except Rollback:
+                pass
+
+    def benchmark(self, rows, options):
+        self.stdout.write(self.style.MIGRATE_HEADING(f'{rows} rows per table ({connection.vendor})'))
+        start = time.perf_counter()
+        queries = self.generate(rows, random.Random(options['seed']))
+        self.analyze()
+        self.stdout.write(f'Generated in {time.perf_counter() - start:.1f}s.')
+
+        indexed = {label: self.measure(queryset, options['repeat']) for label, queryset in queries}
+        self.drop_indexes()
+        plain = {label: self.measure(queryset, options['repeat']) for label, queryset in queries}
+
+        width = max(len(label) for label, _ in queries)
+        self.stdout.write(f'{"query":<{width}}  {"indexed":>10}  {"no index":>10}')
+        for label, _ in queries:
+            self.stdout.write(
+                f'{label:<{width}}  {indexed[label][0]:>8.2f}ms  {plain[label][0]:>8.2f}ms'
+            )
+            if options['plans']:
+                for heading, plan in (('indexed', indexed[label][1]), ('no index', plain[label][1])):
+                    self.stdout.write(f'  {heading}:')
+                    for line in plan.splitlines():
+                        self.stdout.write(f'    {line}')
+
+    def generate(self, rows, rng):
+        """Insert rows into every benchmarked table; return (label, queryset) pairs to time."""
+        def insert(model, objects):
+            return model.objects.bulk_create(objects, batch_size=INSERT_BATCH_SIZE)
+
+        products = insert(Product, (
+            Product(name=f'bench-product-{i}', short_description='Benchmark', hero_image='bench.jpg',
+                    hero_image_alt_text='Benchmark', main_description='Benchmark', url_slug=f'bench-product-{i}',
+                    order=rng.randrange(rows))
+            for i in range(rows)
+        ))
+        insert(ProductImage, (
+            ProductImage(product=products[i // FAN_OUT], image='bench.jpg', alt_text='Benchmark',
+                         order=rng.randrange(rows))
+            for i in range(rows)
+        ))
+        sections = insert(ProductSection, (
+            ProductSection(product=products[i // FAN_OUT], title='Benchmark', order=rng.randrange(rows))
+            for i in range(rows)
+        ))
+        insert(ProductSectionItem, (
+            ProductSectionItem(section=sections[i // FAN_OUT], text='Benchmark', order=rng.randrange(rows))
+            for i in range(rows)
+        ))
+        contents = insert(PageContent, (
+            PageContent(page_name=f'bench-{i // FAN_OUT}', section_identifier=f'section-{i % FAN_OUT}',
+                        order=rng.randrange(rows))
+            for i in range(rows)
+        ))
+        insert(CallToAction, (
+            CallToAction(page_content=contents[i // FAN_OUT], button_text='Benchmark',
+                         button_url='https://example.com/', order=rng.randrange(rows))
+            for i in range(rows)
+        ))
+        insert(Service, (
+            Service(name=f'bench-service-{i}', short_description='Benchmark', image='bench.jpg',
+                    image_alt_text='Benchmark', url_slug=f'bench-service-{i}', order=rng.randrange(rows))
+            for i in range(rows)
+        ))
+        insert(Blog, (
+            Blog(title='Benchmark', author='Benchmark', publish_date=date(2000, 1, 1) + timedelta(days=rng.randrange(9000)),
+                 image='bench.jpg', image_alt_text='Benchmark', content='Benchmark', url_slug=f'bench-blog-{i}',
+                 order=rng.randrange(rows))
+            for i in range(rows)
+        ))
+
+        # A product, and a page, whose children all have children of their own.
+        target = (rows - 1) // FAN_OUT ** 2
+        product = products[target]
+        section_ids = [section.pk for section in sections[target * FAN_OUT:(target + 1) * FAN_OUT]]
+        content_ids = [content.pk for content in contents[target * FAN_OUT:(target + 1) * FAN_OUT]]
+        # The same queries the views and the content snapshot make.
+        return [
+            ('home page products', Product.objects.order_by('order')[:20]),
+            ('product images', ProductImage.objects.filter(product=product).order_by('order')),
+            ('product sections', ProductSection.objects.filter(product=product).order_by('order')),
+            ('section items', ProductSectionItem.objects.filter(section__in=section_ids).order_by('order')),
+            ('page sections', PageContent.objects.filter(page_name=f'bench-{target}')),
+            ('page buttons', CallToAction.objects.filter(page_content__in=content_ids).order_by('order')),
+            ('service cards', Service.objects.order_by('order')[:20]),
+            ('blog posts', Blog.objects.all()[:20]),
+        ]
+
+    def analyze(self):
+        """Refresh the planner's statistics for the new rows."""
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def drop_indexes(self):
+        """Drop the ordering indexes until the surrounding transaction is rolled back."""
+        with connection.cursor() as cursor:
+            for model in (Product, ProductImage, ProductSection, ProductSectionItem,
+                          PageContent, CallToAction, Service, Blog):
+                for index in model._meta.indexes:
+                    cursor.execute(f'DROP INDEX {connection.ops.quote_name(index.name)}')
+        self.analyze()
+
+    def measure(self, queryset, repeat):
+        """Return the median time in milliseconds to fetch queryset, and its plan."""
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            list(queryset.all())
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings), queryset.explain()
@@ -0,0 +1,29 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from cms_content.sanitize import ExportError, sanitize_file
+
+
+class Command(BaseCommand):
+    help = ('Strips invalid control characters from a JSON or JSON Lines content export, '
+            'in constant memory, and checks its structure.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default=os.path.join(settings.BASE_DIR, 'extracted_content.json'),
+                            help='Export to clean (default: extracted_content.json).')
+        parser.add_argument('--output', default=None, help='Write the cleaned export here instead of in place.')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        try:
+            stats = sanitize_file(path, options['output'])
+        except FileNotFoundError:
+            raise CommandError(f'Export not found: {path}')
+        except ExportError as error:
+            raise CommandError(f'{path} is not valid JSON: {error}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Cleaned {options["output"] or path}: {stats.characters} characters read, '
+            f'{stats.dropped} control characters dropped, {stats.escaped} escaped.'
+        ))
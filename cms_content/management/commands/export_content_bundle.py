@@ -0,0 +1,72 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.core.serializers import sort_dependencies
+from django.db import models
+
+from cms_content.bundle import BundleWriter, bundle_fields, file_sha256
+from cms_content.models import ContentVersion, ImageRendition, SearchDocument
+
+# Rebuilt on the importing site rather than copied.
+DERIVED_MODELS = (ContentVersion, SearchDocument, ImageRendition)
+
+
+def bundle_models():
+    """cms_content models a bundle carries, parents before the models that refer to them."""
+    app_config = apps.get_app_config('cms_content')
+    return [model for model in sort_dependencies([(app_config, None)]) if model not in DERIVED_MODELS]
+
+
+class Command(BaseCommand):
+    help = 'Writes all CMS content, and the media files it uses, to a compact content bundle.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Bundle file to write.')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows per query chunk and frame (default: 2000).')
+        parser.add_argument('--no-media', action='store_true', help='Leave media files out of the bundle.')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        self.digests = {}
+        with open(options['path'], 'wb') as f:
+            writer = BundleWriter(f)
+            writer.header(bundle_models())
+            for model in bundle_models():
+                fields = bundle_fields(model)
+                names = [field.attname for field in fields]
+                files = {index: field for index, field in enumerate(fields) if isinstance(field, models.FileField)}
+                queryset = model.objects.order_by('pk')
+                writer.start_model(model, names, [names[index] for index in files],
+                                   list(queryset.values_list('pk', flat=True).iterator(chunk_size=chunk_size)))
+                rows = []
+                for row in queryset.values_list(*names).iterator(chunk_size=chunk_size):
+                    row = list(row)
+                    for index, field in files.items():
+                        digest = None if options['no_media'] else self.write_media(writer, field.storage, row[index])
+                        row[index] = [row[index], digest]
+                    rows.append(row)
+                    if len(rows) == chunk_size:
+                        writer.write_rows(rows)
+                        rows = []
+                if rows:
+                    writer.write_rows(rows)
+            writer.close()
+            size = f.tell()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {writer.rows} rows and {writer.blobs} media files ({size} bytes) to {options['path']}."
+        ))
+
+    def write_media(self, writer, storage, name):
+        """Write a stored file to the bundle once and return its SHA-256, or None if it is missing."""
+        if not name:
+            return None
+        if name not in self.digests:
+            self.digests[name] = file_sha256(storage, name)
+            if self.digests[name]:
+                # Hashed and copied in chunks, so large files are never held in memory.
+                with storage.open(name, 'rb') as f:
+                    writer.write_blob(self.digests[name], f, storage.size(name))
+            else:
+                self.stderr.write(self.style.WARNING(f'Media file not found: {name}'))
+                self.digests[name] = None
+        return self.digests[name]
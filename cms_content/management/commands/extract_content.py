@@ -0,0 +1,81 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.core.management.base import BaseCommand, CommandError
+
+from cms_content.bundle import file_sha256
+from cms_content.extraction import (
+    ExportWriter,
+    default_parser,
+    extract_file,
+    load_manifest,
+    manifest_path,
+    save_manifest,
+    source_files,
+)
+
+
+class Command(BaseCommand):
+    help = ('Extracts products, services and page content from the static site templates '
+            'into an export for populate_cms_data.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('template_dir', help='Directory holding index.html, productN.html, about.html and service.html.')
+        parser.add_argument('--output', default=os.path.join(settings.BASE_DIR, 'extracted_content.json'),
+                            help='Export to write (default: extracted_content.json). A .jsonl path is written '
+                                 'as JSON Lines, record by record.')
+        parser.add_argument('--workers', type=int, default=None,
+                            help='Number of worker processes (default: one per CPU; 0 parses in this process).')
+        parser.add_argument('--parser', default=None,
+                            help='BeautifulSoup parser (default: lxml when installed, else html.parser).')
+        parser.add_argument('--full', action='store_true',
+                            help='Re-parse every template instead of only those changed since the last run.')
+
+    def extract(self, paths, workers, parser):
+        """Yield each template's records, in template order, parsing them in parallel."""
+        extract = partial(extract_file, parser=parser)
+        if workers == 0 or not paths:
+            yield from map(extract, paths)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(extract, paths)
+
+    def handle(self, *args, **options):
+        template_dir = options['template_dir']
+        if not os.path.isdir(template_dir):
+            raise CommandError(f'Template directory not found: {template_dir}')
+        parser = options['parser'] or default_parser()
+        manifest_file = manifest_path(options['output'])
+        previous = {} if options['full'] else load_manifest(manifest_file)
+
+        # A template is re-parsed when its content or the parser changed.
+        manifest = {}
+        changed = []
+        templates = FileSystemStorage(template_dir)
+        for path in source_files(template_dir):
+            name = path.relative_to(template_dir).as_posix()
+            manifest[name] = {'sha256': file_sha256(templates, name), 'parser': parser}
+            entry = previous.get(name)
+            if entry and (entry['sha256'], entry['parser']) == (manifest[name]['sha256'], parser):
+                manifest[name]['records'] = entry['records']
+            else:
+                changed.append(path)
+
+        # Changed templates are parsed in manifest order, so each is written as soon as it is ready.
+        parsed = self.extract(changed, options['workers'], parser)
+        with ExportWriter(options['output']) as writer:
+            for name, entry in manifest.items():
+                if 'records' not in entry:
+                    entry['records'] = next(parsed)
+                    self.stdout.write(f'{name}: {len(entry["records"])} records')
+                writer.write(entry['records'])
+        save_manifest(manifest_file, manifest)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Extracted {writer.count} records from {len(manifest)} templates "
+            f"({len(changed)} parsed with {parser}, {len(manifest) - len(changed)} unchanged) "
+            f"into {options['output']}."
+        ))
@@ -0,0 +1,71 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from PIL import Image, UnidentifiedImageError
+
+from cms_content.imaging import render_renditions, supported_formats
+from cms_content.models import ImageRendition
+from cms_content.renditions import delete_renditions, save_renditions, source_file, source_names
+from cms_content.versioning import bump_content_version
+
+
+class Command(BaseCommand):
+    help = 'Generates resized WebP/AVIF renditions of every CMS image for responsive srcsets.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true',
+                            help='Regenerate renditions for images that already have them.')
+        parser.add_argument('--workers', type=int, default=None,
+                            help='Number of worker processes (default: one per CPU; 0 renders in this process).')
+
+    def render(self, sources, workers, *args):
+        """Yield (name, renditions) for each source, rendering them in parallel."""
+        if workers == 0:
+            for name, source in sources.items():
+                yield name, self.attempt(render_renditions, name, source, *args)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(render_renditions, source, *args): name for name, source in sources.items()}
+            for future in as_completed(futures):
+                yield futures[future], self.attempt(future.result, futures[future])
+
+    def attempt(self, func, name, *args):
+        try:
+            return func(*args)
+        except (OSError, UnidentifiedImageError, Image.DecompressionBombError) as error:
+            self.stderr.write(self.style.WARNING(f'Skipping {name}: {error}'))
+            return None
+
+    def handle(self, *args, **options):
+        formats = supported_formats()
+        widths = sorted(set(settings.IMAGE_RENDITION_WIDTHS))
+        names = source_names()
+
+        pruned = delete_renditions(ImageRendition.objects.exclude(source__in=names))
+        if not options['force']:
+            done = set(ImageRendition.objects.values_list('source', flat=True))
+            names = [name for name in names if name not in done]
+
+        sources = {}
+        for name in names:
+            source = source_file(name)
+            if source is None:
+                self.stderr.write(self.style.WARNING(f'Skipping {name}: file not found'))
+            else:
+                sources[name] = source
+
+        rendered = 0
+        for name, renditions in self.render(sources, options['workers'], widths, formats,
+                                            settings.IMAGE_RENDITION_QUALITY):
+            if renditions:
+                save_renditions(name, renditions)
+                rendered += 1
+
+        if rendered or pruned:
+            # Cached pages and each worker's rendition map are keyed on it.
+            bump_content_version()
+        self.stdout.write(self.style.SUCCESS(
+            f'Rendered {rendered} images as {", ".join(formats)} at widths {widths}; '
+            f'removed {pruned} stale renditions.'
+        ))
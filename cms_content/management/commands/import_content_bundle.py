@@ -0,0 +1,153 @@
+import hashlib
+import os
+import tempfile
+
+from django.apps import apps
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, models
+from django.db.models.functions import Cast, Concat
+
+from cms_content.bulk import BulkImport
+from cms_content.bundle import BundleError, file_sha256, read_frames
+
+
+def unique_field_sets(model):
+    """Field names of each unique constraint on model, other than the primary key."""
+    sets = [(field.name,) for field in model._meta.concrete_fields if field.unique and not field.primary_key]
+    sets += [tuple(names) for names in model._meta.unique_together]
+    sets += [constraint.fields for constraint in model._meta.total_unique_constraints]
+    return sets
+
+
+class Command(BaseCommand):
+    help = ('Loads a content bundle written by export_content_bundle, making the CMS content '
+            'and its media match the exporting site.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Bundle file to load.')
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows per bulk query (default: 500).')
+
+    def handle(self, *args, **options):
+        app_config = apps.get_app_config('cms_content')
+        self.deleted = 0
+        self.media = 0
+        self.checked = set()
+        self.staged = {}
+        models = []
+        try:
+            with open(options['path'], 'rb') as f, tempfile.TemporaryDirectory() as blob_dir:
+                with BulkImport(options['batch_size']) as bulk:
+                    for kind, payload in read_frames(f):
+                        if kind == b'M':
+                            model = self.bundle_model(app_config, payload['model'])
+                            models.append(model)
+                            fields = payload['fields']
+                            files = {fields.index(name): model._meta.get_field(name) for name in payload['files']}
+                            upserter = bulk.upserter(model, (model._meta.pk.attname,))
+                        elif kind == b'K':
+                            self.delete_missing(model, set(payload), options['batch_size'])
+                        elif kind == b'R':
+                            for row in payload:
+                                for index, field in files.items():
+                                    row[index] = self.stage_media(field.storage, blob_dir, *row[index])
+                            records = [dict(zip(fields, row)) for row in payload]
+                            self.release_unique_values(model, records)
+                            upserter.upsert(records)
+                        elif kind == b'B':
+                            self.write_blob(blob_dir, *payload)
+                    # Rows keep their primary keys, so sequences must move past them.
+                    with connection.cursor() as cursor:
+                        for sql in connection.ops.sequence_reset_sql(no_style(), models):
+                            cursor.execute(sql)
+                # Storage is not transactional: files are only replaced once the rows that use them are committed.
+                self.restore_media()
+        except FileNotFoundError:
+            raise CommandError(f"Bundle not found: {options['path']}")
+        except BundleError as error:
+            raise CommandError(f"Cannot load {options['path']}: {error}")
+
+        for line in bulk.report():
+            self.stdout.write(line)
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {len(models)} models; deleted {self.deleted} rows missing from the bundle; '
+            f'stored {self.media} media files.'
+        ))
+
+    def bundle_model(self, app_config, label):
+        app_label, _, model_name = label.partition('.')
+        if app_label != app_config.label:
+            raise BundleError(f'{label} is not a CMS model.')
+        try:
+            return app_config.get_model(model_name)
+        except LookupError:
+            raise BundleError(f'Unknown model {label}.')
+
+    def delete_missing(self, model, pks, batch_size):
+        """Delete rows the exporting site does not have, a batch at a time."""
+        stale = [pk for pk in model.objects.values_list('pk', flat=True).iterator() if pk not in pks]
+        for start in range(0, len(stale), batch_size):
+            # delete() sends post_delete, which keeps the search index and content version current.
+            self.deleted += model.objects.filter(pk__in=stale[start:start + batch_size]).delete()[1].get(
+                model._meta.label, 0)
+
+    def release_unique_values(self, model, records):
+        """Move the unique values records need off the other rows that hold them.
+
+        Rows are matched on primary key, so a slug, say, may still be held
+        by a row the bundle updates later, or in the same bulk update. Such
+        rows hold a placeholder made from their primary key until their own
+        record is written.
+        """
+        pk_name = model._meta.pk.attname
+        for names in unique_field_sets(model):
+            fields = [model._meta.get_field(name) for name in names]
+            placeholder = next((field for field in fields if isinstance(field, models.CharField)), None)
+            if placeholder is None:
+                continue
+            wanted = {}
+            for values in records:
+                key = tuple(field.to_python(values[field.attname]) for field in fields)
+                if None not in key:
+                    wanted[key] = values[pk_name]
+            holders = model.objects.filter(**{f'{fields[0].attname}__in': {key[0] for key in wanted}})
+            conflicts = [
+                pk for pk, *key in holders.values_list(pk_name, *(field.attname for field in fields))
+                if tuple(key) in wanted and wanted[tuple(key)] != pk
+            ]
+            if conflicts:
+                model.objects.filter(pk__in=conflicts).update(**{
+                    placeholder.attname: Concat(models.Value('~import-'), Cast('pk', models.CharField())),
+                })
+
+    def write_blob(self, blob_dir, digest, chunks):
+        """Copy a bundled media file into blob_dir, checking its content against its digest."""
+        sha256 = hashlib.sha256()
+        with open(os.path.join(blob_dir, digest), 'wb') as blob:
+            for chunk in chunks:
+                sha256.update(chunk)
+                blob.write(chunk)
+        if sha256.hexdigest() != digest:
+            raise BundleError(f'Media file {digest} is corrupt.')
+
+    def stage_media(self, storage, blob_dir, name, digest):
+        """Note that name must hold the bundled file unless an identical one is already there, and return the name."""
+        blob = os.path.join(blob_dir, digest) if digest else None
+        if not blob or not os.path.exists(blob) or name in self.checked:
+            return name
+        self.checked.add(name)
+        if file_sha256(storage, name) != digest:
+            self.staged[name] = (storage, blob)
+        return name
+
+    def restore_media(self):
+        """Replace each staged file with its bundled content, keeping its name."""
+        for name, (storage, blob) in self.staged.items():
+            if storage.exists(name):
+                storage.delete(name)
+            with open(blob, 'rb') as f:
+                stored = storage.save(name, File(f))
+            if stored != name:
+                self.stderr.write(self.style.WARNING(f'Media file {name} was stored as {stored}.'))
+            self.media += 1
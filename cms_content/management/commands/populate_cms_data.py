@@ -1,6 +1,10 @@
+import itertools
 import json
-from django.core.management.base import BaseCommand
+from operator import itemgetter
+
+from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from cms_content.bulk import BulkImport
 from cms_content.models import (
     PageContent,
     CallToAction,
@@ -24,18 +28,42 @@ from django.conf import settings
 class Command(BaseCommand):
     help = 'Populates the CMS database with initial content from extracted_content.json'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--bulk', action='store_true',
+                            help='Diff against existing rows by natural key and write only changes, in batches.')
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows per bulk query (default: 500).')
+        parser.add_argument('--file', default=os.path.join(settings.BASE_DIR, 'extracted_content.json'),
+                            help='Export to load (default: extracted_content.json). A .jsonl file, one '
+                                 '{"model", "fields"} record per line, is streamed in bulk mode.')
+
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('Starting CMS data population...'))
 
-        json_file_path = os.path.join(settings.BASE_DIR, 'extracted_content.json')
+        json_file_path = options['file']
+        file_name = os.path.basename(json_file_path)
+        if json_file_path.endswith('.jsonl'):
+            try:
+                with open(json_file_path, 'r') as f:
+                    self.populate_bulk(self.read_jsonl(f, file_name), options['batch_size'])
+            except FileNotFoundError:
+                self.stdout.write(self.style.ERROR(f'Error: The file {file_name} was not found.'))
+                return
+            self.stdout.write(self.style.SUCCESS('CMS data population complete.'))
+            return
+
         try:
             with open(json_file_path, 'r') as f:
                 data = json.load(f)
         except FileNotFoundError:
-            self.stdout.write(self.style.ERROR('Error: The file extracted_content.json was not found.'))
+            self.stdout.write(self.style.ERROR(f'Error: The file {file_name} was not found.'))
             return
         except json.JSONDecodeError:
-            self.stdout.write(self.style.ERROR('Error: Invalid JSON in extracted_content.json.'))
+            self.stdout.write(self.style.ERROR(f'Error: Invalid JSON in {file_name}.'))
+            return
+
+        if options['bulk']:
+            self.populate_bulk(self.read_sections(data), options['batch_size'])
+            self.stdout.write(self.style.SUCCESS('CMS data population complete.'))
             return
 
         # Dictionaries to store mappings from slug/identifier to actual model instances
@@ -269,3 +297,195 @@ class Command(BaseCommand):
                     self.stdout.write(self.style.ERROR(f'ProductSection not found for ProductSectionItem: {section_title}'))
 
         self.stdout.write(self.style.SUCCESS('CMS data population complete.'))
+
+    # Bulk mode: (model, natural key, record builder, id map updater) per export model, in dependency order.
+    def bulk_models(self):
+        return {
+            'cms_content.PageContent': (PageContent, ('page_name', 'section_identifier'),
+                                        self.page_content_values, self.remember_page_contents),
+            'cms_content.Product': (Product, ('url_slug',), self.product_values, self.remember_products),
+            'cms_content.Service': (Service, ('url_slug',), self.service_values, None),
+            'cms_content.Feature': (Feature, ('title',), self.feature_values, None),
+            'cms_content.TimelineEvent': (TimelineEvent, ('year', 'description'), self.timeline_event_values, None),
+            'cms_content.Capability': (Capability, ('title',), self.capability_values, None),
+            'cms_content.CallToAction': (CallToAction, ('page_content_id', 'button_text'),
+                                         self.call_to_action_values, None),
+            'cms_content.ProductSection': (ProductSection, ('product_id', 'title'),
+                                           self.product_section_values, self.remember_product_sections),
+            'cms_content.ProductImage': (ProductImage, ('product_id', 'image'), self.product_image_values, None),
+            'cms_content.ProductSectionItem': (ProductSectionItem, ('section_id', 'text'),
+                                               self.product_section_item_values, None),
+        }
+
+    def read_sections(self, data):
+        """Yield (model, fields) pairs from a loaded export, parents before children."""
+        sections = [
+            ('page_contents', 'cms_content.PageContent'),
+            ('products', 'cms_content.Product'),
+            ('services', 'cms_content.Service'),
+            ('features', 'cms_content.Feature'),
+            ('timeline_events', 'cms_content.TimelineEvent'),
+            ('capabilities', 'cms_content.Capability'),
+            ('call_to_actions', 'cms_content.CallToAction'),
+            ('products', 'cms_content.ProductSection'),
+            ('products', 'cms_content.ProductImage'),
+            ('products', 'cms_content.ProductSectionItem'),
+        ]
+        for section, model in sections:
+            for entry in data.get(section, []):
+                if entry.get('model', model) == model:
+                    yield model, entry['fields']
+
+    def read_jsonl(self, lines, file_name):
+        """Yield (model, fields) pairs from a JSON Lines export, one line at a time."""
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                raise CommandError(f'Invalid JSON on line {number} of {file_name}.')
+            if not isinstance(entry, dict) or 'model' not in entry or 'fields' not in entry:
+                raise CommandError(f'Line {number} of {file_name} has no model/fields.')
+            yield entry['model'], entry['fields']
+
+    def populate_bulk(self, entries, batch_size):
+        """Upsert (model, fields) pairs in batches of consecutive records of one model.
+
+        Only the batch in hand and the natural key to id maps of parent rows
+        are held in memory, so entries may come from a stream of any length.
+        Parents must come before the records that refer to them.
+        """
+        self.page_content_ids = {}
+        self.product_ids = {}
+        self.section_ids = {}
+        bulk_models = self.bulk_models()
+        upserters = {}
+        with BulkImport(batch_size) as bulk:
+            for model_name, group in itertools.groupby(entries, key=itemgetter(0)):
+                if model_name not in bulk_models:
+                    self.stdout.write(self.style.ERROR(f'Unknown model in export: {model_name}'))
+                    continue
+                model, key, values, remember = bulk_models[model_name]
+                if model_name not in upserters:
+                    upserters[model_name] = bulk.upserter(model, key)
+                group = map(itemgetter(1), group)
+                while batch := list(itertools.islice(group, batch_size)):
+                    records = [(fields, record) for fields in batch if (record := values(fields)) is not None]
+                    rows = upserters[model_name].upsert(record for _fields, record in records)
+                    if remember:
+                        remember(records, rows)
+
+        for line in bulk.report():
+            self.stdout.write(line)
+
+    def page_content_values(self, fields):
+        return {
+            'page_name': fields['page_name'],
+            'section_identifier': fields['section_identifier'],
+            'title': fields.get('title'),
+            'subtitle': fields.get('subtitle'),
+            'body_text': fields.get('body_text'),
+            'background_image': fields.get('background_image'),
+            'background_image_alt_text': fields.get('background_image_alt_text'),
+            'order': fields.get('order', 0),
+        }
+
+    def remember_page_contents(self, records, rows):
+        for _fields, record in records:
+            key = (record['page_name'], record['section_identifier'])
+            self.page_content_ids['_'.join(key)] = rows[key].pk
+
+    def product_values(self, fields):
+        return {
+            'url_slug': slugify(fields['name']),
+            'name': fields['name'],
+            'short_description': fields.get('short_description', ''),
+            'hero_image': fields.get('hero_image', ''),
+            'hero_image_alt_text': fields.get('hero_image_alt_text', ''),
+            'main_description': fields.get('main_description', ''),
+            'conclusion_text': fields.get('conclusion_text', ''),
+            'order': fields.get('order', 0),
+        }
+
+    def remember_products(self, records, rows):
+        # Related entries name their product by the slug in the export.
+        for fields, record in records:
+            if 'url_slug' in fields:
+                self.product_ids[fields['url_slug']] = rows[(record['url_slug'],)].pk
+
+    def service_values(self, fields):
+        return {
+            'url_slug': slugify(fields['name']),
+            'name': fields['name'],
+            'short_description': fields.get('short_description', ''),
+            'image': fields.get('image', ''),
+            'image_alt_text': fields.get('image_alt_text', ''),
+            'order': fields.get('order', 0),
+        }
+
+    def feature_values(self, fields):
+        return {
+            'title': fields['title'],
+            'description': fields.get('description', ''),
+            'icon_class': fields.get('icon_class', ''),
+            'order': fields.get('order', 0),
+        }
+
+    def timeline_event_values(self, fields):
+        return {'year': fields['year'], 'description': fields['description'], 'order': fields.get('order', 0)}
+
+    def capability_values(self, fields):
+        return {
+            'title': fields['title'],
+            'description': fields.get('description', ''),
+            'image': fields.get('image', ''),
+            'image_alt_text': fields.get('image_alt_text', ''),
+            'order': fields.get('order', 0),
+        }
+
+    def call_to_action_values(self, fields):
+        page_content_id = self.resolve(self.page_content_ids, fields.get('page_content'), 'PageContent', 'CallToAction')
+        if page_content_id is None:
+            return None
+        return {
+            'page_content_id': page_content_id,
+            'button_text': fields['button_text'],
+            'button_url': fields.get('button_url', ''),
+            'order': fields.get('order', 0),
+        }
+
+    def product_section_values(self, fields):
+        product_id = self.resolve(self.product_ids, fields.get('product'), 'Product', 'ProductSection')
+        if product_id is None:
+            return None
+        return {'product_id': product_id, 'title': fields['title'], 'order': fields.get('order', 0)}
+
+    def remember_product_sections(self, records, rows):
+        for fields, record in records:
+            key = (record['product_id'], record['title'])
+            self.section_ids[f"{fields['product']}_{fields['title']}"] = rows[key].pk
+
+    def product_image_values(self, fields):
+        product_id = self.resolve(self.product_ids, fields.get('product'), 'Product', 'ProductImage')
+        if product_id is None:
+            return None
+        return {
+            'product_id': product_id,
+            'image': fields['image'],
+            'alt_text': fields.get('alt_text', ''),
+            'order': fields.get('order', 0),
+        }
+
+    def product_section_item_values(self, fields):
+        section_key = f"{fields.get('product')}_{fields['section']}"
+        section_id = self.resolve(self.section_ids, section_key, 'ProductSection', 'ProductSectionItem')
+        if section_id is None:
+            return None
+        return {'section_id': section_id, 'text': fields['text'], 'order': fields.get('order', 0)}
+
+    def resolve(self, lookup, key, target, model_name):
+        """Return the id of a parent row imported earlier, reporting a missing one."""
+        if key not in lookup:
+            self.stdout.write(self.style.ERROR(f'{target} not found for {model_name}: {key}'))
+        return lookup.get(key)
@@ -0,0 +1,23 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from cms_content.thumbnails import evict
+
+
+class Command(BaseCommand):
+    help = 'Evicts the least recently used thumbnails until the cache fits THUMBNAIL_CACHE_MAX_BYTES.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-bytes', type=int, default=None,
+                            help='Size to prune to (default: THUMBNAIL_CACHE_MAX_BYTES).')
+
+    def handle(self, *args, **options):
+        directory = settings.THUMBNAIL_CACHE_DIR
+        if not os.path.isdir(directory):
+            self.stdout.write('No thumbnail cache to prune.')
+            return
+        max_bytes = options['max_bytes'] if options['max_bytes'] is not None else settings.THUMBNAIL_CACHE_MAX_BYTES
+        removed = evict(directory, max_bytes)
+        self.stdout.write(self.style.SUCCESS(f'Removed {removed} thumbnails from {directory}.'))
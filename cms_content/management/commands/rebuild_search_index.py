@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from cms_content.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the site search index from Products, Services, Blogs, Case Studies and White Papers.'
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        with transaction.atomic():
+            count = backend.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} documents with {type(backend).__name__}.'))
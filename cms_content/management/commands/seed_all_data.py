@@ -2,11 +2,19 @@ import os
 from django.core.management.base import BaseCommand
 from django.conf import settings
 from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from cms_content.bulk import BulkImport
+from cms_content.bundle import file_sha256
 from cms_content.models import Product, ProductImage, ProductSection, ProductSectionItem, Service
 
 class Command(BaseCommand):
     help = 'Seeds the database with all product data and images.'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--bulk', action='store_true',
+                            help='Diff against existing rows and write only changes, in batches.')
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows per bulk query (default: 500).')
+
     def handle(self, *args, **options):
         self.stdout.write('Starting database seeding...')
 
@@ -157,6 +165,34 @@ class Command(BaseCommand):
             }
         ]
 
+        services_data = [
+            {
+                "name": "Robotics Services",
+                "short_description": "Comprehensive robotics solutions including UGVs, UAVs, Robodogs, and more.",
+                "image": "static/images/services/robotics.jpg",
+                "url_slug": "robotics-services",
+                "order": 1
+            },
+            {
+                "name": "AI Services",
+                "short_description": "Advanced AI solutions for various industries, from warehouse management to safety AI software.",
+                "image": "static/images/services/ai.jpg",
+                "url_slug": "ai-services",
+                "order": 2
+            },
+            {
+                "name": "Rentals",
+                "short_description": "Flexible rental options for our state-of-the-art drones and Robodogs.",
+                "image": "static/images/services/rentals.jpg",
+                "url_slug": "rentals",
+                "order": 3
+            }
+        ]
+
+        if options['bulk']:
+            self.seed_bulk(products_data, services_data, options['batch_size'])
+            return
+
         for product_data in products_data:
             product, created = Product.objects.update_or_create(
                 name=product_data['name'],
@@ -178,8 +214,8 @@ class Command(BaseCommand):
             # Handle hero image
             hero_image_path = os.path.join(settings.BASE_DIR, product_data['hero_image'])
             if os.path.exists(hero_image_path):
-                with open(hero_image_path, 'rb') as f:
-                    product.hero_image.save(os.path.basename(hero_image_path), File(f), save=True)
+                product.hero_image = self.store_image(Product.hero_image.field, hero_image_path)
+                product.save()
 
             # Handle additional images
             for image_path in product_data.get('images', []):
@@ -189,8 +225,8 @@ class Command(BaseCommand):
                         product=product,
                         alt_text=f"{product.name} image"
                     )
-                    with open(full_image_path, 'rb') as f:
-                        image_instance.image.save(os.path.basename(full_image_path), File(f), save=True)
+                    image_instance.image = self.store_image(ProductImage.image.field, full_image_path)
+                    image_instance.save()
 
             # Handle sections and items
             for section_data in product_data.get('sections', []):
@@ -207,30 +243,6 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS('Database seeding complete.'))
 
         self.stdout.write('Seeding services...')
-        services_data = [
-            {
-                "name": "Robotics Services",
-                "short_description": "Comprehensive robotics solutions including UGVs, UAVs, Robodogs, and more.",
-                "image": "static/images/services/robotics.jpg",
-                "url_slug": "robotics-services",
-                "order": 1
-            },
-            {
-                "name": "AI Services",
-                "short_description": "Advanced AI solutions for various industries, from warehouse management to safety AI software.",
-                "image": "static/images/services/ai.jpg",
-                "url_slug": "ai-services",
-                "order": 2
-            },
-            {
-                "name": "Rentals",
-                "short_description": "Flexible rental options for our state-of-the-art drones and Robodogs.",
-                "image": "static/images/services/rentals.jpg",
-                "url_slug": "rentals",
-                "order": 3
-            }
-        ]
-
         for service_data in services_data:
             service, created = Service.objects.update_or_create(
                 name=service_data['name'],
@@ -250,6 +262,83 @@ class Command(BaseCommand):
             # Handle service image
             image_path = os.path.join(settings.BASE_DIR, service_data['image'])
             if os.path.exists(image_path):
-                with open(image_path, 'rb') as f:
-                    service.image.save(os.path.basename(image_path), File(f), save=True)
+                service.image = self.store_image(Service.image.field, image_path)
+                service.save()
         self.stdout.write(self.style.SUCCESS('Service seeding complete.'))
+
+    def store_image(self, field, path):
+        """Copy an image into the field's storage unless an earlier run already did, and return its name.
+
+        A stored file is only reused if its content matches. Otherwise the
+        image is stored under a name carrying its digest, which later runs
+        find again.
+        """
+        name = field.generate_filename(None, os.path.basename(path))
+        digest = file_sha256(FileSystemStorage(os.path.dirname(path)), os.path.basename(path))
+        if field.storage.exists(name):
+            if file_sha256(field.storage, name) == digest:
+                return name
+            stem, extension = os.path.splitext(name)
+            name = f'{stem}-{digest[:12]}{extension}'
+            if file_sha256(field.storage, name) == digest:
+                return name
+        with open(path, 'rb') as f:
+            return field.storage.save(name, File(f))
+
+    def seed_bulk(self, products_data, services_data, batch_size):
+        """Seed with one bulk upsert per model, keyed on url_slug and parent ids."""
+        def image(field, path):
+            path = os.path.join(settings.BASE_DIR, path)
+            return {field.name: self.store_image(field, path)} if os.path.exists(path) else {}
+
+        with BulkImport(batch_size) as bulk:
+            products = bulk.upserter(Product, ('url_slug',)).upsert(
+                {
+                    'url_slug': product_data['url_slug'],
+                    'name': product_data['name'],
+                    'short_description': product_data['short_description'],
+                    'main_description': product_data['main_description'],
+                    'conclusion_text': product_data['conclusion_text'],
+                    'order': product_data['order'],
+                    'hero_image_alt_text': product_data['name'],
+                    **image(Product.hero_image.field, product_data['hero_image']),
+                }
+                for product_data in products_data
+            )
+            product_ids = {slug: product.pk for (slug,), product in products.items()}
+            bulk.upserter(ProductImage, ('product_id', 'image')).upsert(
+                {
+                    'product_id': product_ids[product_data['url_slug']],
+                    'alt_text': f"{product_data['name']} image",
+                    **stored,
+                }
+                for product_data in products_data
+                for stored in (image(ProductImage.image.field, path) for path in product_data.get('images', []))
+                if stored
+            )
+            sections = bulk.upserter(ProductSection, ('product_id', 'title')).upsert(
+                {'product_id': product_ids[product_data['url_slug']], 'title': section_data['title']}
+                for product_data in products_data
+                for section_data in product_data.get('sections', [])
+            )
+            bulk.upserter(ProductSectionItem, ('section_id', 'text')).upsert(
+                {'section_id': sections[(product_ids[product_data['url_slug']], section_data['title'])].pk, 'text': text}
+                for product_data in products_data
+                for section_data in product_data.get('sections', [])
+                for text in section_data.get('items', [])
+            )
+            bulk.upserter(Service, ('url_slug',)).upsert(
+                {
+                    'url_slug': service_data['url_slug'],
+                    'name': service_data['name'],
+                    'short_description': service_data['short_description'],
+                    'order': service_data['order'],
+                    'image_alt_text': service_data['name'],
+                    **image(Service.image.field, service_data['image']),
+                }
+                for service_data in services_data
+            )
+
+        for line in bulk.report():
+            self.stdout.write(line)
+        self.stdout.write(self.style.SUCCESS('Database seeding complete.'))
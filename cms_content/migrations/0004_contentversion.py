@@ -0,0 +1,31 @@
+# Generated by Django 5.2.3 on 2026-10-18 15:30
+
+from django.db import migrations, models
+
+
+def create_content_version(apps, schema_editor):
+    ContentVersion = apps.get_model('cms_content', 'ContentVersion')
+    ContentVersion.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms_content', '0003_blog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=1, verbose_name='Version')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Updated At')),
+            ],
+            options={
+                'verbose_name': 'Content Version',
+                'verbose_name_plural': 'Content Version',
+            },
+        ),
+        migrations.RunPython(create_content_version, migrations.RunPython.noop),
+    ]
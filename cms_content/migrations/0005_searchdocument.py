@@ -0,0 +1,89 @@
+# Generated by Django 5.2.3 on 2026-10-18 15:33
+
+from django.db import migrations, models
+
+
+SQLITE_CREATE = [
+    """
+    CREATE VIRTUAL TABLE cms_content_searchdocument_fts USING fts5(
+        title, body,
+        content='cms_content_searchdocument', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER cms_content_searchdocument_ai AFTER INSERT ON cms_content_searchdocument BEGIN
+        INSERT INTO cms_content_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER cms_content_searchdocument_ad AFTER DELETE ON cms_content_searchdocument BEGIN
+        INSERT INTO cms_content_searchdocument_fts(cms_content_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER cms_content_searchdocument_au AFTER UPDATE ON cms_content_searchdocument BEGIN
+        INSERT INTO cms_content_searchdocument_fts(cms_content_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO cms_content_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS cms_content_searchdocument_au",
+    "DROP TRIGGER IF EXISTS cms_content_searchdocument_ad",
+    "DROP TRIGGER IF EXISTS cms_content_searchdocument_ai",
+    "DROP TABLE IF EXISTS cms_content_searchdocument_fts",
+]
+
+# Must match the expression used by PostgresSearchBackend for the planner to use the index.
+POSTGRES_CREATE = [
+    """
+    CREATE INDEX cms_content_searchdocument_fts_idx ON cms_content_searchdocument USING GIN ((
+        setweight(to_tsvector('english', title), 'A') || setweight(to_tsvector('english', body), 'B')
+    ))
+    """,
+]
+
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS cms_content_searchdocument_fts_idx",
+]
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms_content', '0004_contentversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=20, verbose_name='Kind')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='Object ID')),
+                ('title', models.CharField(max_length=255, verbose_name='Title')),
+                ('body', models.TextField(blank=True, verbose_name='Body')),
+                ('url', models.CharField(max_length=255, verbose_name='URL')),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+        migrations.RunPython(
+            run_for_vendor({'sqlite': SQLITE_CREATE, 'postgresql': POSTGRES_CREATE}),
+            run_for_vendor({'sqlite': SQLITE_DROP, 'postgresql': POSTGRES_DROP}),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms_content', '0006_imagerendition'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blog',
+            index=models.Index(fields=['publish_date', 'order'], name='blog_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='calltoaction',
+            index=models.Index(fields=['page_content', 'order'], name='calltoaction_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='capability',
+            index=models.Index(fields=['order'], name='capability_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='casestudy',
+            index=models.Index(fields=['order'], name='casestudy_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feature',
+            index=models.Index(fields=['order'], name='feature_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pagecontent',
+            index=models.Index(fields=['page_name', 'section_identifier', 'order'], name='pagecontent_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['order'], name='product_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productimage',
+            index=models.Index(fields=['product', 'order'], name='productimage_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productsection',
+            index=models.Index(fields=['product', 'order'], name='productsection_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productsectionitem',
+            index=models.Index(fields=['section', 'order'], name='productsectionitem_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['order'], name='service_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='timelineevent',
+            index=models.Index(fields=['order'], name='timelineevent_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='whitepaper',
+            index=models.Index(fields=['order'], name='whitepaper_order_idx'),
+        ),
+    ]
@@ -9,6 +9,17 @@ class TimeStampBaseModel(models.Model):
         abstract = True
         ordering = ['created_at']
 
+class PageContentManager(models.Manager):
+    def for_page(self, page_name):
+        """Return every section of a page keyed by section_identifier.
+
+        The sections come back in a single query, with their call to action
+        buttons prefetched in display order.
+        """
+        call_to_actions = models.Prefetch('call_to_actions', queryset=CallToAction.objects.order_by('order'))
+        sections = self.filter(page_name=page_name).prefetch_related(call_to_actions)
+        return {section.section_identifier: section for section in sections}
+
 class PageContent(TimeStampBaseModel):
     page_name = models.CharField(max_length=50, verbose_name="Page Name", help_text="e.g., home, about, service")
     section_identifier = models.CharField(max_length=100, verbose_name="Section Identifier", help_text="Unique ID for the section on the page, e.g., hero_section, mission_section")
@@ -19,9 +30,12 @@ class PageContent(TimeStampBaseModel):
     background_image_alt_text = models.CharField(max_length=255, blank=True, null=True, verbose_name="Background Image Alt Text", help_text="Alt text for the background image")
     order = models.IntegerField(default=0, verbose_name="Order", help_text="Display order of this content block within its section")
 
+    objects = PageContentManager()
+
     class Meta(TimeStampBaseModel.Meta):
         unique_together = ('page_name', 'section_identifier')
         ordering = ['page_name', 'section_identifier', 'order']
+        indexes = [models.Index(fields=['page_name', 'section_identifier', 'order'], name='pagecontent_order_idx')]
         verbose_name = "Page Content"
         verbose_name_plural = "Page Contents"
 
@@ -36,6 +50,7 @@ class CallToAction(TimeStampBaseModel):
 
     class Meta(TimeStampBaseModel.Meta):
         ordering = ['page_content', 'order']
+        indexes = [models.Index(fields=['page_content', 'order'], name='calltoaction_order_idx')]
         verbose_name = "Call To Action Button"
         verbose_name_plural = "Call To Action Buttons"
 
@@ -54,6 +69,7 @@ class Product(TimeStampBaseModel):
 
     class Meta(TimeStampBaseModel.Meta):
         ordering = ['order']
+        indexes = [models.Index(fields=['order'], name='product_order_idx')]
         verbose_name = "Product"
         verbose_name_plural = "Products"
 
@@ -71,6 +87,7 @@ class ProductImage(TimeStampBaseModel):
 
     class Meta(TimeStampBaseModel.Meta):
         ordering = ['product', 'order']
+        indexes = [models.Index(fields=['product', 'order'], name='productimage_order_idx')]
         verbose_name = "Product Image"
         verbose_name_plural = "Product Images"
 
@@ -84,6 +101,7 @@ class ProductSection(TimeStampBaseModel):
 
     class Meta(TimeStampBaseModel.Meta):
         ordering = ['product', 'order']
+        indexes = [models.Index(fields=['product', 'order'], name='productsection_order_idx')]
         verbose_name = "Product Section"
         verbose_name_plural = "Product Sections"
 
@@ -97,6 +115,7 @@ class ProductSectionItem(TimeStampBaseModel):
 
     class Meta(TimeStampBaseModel.Meta):
         ordering = ['section', 'order']
+        indexes = [models.Index(fields=['section', 'order'], name='productsectionitem_order_idx')]
         verbose_name = "Product Section Item"
         verbose_name_plural = "Product Section Items"
 
@@ -113,6 +132,7 @@ class Service(TimeStampBaseModel):
 
     class Meta(TimeStampBaseModel.Meta):
         ordering = ['order']
+        indexes = [models.Index(fields=['order'], name='service_order_idx')]
         verbose_name = "Service"
         verbose_name_plural = "Services"
 
@@ -130,6 +150,7 @@ class Feature(TimeStampBaseModel):
 
     class Meta(TimeStampBaseModel.Meta):
         ordering = ['order']
+        indexes = [models.Index(fields=['order'], name='feature_order_idx')]
         verbose_name = "Feature"
         verbose_name_plural = "Features"
 
@@ -143,6 +164,7 @@ class TimelineEvent(TimeStampBaseModel):
 
     class Meta(TimeStampBaseModel.Meta):
         ordering = ['year', 'order']
+        indexes = [models.Index(fields=['order'], name='timelineevent_order_idx')]
         verbose_name = "Timeline Event"
         verbose_name_plural = "Timeline Events"
 
@@ -158,6 +180,7 @@ class Capability(TimeStampBaseModel):
 
     class Meta(TimeStampBaseModel.Meta):
         ordering = ['order']
+        indexes = [models.Index(fields=['order'], name='capability_order_idx')]
         verbose_name = "Capability"
         verbose_name_plural = "Capabilities"
 
@@ -175,6 +198,7 @@ class CaseStudy(TimeStampBaseModel):
 
     class Meta(TimeStampBaseModel.Meta):
         ordering = ['order']
+        indexes = [models.Index(fields=['order'], name='casestudy_order_idx')]
         verbose_name = "Case Study"
         verbose_name_plural = "Case Studies"
 
@@ -194,6 +218,7 @@ class WhitePaper(TimeStampBaseModel):
 
     class Meta(TimeStampBaseModel.Meta):
         ordering = ['order']
+        indexes = [models.Index(fields=['order'], name='whitepaper_order_idx')]
         verbose_name = "White Paper"
         verbose_name_plural = "White Papers"
 
@@ -216,6 +241,7 @@ class Blog(TimeStampBaseModel):
 
     class Meta(TimeStampBaseModel.Meta):
         ordering = ['publish_date', 'order']
+        indexes = [models.Index(fields=['publish_date', 'order'], name='blog_order_idx')]
         verbose_name = "Blog Post"
         verbose_name_plural = "Blog Posts"
 
@@ -225,3 +251,66 @@ class Blog(TimeStampBaseModel):
     def get_absolute_url(self):
         return reverse('cms_content:blog_detail', kwargs={'slug': self.url_slug})
 
+
+class ContentVersion(models.Model):
+    """Single row counting writes to CMS content.
+
+    It is bumped inside the same transaction as every content save or delete,
+    so any worker can tell whether its cached view of the content is current
+    by reading one integer.
+    """
+    version = models.PositiveBigIntegerField(default=1, verbose_name="Version")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Last Updated At")
+
+    class Meta:
+        verbose_name = "Content Version"
+        verbose_name_plural = "Content Version"
+
+    def __str__(self):
+        return f"Content version {self.version}"
+
+
+class SearchDocument(models.Model):
+    """Denormalised, searchable copy of a Product, Service, Blog, CaseStudy or WhitePaper.
+
+    Rows are kept current from post_save/post_delete signals. The full-text
+    index over title and body is database specific and created by migration.
+    """
+    kind = models.CharField(max_length=20, verbose_name="Kind")
+    object_id = models.PositiveBigIntegerField(verbose_name="Object ID")
+    title = models.CharField(max_length=255, verbose_name="Title")
+    body = models.TextField(blank=True, verbose_name="Body")
+    url = models.CharField(max_length=255, verbose_name="URL")
+
+    class Meta:
+        unique_together = ('kind', 'object_id')
+        verbose_name = "Search Document"
+        verbose_name_plural = "Search Documents"
+
+    def __str__(self):
+        return f"{self.kind}: {self.title}"
+
+    def get_absolute_url(self):
+        return self.url
+
+
+class ImageRendition(models.Model):
+    """A resized, re-encoded copy of a CMS image, served through srcset.
+
+    Renditions are keyed by the source image's storage name, so an image
+    shared by several rows is only rendered once.
+    """
+    source = models.CharField(max_length=255, db_index=True, verbose_name="Source Image")
+    width = models.PositiveIntegerField(verbose_name="Width")
+    height = models.PositiveIntegerField(verbose_name="Height")
+    format = models.CharField(max_length=10, verbose_name="Format")
+    file = models.ImageField(upload_to='renditions/', max_length=255, verbose_name="File")
+
+    class Meta:
+        unique_together = ('source', 'format', 'width')
+        ordering = ['source', 'format', 'width']
+        verbose_name = "Image Rendition"
+        verbose_name_plural = "Image Renditions"
+
+    def __str__(self):
+        return f"{self.source} ({self.width}w {self.format})"
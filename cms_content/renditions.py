@@ -0,0 +1,127 @@
+import hashlib
+import posixpath
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from django.contrib.staticfiles import finders
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from .models import Blog, Capability, CaseStudy, ImageRendition, PageContent, Product, ProductImage, Service
+from .versioning import forget_content_version, get_content_version
+
+# Every CMS image field that gets renditions.
+IMAGE_FIELDS = (
+    (Product, 'hero_image'),
+    (ProductImage, 'image'),
+    (Service, 'image'),
+    (Capability, 'image'),
+    (CaseStudy, 'image'),
+    (Blog, 'image'),
+    (PageContent, 'background_image'),
+)
+
+
+def source_names():
+    """Return the distinct image names referenced by the CMS, sorted."""
+    names = set()
+    for model, field in IMAGE_FIELDS:
+        names.update(model.objects.exclude(**{f'{field}__isnull': True}).values_list(field, flat=True))
+    names.discard('')
+    return sorted(names)
+
+
+def source_file(name):
+    """Return a path (or, for remote storage, the bytes) of an image, or None.
+
+    CMS rows hold either uploaded media or paths into the static files, so
+    the media storage is tried first and then the staticfiles finders.
+    """
+    if default_storage.exists(name):
+        try:
+            return default_storage.path(name)
+        except NotImplementedError:
+            with default_storage.open(name) as image_file:
+                return image_file.read()
+    return finders.find(name)
+
+
+def rendition_name(source, image_format, width):
+    stem = posixpath.splitext(posixpath.basename(source))[0]
+    digest = hashlib.sha1(source.encode()).hexdigest()[:12]
+    # Relative to the field's upload_to directory.
+    return f'{digest}/{stem}-{width}w.{image_format}'
+
+
+def delete_renditions(queryset):
+    """Delete renditions and their files. Returns the number deleted."""
+    count = 0
+    for rendition in queryset:
+        rendition.file.delete(save=False)
+        rendition.delete()
+        count += 1
+    return count
+
+
+def save_renditions(source, renditions):
+    """Replace the stored renditions of source with (format, width, height, data) tuples."""
+    delete_renditions(ImageRendition.objects.filter(source=source))
+    rows = []
+    for image_format, width, height, data in renditions:
+        rendition = ImageRendition(source=source, format=image_format, width=width, height=height)
+        rendition.file.save(rendition_name(source, image_format, width), ContentFile(data), save=False)
+        rows.append(rendition)
+    ImageRendition.objects.bulk_create(rows)
+
+
+@dataclass(frozen=True, slots=True)
+class Rendition:
+    format: str
+    width: int
+    height: int
+    url: str
+
+
+@dataclass(frozen=True, slots=True)
+class RenditionMap:
+    """Renditions of every CMS image, keyed by source name."""
+    version: int
+    sources: MappingProxyType
+
+    def get(self, source):
+        """Return a source's renditions ordered by format, then width."""
+        return self.sources.get(source, ())
+
+
+def build_rendition_map(version):
+    sources = {}
+    for rendition in ImageRendition.objects.order_by('source', 'format', 'width'):
+        sources.setdefault(rendition.source, []).append(
+            Rendition(rendition.format, rendition.width, rendition.height, rendition.file.url)
+        )
+    return RenditionMap(version, MappingProxyType({source: tuple(items) for source, items in sources.items()}))
+
+
+_renditions = None
+_lock = threading.Lock()
+
+
+def get_rendition_map():
+    """Return this process's rendition map, rebuilding it if the content version moved."""
+    global _renditions
+    version = get_content_version()
+    renditions = _renditions
+    if renditions is not None and renditions.version == version:
+        return renditions
+    with _lock:
+        if _renditions is None or _renditions.version != version:
+            _renditions = build_rendition_map(version)
+        return _renditions
+
+
+def clear_rendition_map():
+    """Forget the rendition map and cached content version for this process."""
+    global _renditions
+    _renditions = None
+    forget_content_version()
@@ -0,0 +1,156 @@
+"""Strip invalid control characters from large JSON exports in constant memory.
+
+The export is read in chunks and scanned with a small state machine that
+knows whether it is inside a string and inside an escape sequence. Raw
+newlines, carriage returns and tabs inside strings become their escapes, other
+raw control characters are dropped, and escaped sequences pass through
+untouched. Structure is checked on the way: brackets must balance, escapes
+must be valid and strings must be closed. This module does not import Django.
+"""
+import codecs
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+CHUNK_SIZE = 1 << 20
+# Runs that need no attention, matched whole by the regex engine: string contents with complete
+# escapes, and between tokens whitespace, numbers, literals and clean complete strings. Whatever
+# else, such as brackets, control characters and escapes split across chunks, goes through the
+# state machine one character at a time. The quantifiers are possessive, so a string that turns
+# out to be dirty is not backtracked into.
+STRING_CONTENT = r'(?:[^"\\\x00-\x1f]++|\\["\\/bfnrt]|\\u[0-9a-fA-F]{4})'
+STRING_RUN_RE = re.compile(f'{STRING_CONTENT}++')
+TOKEN_RUN_RE = re.compile(f'(?:[ \\t\\n\\r,:0-9.+\\-eEtrufalsn]++|"{STRING_CONTENT}*+")++')
+STRING_ESCAPES = {'\n': '\\n', '\r': '\\r', '\t': '\\t'}
+SIMPLE_ESCAPES = frozenset('"\\/bfnrt')
+HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+CLOSING = {'}': '{', ']': '['}
+
+
+class ExportError(ValueError):
+    def __init__(self, message, offset):
+        super().__init__(f'{message} at character {offset}')
+        self.offset = offset
+
+
+@dataclass
+class SanitizeStats:
+    characters: int = 0
+    dropped: int = 0
+    escaped: int = 0
+
+
+class Sanitizer:
+    """Feed text chunks in with feed(); each call returns the cleaned text."""
+
+    def __init__(self):
+        self.stats = SanitizeStats()
+        self.in_string = False
+        self.escape = None  # None, '\\' after a backslash, or the hex digits left in a \\u escape
+        self.stack = []
+
+    def error(self, message, index):
+        raise ExportError(message, self.stats.characters + index)
+
+    def feed(self, text):
+        out = []
+        i = 0
+        end = len(text)
+        while i < end:
+            if self.in_string:
+                if self.escape is not None:
+                    c = text[i]
+                    if self.escape == '\\':
+                        if c == 'u':
+                            self.escape = 4
+                        elif c in SIMPLE_ESCAPES:
+                            self.escape = None
+                        else:
+                            self.error(f'Invalid escape \\{c}', i)
+                    elif c in HEX_DIGITS:
+                        self.escape = self.escape - 1 or None
+                    else:
+                        self.error('Invalid \\u escape', i)
+                    out.append(c)
+                    i += 1
+                    continue
+                match = STRING_RUN_RE.match(text, i)
+                if match:
+                    out.append(match.group())
+                    i = match.end()
+                    continue
+                c = text[i]
+                if c == '"':
+                    self.in_string = False
+                    out.append(c)
+                elif c == '\\':
+                    self.escape = '\\'
+                    out.append(c)
+                elif c in STRING_ESCAPES:
+                    out.append(STRING_ESCAPES[c])
+                    self.stats.escaped += 1
+                else:
+                    self.stats.dropped += 1
+                i += 1
+                continue
+
+            match = TOKEN_RUN_RE.match(text, i)
+            if match:
+                out.append(match.group())
+                i = match.end()
+                continue
+            c = text[i]
+            if c == '"':
+                self.in_string = True
+                out.append(c)
+            elif c in '{[':
+                self.stack.append(c)
+                out.append(c)
+            elif c in CLOSING:
+                if not self.stack or self.stack.pop() != CLOSING[c]:
+                    self.error(f'Unbalanced {c}', i)
+                out.append(c)
+            elif c < ' ' or c == '\x7f':
+                self.stats.dropped += 1
+            else:
+                self.error(f'Unexpected {c!r}', i)
+            i += 1
+        self.stats.characters += end
+        return ''.join(out)
+
+    def close(self):
+        if self.in_string:
+            self.error('Unterminated string', 0)
+        if self.stack:
+            self.error(f'Unclosed {self.stack[-1]}', 0)
+        return self.stats
+
+
+def sanitize_stream(source, target, chunk_size=CHUNK_SIZE):
+    """Copy binary file source to text file target, cleaned. Returns SanitizeStats."""
+    # Bytes that are not UTF-8 are dropped, as before.
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+    sanitizer = Sanitizer()
+    while chunk := source.read(chunk_size):
+        target.write(sanitizer.feed(decoder.decode(chunk)))
+    target.write(sanitizer.feed(decoder.decode(b'', final=True)))
+    return sanitizer.close()
+
+
+def sanitize_file(path, output=None, chunk_size=CHUNK_SIZE):
+    """Clean path into output (default: in place) through a temporary file renamed over it.
+
+    The output is left untouched if the export turns out to be invalid.
+    """
+    output = Path(output or path)
+    fd, temp = tempfile.mkstemp(dir=output.parent, prefix=f'.{output.name}.')
+    try:
+        with open(path, 'rb') as source, os.fdopen(fd, 'w', encoding='utf-8', newline='') as target:
+            stats = sanitize_stream(source, target, chunk_size)
+        os.replace(temp, output)
+    except BaseException:
+        os.unlink(temp)
+        raise
+    return stats
@@ -0,0 +1,4 @@
+from .backends import get_search_backend, reset_search_backend
+from .documents import SEARCH_SOURCES, document_for
+
+__all__ = ['SEARCH_SOURCES', 'document_for', 'get_search_backend', 'reset_search_backend']
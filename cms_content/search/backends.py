@@ -0,0 +1,253 @@
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import CharField, F, Q, Value
+from django.db.models.functions import Substr
+from django.utils.html import strip_tags
+from django.utils.module_loading import import_string
+
+from cms_content.models import SearchDocument
+
+from .documents import EXCERPT_LENGTH, SEARCH_SOURCES, SOURCES_BY_KIND, SearchResult, document_for
+
+
+def search_terms(query):
+    """Split a user query into word tokens, dropping any search syntax."""
+    return re.findall(r'\w+', query.lower())
+
+
+def plain_excerpt(text):
+    # Excerpts cut from HTML may end inside a tag; drop it before stripping.
+    return strip_tags(re.sub(r'<[^>]*$', '', text or ''))
+
+
+class SearchResults:
+    """Lazily counted and sliced search results.
+
+    Paginator only ever asks for the count and one page slice, so a request
+    loads a bounded number of rows however many documents match.
+    """
+
+    def __init__(self, count, fetch):
+        self._count = None
+        self._count_func = count
+        self._fetch = fetch
+
+    def count(self):
+        if self._count is None:
+            self._count = self._count_func()
+        return self._count
+
+    def __len__(self):
+        return self.count()
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            if key.step not in (None, 1):
+                raise ValueError('Search results do not support stepped slices.')
+            start = key.start or 0
+            stop = self.count() if key.stop is None else key.stop
+            if start < 0 or stop < 0:
+                raise ValueError('Search results do not support negative indexing.')
+            return self._fetch(start, stop - start) if stop > start else []
+        results = self._fetch(key, 1)
+        if not results:
+            raise IndexError('Search result index out of range.')
+        return results[0]
+
+
+EMPTY_RESULTS = SearchResults(lambda: 0, lambda offset, limit: [])
+
+
+def sql_results(count_sql, count_params, page_sql, page_params):
+    """Build SearchResults from raw SQL returning (kind, object_id, title, url, excerpt) rows.
+
+    page_sql must end with LIMIT %s OFFSET %s.
+    """
+    def count():
+        with connection.cursor() as cursor:
+            cursor.execute(count_sql, count_params)
+            return cursor.fetchone()[0]
+
+    def fetch(offset, limit):
+        with connection.cursor() as cursor:
+            cursor.execute(page_sql, [*page_params, limit, offset])
+            return [SearchResult(*row) for row in cursor.fetchall()]
+
+    return SearchResults(count, fetch)
+
+
+class DatabaseSearchBackend:
+    """Search the SearchDocument table with portable icontains filters.
+
+    Subclasses replace search() with a ranked query against a native
+    full-text index over the same table.
+    """
+
+    def index(self, instance):
+        document = document_for(instance)
+        SearchDocument.objects.update_or_create(
+            kind=document.pop('kind'), object_id=document.pop('object_id'), defaults=document
+        )
+
+    def remove(self, instance):
+        document = document_for(instance)
+        SearchDocument.objects.filter(kind=document['kind'], object_id=document['object_id']).delete()
+
+    def rebuild(self):
+        """Recreate every search document from the source tables. Returns the document count."""
+        SearchDocument.objects.all().delete()
+        documents = [
+            SearchDocument(**document_for(instance))
+            for source in SEARCH_SOURCES
+            for instance in source.model.objects.all()
+        ]
+        SearchDocument.objects.bulk_create(documents, batch_size=500)
+        return len(documents)
+
+    def search(self, query):
+        terms = search_terms(query)
+        if not terms:
+            return EMPTY_RESULTS
+        condition = Q()
+        for term in terms:
+            condition &= Q(title__icontains=term) | Q(body__icontains=term)
+        queryset = (
+            SearchDocument.objects.filter(condition)
+            .order_by('kind', 'title', 'pk')
+            .annotate(excerpt=Substr('body', 1, EXCERPT_LENGTH))
+            .values_list('kind', 'object_id', 'title', 'url', 'excerpt')
+        )
+        return SearchResults(
+            queryset.count,
+            lambda offset, limit: [SearchResult(*row) for row in queryset[offset:offset + limit]],
+        )
+
+
+class SQLiteSearchBackend(DatabaseSearchBackend):
+    """Ranked search through the FTS5 table mirroring SearchDocument."""
+
+    count_sql = """
+        SELECT count(*) FROM cms_content_searchdocument_fts
+        WHERE cms_content_searchdocument_fts MATCH %s
+    """
+    page_sql = """
+        SELECT d.kind, d.object_id, d.title, d.url, substr(d.body, 1, %s)
+        FROM cms_content_searchdocument d
+        JOIN cms_content_searchdocument_fts f ON f.rowid = d.id
+        WHERE cms_content_searchdocument_fts MATCH %s
+        ORDER BY bm25(cms_content_searchdocument_fts, 10.0, 1.0), d.id
+        LIMIT %s OFFSET %s
+    """
+
+    def search(self, query):
+        terms = search_terms(query)
+        if not terms:
+            return EMPTY_RESULTS
+        # Quote every term so user input can never be parsed as FTS5 syntax,
+        # and prefix-match each so partial words still find results.
+        match = ' '.join(f'"{term}"*' for term in terms)
+        return sql_results(self.count_sql, [match], self.page_sql, [EXCERPT_LENGTH, match])
+
+
+class PostgresSearchBackend(DatabaseSearchBackend):
+    """Ranked search using the GIN-indexed tsvector expression over SearchDocument."""
+
+    vector = "setweight(to_tsvector('english', title), 'A') || setweight(to_tsvector('english', body), 'B')"
+    count_sql = f"""
+        SELECT count(*) FROM cms_content_searchdocument
+        WHERE ({vector}) @@ to_tsquery('english', %s)
+    """
+    page_sql = f"""
+        SELECT kind, object_id, title, url, substr(body, 1, %s)
+        FROM cms_content_searchdocument
+        WHERE ({vector}) @@ to_tsquery('english', %s)
+        ORDER BY ts_rank(({vector}), to_tsquery('english', %s)) DESC, id
+        LIMIT %s OFFSET %s
+    """
+
+    def search(self, query):
+        terms = search_terms(query)
+        if not terms:
+            return EMPTY_RESULTS
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        return sql_results(self.count_sql, [tsquery], self.page_sql, [EXCERPT_LENGTH, tsquery, tsquery])
+
+
+class UnionSearchBackend:
+    """Search the source tables directly with one UNION ALL query.
+
+    Needs no index, so it suits databases without a native full-text
+    backend. Each branch projects only the columns a result displays.
+    """
+
+    def index(self, instance):
+        pass
+
+    def remove(self, instance):
+        pass
+
+    def rebuild(self):
+        return 0
+
+    def search(self, query):
+        terms = search_terms(query)
+        if not terms:
+            return EMPTY_RESULTS
+        branches = []
+        for source in SEARCH_SOURCES:
+            condition = Q()
+            for term in terms:
+                condition &= (
+                    Q(**{f'{source.title_field}__icontains': term}) | Q(**{f'{source.body_field}__icontains': term})
+                )
+            branches.append(
+                source.model.objects.order_by()
+                .filter(condition)
+                .annotate(
+                    kind=Value(source.kind, output_field=CharField()),
+                    result_title=F(source.title_field),
+                    excerpt=Substr(source.body_field, 1, EXCERPT_LENGTH),
+                )
+                .values_list('kind', 'pk', 'result_title', 'url_slug', 'excerpt')
+            )
+        queryset = branches[0].union(*branches[1:], all=True).order_by('kind', 'result_title')
+
+        def fetch(offset, limit):
+            return [
+                SearchResult(kind, pk, title, SOURCES_BY_KIND[kind].url(url_slug), plain_excerpt(excerpt))
+                for kind, pk, title, url_slug, excerpt in queryset[offset:offset + limit]
+            ]
+
+        return SearchResults(queryset.count, fetch)
+
+
+VENDOR_BACKENDS = {
+    'sqlite': SQLiteSearchBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+_backend = None
+
+
+def get_search_backend():
+    """Return the configured search backend.
+
+    SEARCH_BACKEND may name a backend class by dotted path. Otherwise the
+    backend matching the database vendor is used.
+    """
+    global _backend
+    if _backend is None:
+        path = getattr(settings, 'SEARCH_BACKEND', None)
+        backend_class = import_string(path) if path else VENDOR_BACKENDS.get(connection.vendor, UnionSearchBackend)
+        _backend = backend_class()
+    return _backend
+
+
+def reset_search_backend():
+    global _backend
+    _backend = None
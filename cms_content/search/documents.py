@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+
+from django.urls import reverse
+from django.utils.html import strip_tags
+
+from cms_content.models import Blog, CaseStudy, Product, Service, WhitePaper
+
+# Characters of body text carried by each search result.
+EXCERPT_LENGTH = 300
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    """How one searchable model maps onto a search document."""
+    kind: str
+    model: type
+    title_field: str
+    body_field: str
+    url_name: str
+    slug_kwarg: str = None
+
+    @property
+    def label(self):
+        return self.model._meta.verbose_name
+
+    def url(self, slug):
+        if self.slug_kwarg is None:
+            return reverse(self.url_name)
+        return reverse(self.url_name, kwargs={self.slug_kwarg: slug})
+
+
+SEARCH_SOURCES = (
+    SearchSource('product', Product, 'name', 'short_description', 'pages:product_detail', 'url_slug'),
+    SearchSource('service', Service, 'name', 'short_description', 'pages:service_detail', 'url_slug'),
+    SearchSource('blog', Blog, 'title', 'content', 'cms_content:blog_detail', 'slug'),
+    SearchSource('case_study', CaseStudy, 'title', 'short_description', 'cms_content:case_studies'),
+    SearchSource('white_paper', WhitePaper, 'title', 'short_description', 'cms_content:white_papers'),
+)
+
+SOURCES_BY_MODEL = {source.model: source for source in SEARCH_SOURCES}
+SOURCES_BY_KIND = {source.kind: source for source in SEARCH_SOURCES}
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    """One search hit, holding only what the results page displays."""
+    kind: str
+    object_id: int
+    title: str
+    url: str
+    excerpt: str
+
+    @property
+    def label(self):
+        return SOURCES_BY_KIND[self.kind].label
+
+    def get_absolute_url(self):
+        return self.url
+
+
+def document_for(instance):
+    """Return the searchable fields of a model instance as a dict."""
+    source = SOURCES_BY_MODEL[type(instance)]
+    return {
+        'kind': source.kind,
+        'object_id': instance.pk,
+        'title': getattr(instance, source.title_field) or '',
+        'body': strip_tags(getattr(instance, source.body_field) or ''),
+        'url': source.url(instance.url_slug),
+    }
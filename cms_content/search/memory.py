@@ -0,0 +1,187 @@
+import math
+import threading
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+
+from cms_content.versioning import get_content_version
+
+from .backends import EMPTY_RESULTS, SearchResults, search_terms
+from .documents import EXCERPT_LENGTH, SEARCH_SOURCES, SOURCES_BY_MODEL, SearchResult, document_for
+
+# Title words count this many times towards a term's frequency.
+TITLE_WEIGHT = 3
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+class Postings:
+    """Documents containing one term, as parallel compact arrays."""
+    __slots__ = ('slots', 'frequencies')
+
+    def __init__(self):
+        self.slots = array('I')
+        self.frequencies = array('I')
+
+
+class InMemorySearchBackend:
+    """BM25-ranked search over an inverted index held in process memory.
+
+    The index is built from the source tables on first use and then updated
+    incrementally from the same post_save/post_delete signals that maintain
+    the database backends. If the content version moves in a way this
+    process did not see (a write from another worker, or a rolled back
+    transaction), the next search rebuilds the index from the database.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._version = None
+        self._clear()
+
+    def _clear(self):
+        self._documents = []  # slot -> (document dict, Counter of terms) or None
+        self._slots = {}  # (kind, object_id) -> slot
+        self._lengths = array('I')
+        self._total_length = 0
+        self._live = 0
+        self._postings = {}
+        self._vocabulary = []  # sorted terms, for prefix expansion
+
+    @staticmethod
+    def _terms(document):
+        terms = Counter(search_terms(document['body']))
+        for term in search_terms(document['title']):
+            terms[term] += TITLE_WEIGHT
+        return terms
+
+    def _add(self, document):
+        terms = self._terms(document)
+        slot = len(self._documents)
+        self._documents.append((document, terms))
+        self._slots[(document['kind'], document['object_id'])] = slot
+        length = sum(terms.values())
+        self._lengths.append(length)
+        self._total_length += length
+        self._live += 1
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = Postings()
+                insort(self._vocabulary, term)
+            postings.slots.append(slot)
+            postings.frequencies.append(frequency)
+
+    def _discard(self, key):
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+        _document, terms = self._documents[slot]
+        self._documents[slot] = None
+        self._total_length -= self._lengths[slot]
+        self._live -= 1
+        for term in terms:
+            postings = self._postings[term]
+            index = postings.slots.index(slot)
+            del postings.slots[index]
+            del postings.frequencies[index]
+            if not postings.slots:
+                del self._postings[term]
+                del self._vocabulary[bisect_left(self._vocabulary, term)]
+        if len(self._documents) > 2 * self._live + 64:
+            self._compact()
+
+    def _compact(self):
+        # Reassign slots so tombstones left by updates and deletes are dropped.
+        documents = [entry[0] for entry in self._documents if entry is not None]
+        self._clear()
+        for document in documents:
+            self._add(document)
+
+    def _build(self):
+        self._clear()
+        version = get_content_version()
+        for source in SEARCH_SOURCES:
+            for instance in source.model.objects.all():
+                self._add(document_for(instance))
+        self._version = version
+
+    def _ensure_current(self):
+        if self._version is None or self._version != get_content_version():
+            self._build()
+
+    def _track_version(self):
+        # Signals bump the content version before updating the index; if
+        # this write accounts for the whole move, the index is still current.
+        if self._version is not None:
+            version = get_content_version()
+            if version == self._version + 1:
+                self._version = version
+
+    def index(self, instance):
+        with self._lock:
+            if self._version is None:
+                return
+            document = document_for(instance)
+            self._discard((document['kind'], document['object_id']))
+            self._add(document)
+            self._track_version()
+
+    def remove(self, instance):
+        with self._lock:
+            if self._version is None:
+                return
+            self._discard((SOURCES_BY_MODEL[type(instance)].kind, instance.pk))
+            self._track_version()
+
+    def rebuild(self):
+        with self._lock:
+            self._build()
+            return self._live
+
+    def _expand(self, term):
+        start = bisect_left(self._vocabulary, term)
+        end = bisect_left(self._vocabulary, term + '\U0010ffff', start)
+        return self._vocabulary[start:end]
+
+    @staticmethod
+    def _result(document):
+        return SearchResult(
+            document['kind'], document['object_id'], document['title'], document['url'],
+            document['body'][:EXCERPT_LENGTH],
+        )
+
+    def search(self, query):
+        terms = search_terms(query)
+        if not terms:
+            return EMPTY_RESULTS
+        with self._lock:
+            self._ensure_current()
+            if not self._live:
+                return EMPTY_RESULTS
+            average_length = self._total_length / self._live
+            scores = None
+            for term in terms:
+                term_scores = {}
+                for expansion in self._expand(term):
+                    postings = self._postings[expansion]
+                    frequency_of_docs = len(postings.slots)
+                    idf = math.log(1 + (self._live - frequency_of_docs + 0.5) / (frequency_of_docs + 0.5))
+                    for slot, frequency in zip(postings.slots, postings.frequencies):
+                        norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[slot] / average_length)
+                        score = idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+                        term_scores[slot] = term_scores.get(slot, 0.0) + score
+                # Every query term must match, as in the database backends.
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {slot: scores[slot] + score for slot, score in term_scores.items() if slot in scores}
+                if not scores:
+                    return EMPTY_RESULTS
+            ranked = sorted(scores, key=lambda slot: (-scores[slot], slot))
+            # Resolve slots now; compaction may reassign them before the page is read.
+            documents = [self._documents[slot][0] for slot in ranked]
+        return SearchResults(
+            lambda: len(documents),
+            lambda offset, limit: [self._result(document) for document in documents[offset:offset + limit]],
+        )
@@ -0,0 +1,87 @@
+import re
+import threading
+from bisect import bisect_left
+
+from cms_content.versioning import get_content_version
+
+from .documents import SEARCH_SOURCES
+
+
+def _sorted_index(pairs):
+    pairs.sort()
+    return [key for key, _position in pairs], [position for _key, position in pairs]
+
+
+def _prefix_range(keys, prefix):
+    start = bisect_left(keys, prefix)
+    return start, bisect_left(keys, prefix + '\U0010ffff', start)
+
+
+class SuggestionIndex:
+    """Sorted arrays of lower-cased titles for prefix lookups with bisect.
+
+    Whole titles are kept apart from the suffixes starting at each later
+    word, so titles beginning with the prefix are suggested first, then
+    titles with a later word that matches ("mon" -> "Crowd Monitoring").
+    """
+    __slots__ = ('version', 'entries', 'title_keys', 'title_positions', 'word_keys', 'word_positions')
+
+    def __init__(self, version, entries):
+        self.version = version
+        self.entries = tuple(entries)  # (kind, title, url)
+        titles, words = [], []
+        for position, (_kind, title, _url) in enumerate(self.entries):
+            lowered = ' '.join(title.lower().split())
+            titles.append((lowered, position))
+            for match in list(re.finditer(r'\w+', lowered))[1:]:
+                words.append((lowered[match.start():], position))
+        self.title_keys, self.title_positions = _sorted_index(titles)
+        self.word_keys, self.word_positions = _sorted_index(words)
+
+    def suggest(self, prefix, limit):
+        prefix = ' '.join(prefix.lower().split())
+        if not prefix or limit <= 0:
+            return []
+        seen = {}
+        for keys, positions in ((self.title_keys, self.title_positions), (self.word_keys, self.word_positions)):
+            start, end = _prefix_range(keys, prefix)
+            for position in positions[start:end]:
+                seen.setdefault(position, None)
+                if len(seen) == limit:
+                    return [self.entries[position] for position in seen]
+        return [self.entries[position] for position in seen]
+
+
+def build_suggestion_index(version):
+    entries = []
+    for source in SEARCH_SOURCES:
+        for title, url_slug in source.model.objects.order_by().values_list(source.title_field, 'url_slug'):
+            entries.append((source.kind, title, source.url(url_slug)))
+    return SuggestionIndex(version, entries)
+
+
+_index = None
+_lock = threading.Lock()
+
+
+def get_suggestion_index():
+    """Return this process's suggestion index, rebuilding it if the content version moved."""
+    global _index
+    version = get_content_version()
+    index = _index
+    if index is not None and index.version == version:
+        return index
+    with _lock:
+        if _index is None or _index.version != version:
+            _index = build_suggestion_index(version)
+        return _index
+
+
+def suggest(prefix, limit):
+    """Return up to limit (kind, title, url) tuples whose title matches prefix."""
+    return get_suggestion_index().suggest(prefix, limit)
+
+
+def clear_suggestion_index():
+    global _index
+    _index = None
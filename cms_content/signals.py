@@ -0,0 +1,58 @@
+from django.db.models.signals import post_delete, post_save
+
+from .models import (
+    PageContent,
+    CallToAction,
+    Product,
+    ProductImage,
+    ProductSection,
+    ProductSectionItem,
+    Service,
+    Feature,
+    TimelineEvent,
+    Capability,
+    CaseStudy,
+    WhitePaper,
+    Blog,
+)
+from .search import SEARCH_SOURCES, get_search_backend
+from .versioning import bump_content_version
+
+# Every model whose rows end up in a rendered public page.
+CONTENT_MODELS = (
+    PageContent,
+    CallToAction,
+    Product,
+    ProductImage,
+    ProductSection,
+    ProductSectionItem,
+    Service,
+    Feature,
+    TimelineEvent,
+    Capability,
+    CaseStudy,
+    WhitePaper,
+    Blog,
+)
+
+
+def content_changed(sender, using=None, **kwargs):
+    bump_content_version(using=using)
+
+
+def update_search_document(sender, instance, **kwargs):
+    get_search_backend().index(instance)
+
+
+def remove_search_document(sender, instance, **kwargs):
+    get_search_backend().remove(instance)
+
+
+def connect_signals():
+    for model in CONTENT_MODELS:
+        post_save.connect(content_changed, sender=model, dispatch_uid=f'content_changed_save_{model.__name__}')
+        post_delete.connect(content_changed, sender=model, dispatch_uid=f'content_changed_delete_{model.__name__}')
+    for source in SEARCH_SOURCES:
+        name = source.model.__name__
+        post_save.connect(update_search_document, sender=source.model, dispatch_uid=f'update_search_document_{name}')
+        post_delete.connect(remove_search_document, sender=source.model, dispatch_uid=f'remove_search_document_{name}')
@@ -0,0 +1,192 @@
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from asgiref.sync import sync_to_async
+from django.db.models import Prefetch
+from django.urls import reverse
+
+from .models import (
+    PageContent,
+    CallToAction,
+    Product,
+    Service,
+    Feature,
+    TimelineEvent,
+    Capability,
+)
+from .versioning import forget_content_version, get_content_version
+
+
+@dataclass(frozen=True, slots=True)
+class ProductEntry:
+    id: int
+    name: str
+    short_description: str
+    hero_image: str
+    hero_image_alt_text: str
+    url_slug: str
+    order: int
+
+    def get_absolute_url(self):
+        return reverse('pages:product_detail', kwargs={'url_slug': self.url_slug})
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceEntry:
+    id: int
+    name: str
+    short_description: str
+    image: str
+    image_alt_text: str
+    url_slug: str
+    order: int
+
+    def get_absolute_url(self):
+        return reverse('pages:service_detail', kwargs={'url_slug': self.url_slug})
+
+
+@dataclass(frozen=True, slots=True)
+class FeatureEntry:
+    id: int
+    title: str
+    description: str
+    icon_class: str
+    order: int
+
+
+@dataclass(frozen=True, slots=True)
+class CapabilityEntry:
+    id: int
+    title: str
+    description: str
+    image: str
+    image_alt_text: str
+    order: int
+
+
+@dataclass(frozen=True, slots=True)
+class TimelineEventEntry:
+    id: int
+    year: int
+    description: str
+    order: int
+
+
+@dataclass(frozen=True, slots=True)
+class CallToActionEntry:
+    id: int
+    button_text: str
+    button_url: str
+    order: int
+
+
+@dataclass(frozen=True, slots=True)
+class PageContentEntry:
+    id: int
+    page_name: str
+    section_identifier: str
+    title: str
+    subtitle: str
+    body_text: str
+    background_image: str
+    background_image_alt_text: str
+    order: int
+    call_to_actions: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class ContentSnapshot:
+    """Immutable, in-memory copy of the CMS content read on every request."""
+    version: int
+    products: tuple
+    services: tuple
+    features: tuple
+    capabilities: tuple
+    timeline_events: tuple
+    pages: MappingProxyType
+
+    def page(self, page_name):
+        """Return a page's sections keyed by section_identifier."""
+        return self.pages.get(page_name, MappingProxyType({}))
+
+
+def build_snapshot(version):
+    products = tuple(
+        ProductEntry(p.id, p.name, p.short_description, p.hero_image.name or '', p.hero_image_alt_text, p.url_slug, p.order)
+        for p in Product.objects.order_by('order')
+    )
+    services = tuple(
+        ServiceEntry(s.id, s.name, s.short_description, s.image.name or '', s.image_alt_text, s.url_slug, s.order)
+        for s in Service.objects.order_by('order')
+    )
+    features = tuple(
+        FeatureEntry(f.id, f.title, f.description, f.icon_class, f.order)
+        for f in Feature.objects.order_by('order')
+    )
+    capabilities = tuple(
+        CapabilityEntry(c.id, c.title, c.description, c.image.name or '', c.image_alt_text, c.order)
+        for c in Capability.objects.order_by('order')
+    )
+    timeline_events = tuple(
+        TimelineEventEntry(e.id, e.year, e.description, e.order)
+        for e in TimelineEvent.objects.order_by('order')
+    )
+
+    pages = {}
+    call_to_actions = Prefetch('call_to_actions', queryset=CallToAction.objects.order_by('order'))
+    for content in PageContent.objects.prefetch_related(call_to_actions):
+        pages.setdefault(content.page_name, {})[content.section_identifier] = PageContentEntry(
+            content.id,
+            content.page_name,
+            content.section_identifier,
+            content.title,
+            content.subtitle,
+            content.body_text,
+            content.background_image.name or '',
+            content.background_image_alt_text,
+            content.order,
+            tuple(
+                CallToActionEntry(cta.id, cta.button_text, cta.button_url, cta.order)
+                for cta in content.call_to_actions.all()
+            ),
+        )
+
+    return ContentSnapshot(
+        version=version,
+        products=products,
+        services=services,
+        features=features,
+        capabilities=capabilities,
+        timeline_events=timeline_events,
+        pages=MappingProxyType({name: MappingProxyType(sections) for name, sections in pages.items()}),
+    )
+
+
+_snapshot = None
+_lock = threading.Lock()
+
+
+def get_snapshot():
+    """Return this process's content snapshot, rebuilding it if the content version moved."""
+    global _snapshot
+    version = get_content_version()
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+    with _lock:
+        if _snapshot is None or _snapshot.version != version:
+            _snapshot = build_snapshot(version)
+        return _snapshot
+
+
+async def aget_snapshot():
+    """Async get_snapshot(). The version check, and any rebuild, query the database, so they run in a thread."""
+    return await sync_to_async(get_snapshot)()
+
+
+def clear_snapshot():
+    """Forget the snapshot and cached content version for this process."""
+    global _snapshot
+    _snapshot = None
+    forget_content_version()
@@ -73,3 +73,20 @@ def test_call_to_action_creation():
     )
     assert cta.button_text == "Click Me"
     assert str(cta) == "Click Me (home - cta)"
+
+@pytest.mark.django_db
+def test_page_content_for_page(django_assert_num_queries):
+    """Test that for_page loads a page's sections and their buttons in bulk."""
+    hero = PageContent.objects.create(page_name="about", section_identifier="hero_section", title="About Us")
+    cta = PageContent.objects.create(page_name="about", section_identifier="cta_section", title="Get in touch")
+    PageContent.objects.create(page_name="contact", section_identifier="hero_section", title="Contact")
+    CallToAction.objects.create(page_content=cta, button_text="Second", button_url="https://example.com/2", order=2)
+    CallToAction.objects.create(page_content=cta, button_text="First", button_url="https://example.com/1", order=1)
+
+    with django_assert_num_queries(2):
+        sections = PageContent.objects.for_page("about")
+        buttons = [button.button_text for button in sections["cta_section"].call_to_actions.all()]
+
+    assert set(sections) == {"hero_section", "cta_section"}
+    assert sections["hero_section"] == hero
+    assert buttons == ["First", "Second"]
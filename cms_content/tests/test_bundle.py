@@ -0,0 +1,122 @@
+import datetime
+from io import StringIO
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from cms_content.models import Blog, Product, ProductSection, ProductSectionItem, SearchDocument
+from cms_content.versioning import get_content_version
+
+
+@pytest.fixture
+def content(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path / "media"
+    product = Product(name="Robodogs", url_slug="robodogs", short_description="Quadrupeds.", order=1)
+    product.hero_image.save("robodog.png", ContentFile(b"robodog image"), save=False)
+    product.save()
+    section = ProductSection.objects.create(product=product, title="Key Features")
+    ProductSectionItem.objects.create(section=section, text="Autonomy", order=1)
+    blog = Blog(title="Launch", author="Team", publish_date=datetime.date(2025, 3, 1), content="News",
+                url_slug="launch", image_alt_text="Launch")
+    # Same content as the hero image: the bundle carries it once.
+    blog.image.save("launch.png", ContentFile(b"robodog image"), save=False)
+    blog.save()
+    return tmp_path
+
+
+@pytest.mark.django_db
+def test_bundle_round_trip(content):
+    """Test that importing a bundle restores rows, deletes extras and restores media."""
+    bundle = content / "site.bundle"
+    out = StringIO()
+    call_command("export_content_bundle", str(bundle), "--chunk-size", "1", stdout=out)
+    assert "Wrote 4 rows and 1 media files" in out.getvalue()
+
+    product = Product.objects.get()
+    product.short_description = "Changed."
+    product.save()
+    ProductSectionItem.objects.all().delete()
+    Product.objects.create(name="Extra", url_slug="extra", hero_image="product_heroes/extra.png")
+    (content / "media" / product.hero_image.name).unlink()
+    version = get_content_version()
+
+    out = StringIO()
+    call_command("import_content_bundle", str(bundle), "--batch-size", "1", stdout=out)
+    assert "Product: 0 created, 1 updated, 0 unchanged" in out.getvalue()
+    assert "deleted 1 rows" in out.getvalue()
+    assert "stored 1 media files" in out.getvalue()
+
+    product = Product.objects.get()
+    assert product.short_description == "Quadrupeds."
+    assert product.hero_image.read() == b"robodog image"
+    assert ProductSectionItem.objects.get().section.product == product
+    assert Blog.objects.get().publish_date == datetime.date(2025, 3, 1)
+    assert get_content_version() > version
+    assert not SearchDocument.objects.filter(title="Extra").exists()
+
+    # Primary keys carried over from the bundle do not collide with new rows.
+    assert Product.objects.create(name="New", url_slug="new").pk > product.pk
+
+
+@pytest.mark.django_db
+def test_import_rejects_truncated_bundle(content):
+    """Test that a truncated bundle is rejected without changing anything."""
+    bundle = content / "site.bundle"
+    call_command("export_content_bundle", str(bundle), stdout=StringIO())
+    bundle.write_bytes(bundle.read_bytes()[:-10])
+    Product.objects.update(short_description="Local.")
+
+    with pytest.raises(CommandError, match="truncated"):
+        call_command("import_content_bundle", str(bundle), stdout=StringIO())
+    assert Product.objects.get().short_description == "Local."
+
+
+@pytest.mark.django_db
+def test_failed_import_leaves_media_untouched(content):
+    """Test that media files are only replaced once the imported rows are committed."""
+    bundle = content / "site.bundle"
+    call_command("export_content_bundle", str(bundle), stdout=StringIO())
+    bundle.write_bytes(bundle.read_bytes()[:-10])
+    hero_image = content / "media" / Product.objects.get().hero_image.name
+    hero_image.write_bytes(b"local image")
+
+    with pytest.raises(CommandError, match="truncated"):
+        call_command("import_content_bundle", str(bundle), stdout=StringIO())
+    assert hero_image.read_bytes() == b"local image"
+
+
+@pytest.mark.django_db
+def test_import_resolves_unique_values_held_by_other_rows(content):
+    """Test that rows whose unique values moved to other primary keys import cleanly."""
+    Product.objects.create(name="First", url_slug="first", order=2)
+    Product.objects.create(name="Second", url_slug="second", order=3)
+    bundle = content / "site.bundle"
+    call_command("export_content_bundle", str(bundle), stdout=StringIO())
+
+    # The sites diverged: other rows now hold the bundle's names and slugs.
+    robodogs, first, second = Product.objects.order_by("pk").values_list("pk", flat=True)
+    Product.objects.filter(pk=robodogs).delete()
+    Product.objects.filter(pk=first).update(name="Robodogs", url_slug="robodogs")
+    Product.objects.filter(pk=second).update(name="First", url_slug="first")
+
+    call_command("import_content_bundle", str(bundle), stdout=StringIO())
+    assert list(Product.objects.order_by("pk").values_list("pk", "url_slug", "name")) == [
+        (robodogs, "robodogs", "Robodogs"),
+        (first, "first", "First"),
+        (second, "second", "Second"),
+    ]
+
+
+@pytest.mark.django_db
+def test_media_streams_through_bundle_in_chunks(content, monkeypatch):
+    """Test that media files larger than a chunk are copied out and back intact."""
+    monkeypatch.setattr("cms_content.bundle.CHUNK_SIZE", 4)
+    bundle = content / "site.bundle"
+    call_command("export_content_bundle", str(bundle), stdout=StringIO())
+    hero_image = content / "media" / Product.objects.get().hero_image.name
+    hero_image.write_bytes(b"local image")
+
+    call_command("import_content_bundle", str(bundle), stdout=StringIO())
+    assert hero_image.read_bytes() == b"robodog image"
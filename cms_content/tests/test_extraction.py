@@ -0,0 +1,137 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from cms_content.models import Product, ProductImage, ProductSectionItem, Service
+
+INDEX = """
+<div class="portfolio-slider-5">
+  <div class="col pl-5 pr-5">
+    <a class="portfolio-image" href="/products/1/" style="background-image: url({% static 'images/products/1.png' %});"></a>
+    <h4 class="title"><a href="/products/1/">Robodogs</a></h4>
+    <span class="category"><a href="#">Quadrupeds for inspection.</a></span>
+  </div>
+</div>
+"""
+
+PRODUCT = """
+<div class="product-hero-title"><h1>Robodogs</h1></div>
+<div class="carousel-inner">
+  <img src="{% static 'images/products/1.png' %}" alt="Hero">
+  <img src="{% static 'images/products/robodog.png' %}" alt="Side view">
+</div>
+<div class="col-lg-5 col-12">
+  <p>Agile and smart.</p>
+  <h3 class="mt-4">Key Features</h3>
+  <ul><li><strong>Autonomy:</strong> SLAM navigation.</li><li>Sensors</li></ul>
+  <p>Built for industry.</p>
+</div>
+"""
+
+SERVICE = """
+<div class="col-12 col-lg-8 text-center mb-80"><h2 class="block-title">Our Services</h2></div>
+<div class="col-12"><div class="row">
+  <a class="service-card" href="/service-rentals/"><img src="/static/images/services/rentals.jpg" alt="Rentals">
+    <h4>Rentals</h4><p class="text-muted">Drones on demand.</p></a>
+</div></div>
+"""
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    pages = tmp_path / "templates" / "pages"
+    pages.mkdir(parents=True)
+    (pages / "index.html").write_text(INDEX)
+    (pages / "product1.html").write_text(PRODUCT)
+    (pages / "service.html").write_text(SERVICE)
+    (pages / "contact.html").write_text("<p>Not extracted</p>")
+    return tmp_path / "templates"
+
+
+def test_extract_content_writes_merged_export(template_dir, tmp_path):
+    """Test that each product merges its home page and detail page records."""
+    output = tmp_path / "extracted_content.json"
+    out = StringIO()
+    call_command("extract_content", str(template_dir), "--output", str(output), "--workers", "2", stdout=out)
+    assert "from 3 templates" in out.getvalue()
+
+    data = json.loads(output.read_text())
+    [product] = [entry["fields"] for entry in data["products"] if entry["model"] == "cms_content.Product"]
+    assert product["short_description"] == "Quadrupeds for inspection."
+    assert product["main_description"] == "Agile and smart."
+    assert product["conclusion_text"] == "Built for industry."
+    # The carousel's copy of the hero image is not repeated as a gallery image.
+    images = [entry["fields"]["image"] for entry in data["products"] if entry["model"] == "cms_content.ProductImage"]
+    assert images == ["images/products/robodog.png"]
+    assert data["services"][0]["fields"]["url_slug"] == "rentals"
+    assert data["page_contents"][0]["fields"]["title"] == "Our Services"
+
+
+@pytest.mark.django_db
+def test_extract_content_jsonl_feeds_populate(template_dir, tmp_path):
+    """Test that a JSON Lines export loads with populate_cms_data."""
+    output = tmp_path / "extracted_content.jsonl"
+    call_command("extract_content", str(template_dir), "--output", str(output), "--workers", "0", stdout=StringIO())
+    call_command("populate_cms_data", "--file", str(output), stdout=StringIO())
+
+    product = Product.objects.get(url_slug="robodogs")
+    assert product.short_description == "Quadrupeds for inspection."
+    assert product.main_description == "Agile and smart."
+    assert ProductImage.objects.get().image.name == "images/products/robodog.png"
+    assert ProductSectionItem.objects.first().text == "<li><strong>Autonomy:</strong> SLAM navigation.</li>"
+    assert Service.objects.get().name == "Rentals"
+
+
+def test_extract_content_reparses_only_changed_templates(template_dir, tmp_path):
+    """Test that a rerun reuses the manifest's records for unchanged templates."""
+    output = tmp_path / "extracted_content.json"
+    call_command("extract_content", str(template_dir), "--output", str(output), "--workers", "0", stdout=StringIO())
+    manifest = json.loads((tmp_path / "extracted_content.manifest.json").read_text())
+    assert sorted(manifest) == ["pages/index.html", "pages/product1.html", "pages/service.html"]
+
+    (template_dir / "pages" / "service.html").write_text(SERVICE.replace("Drones on demand.", "Robots on demand."))
+    out = StringIO()
+    call_command("extract_content", str(template_dir), "--output", str(output), "--workers", "0", stdout=out)
+    assert "1 parsed" in out.getvalue()
+    assert "2 unchanged" in out.getvalue()
+    assert "service.html" in out.getvalue()
+    assert "index.html" not in out.getvalue()
+
+    data = json.loads(output.read_text())
+    assert data["services"][0]["fields"]["short_description"] == "Robots on demand."
+    # Records reused from the manifest still merge into complete products.
+    [product] = [entry["fields"] for entry in data["products"] if entry["model"] == "cms_content.Product"]
+    assert product["short_description"] == "Quadrupeds for inspection."
+    assert product["main_description"] == "Agile and smart."
+
+
+def test_extract_content_jsonl_writes_each_product_once(template_dir, tmp_path):
+    """Test that JSON Lines exports hold one merged record per product, ahead of its children."""
+    output = tmp_path / "extracted_content.jsonl"
+    call_command("extract_content", str(template_dir), "--output", str(output), "--workers", "0", stdout=StringIO())
+
+    models = [json.loads(line)["model"] for line in output.read_text().splitlines()]
+    assert models.count("cms_content.Product") == 1
+    assert models[0] == "cms_content.Product"
+    product = json.loads(output.read_text().splitlines()[0])["fields"]
+    assert product["short_description"] == "Quadrupeds for inspection."
+    assert product["main_description"] == "Agile and smart."
+
+
+def test_extract_content_failure_keeps_previous_export(template_dir, tmp_path, monkeypatch):
+    """Test that a run failing part way leaves the previous export in place."""
+    output = tmp_path / "extracted_content.json"
+    call_command("extract_content", str(template_dir), "--output", str(output), "--workers", "0", stdout=StringIO())
+    previous = output.read_text()
+
+    def fail(path, parser):
+        raise RuntimeError("parser crashed")
+
+    monkeypatch.setattr("cms_content.management.commands.extract_content.extract_file", fail)
+    with pytest.raises(RuntimeError):
+        call_command("extract_content", str(template_dir), "--output", str(output), "--workers", "0", "--full",
+                     stdout=StringIO())
+    assert output.read_text() == previous
+    assert sorted(path.name for path in tmp_path.iterdir() if path.name.startswith(".")) == []
@@ -1,4 +1,5 @@
 
+import json
 import pytest
 from io import StringIO
 import os
@@ -116,3 +117,137 @@ def test_populate_cms_data_update(tmp_path):
     assert product.short_description == "Updated description."
 
     os.remove(json_file_path)
+
+BULK_CONTENT = {
+    "page_contents": [
+        {"model": "cms_content.PageContent",
+         "fields": {"page_name": "home", "section_identifier": "hero", "title": "Welcome"}},
+    ],
+    "products": [
+        {"model": "cms_content.Product",
+         "fields": {"name": "Bulk Product", "url_slug": "bulk-product", "short_description": "First."}},
+        {"model": "cms_content.ProductSection",
+         "fields": {"product": "bulk-product", "title": "Key Features", "order": 1}},
+        {"model": "cms_content.ProductSectionItem",
+         "fields": {"product": "bulk-product", "section": "Key Features", "text": "Fast"}},
+    ],
+    "services": [],
+    "features": [{"model": "cms_content.Feature", "fields": {"title": "Quick", "order": "2"}}],
+    "timeline_events": [],
+    "capabilities": [],
+    "call_to_actions": [
+        {"model": "cms_content.CallToAction",
+         "fields": {"page_content": "home_hero", "button_text": "Go", "button_url": "/go/"}},
+    ],
+}
+
+
+@pytest.mark.django_db
+def test_populate_cms_data_bulk(django_assert_max_num_queries):
+    """Test that bulk mode creates rows once, then writes only what changed."""
+    from cms_content.models import CallToAction, Feature, ProductSectionItem, SearchDocument
+    from cms_content.versioning import get_content_version
+
+    json_file_path = os.path.join(os.getcwd(), "extracted_content.json")
+    with open(json_file_path, "w") as f:
+        json.dump(BULK_CONTENT, f)
+    try:
+        out = StringIO()
+        with django_assert_max_num_queries(60):
+            call_command("populate_cms_data", "--bulk", stdout=out)
+        assert "Product: 1 created, 0 updated, 0 unchanged" in out.getvalue()
+        assert ProductSectionItem.objects.get().section.product.url_slug == "bulk-product"
+        assert CallToAction.objects.get().page_content.title == "Welcome"
+        assert SearchDocument.objects.filter(title="Bulk Product").exists()
+
+        version = get_content_version()
+        out = StringIO()
+        call_command("populate_cms_data", "--bulk", stdout=out)
+        assert "Product: 0 created, 0 updated, 1 unchanged" in out.getvalue()
+        assert "Feature: 0 created, 0 updated, 1 unchanged" in out.getvalue()
+        assert get_content_version() == version
+
+        BULK_CONTENT["products"][0]["fields"]["short_description"] = "Second."
+        with open(json_file_path, "w") as f:
+            json.dump(BULK_CONTENT, f)
+        out = StringIO()
+        call_command("populate_cms_data", "--bulk", stdout=out)
+        assert "Product: 0 created, 1 updated, 0 unchanged" in out.getvalue()
+        assert Product.objects.get().short_description == "Second."
+        assert Feature.objects.get().order == 2
+        assert get_content_version() > version
+    finally:
+        BULK_CONTENT["products"][0]["fields"]["short_description"] = "First."
+        os.remove(json_file_path)
+
+
+@pytest.mark.django_db
+def test_seed_all_data_bulk_reuses_images(settings, tmp_path):
+    """Test that a repeated bulk seed leaves rows and stored images alone."""
+    settings.MEDIA_ROOT = tmp_path
+    call_command("seed_all_data", "--bulk", stdout=StringIO())
+    hero = Product.objects.get(url_slug="robodogs").hero_image.name
+    assert hero == "product_heroes/robodog.png"
+    assert Service.objects.count() == 3
+
+    out = StringIO()
+    call_command("seed_all_data", "--bulk", stdout=out)
+    assert "Product: 0 created, 0 updated, 6 unchanged" in out.getvalue()
+    assert Product.objects.get(url_slug="robodogs").hero_image.name == hero
+    assert sorted(path.name for path in (tmp_path / "product_heroes").iterdir()) == sorted(
+        os.path.basename(p.hero_image.name) for p in Product.objects.all())
+
+    # A different file that happens to have the same name is not mistaken for the seed image.
+    (tmp_path / "product_heroes" / "robodog.png").write_bytes(b"another image")
+    call_command("seed_all_data", "--bulk", stdout=StringIO())
+    replaced = Product.objects.get(url_slug="robodogs").hero_image.name
+    assert replaced.startswith("product_heroes/robodog-") and replaced.endswith(".png")
+    assert (tmp_path / replaced).read_bytes() == (settings.BASE_DIR / "static" / "images" / "products" / "robodog.png").read_bytes()
+    call_command("seed_all_data", "--bulk", stdout=StringIO())
+    assert Product.objects.get(url_slug="robodogs").hero_image.name == replaced
+
+
+@pytest.mark.django_db
+def test_populate_cms_data_streams_jsonl(tmp_path):
+    """Test that a JSON Lines export is imported in batches and a bad line rolls it back."""
+    from django.core.management.base import CommandError
+    from cms_content.models import CallToAction, ProductSectionItem
+
+    entries = [entry for section in BULK_CONTENT.values() for entry in section]
+    entries.sort(key=lambda entry: entry["model"] not in ("cms_content.PageContent", "cms_content.Product"))
+    export = tmp_path / "export.jsonl"
+    export.write_text("\n".join(json.dumps(entry) for entry in entries) + "\n")
+
+    out = StringIO()
+    call_command("populate_cms_data", "--file", str(export), "--batch-size", "1", stdout=out)
+    assert "CMS data population complete." in out.getvalue()
+    assert ProductSectionItem.objects.get().section.product.url_slug == "bulk-product"
+    assert CallToAction.objects.get().page_content.title == "Welcome"
+
+    entries[0]["fields"] = {**entries[0]["fields"], "title": "Changed"}
+    export.write_text(json.dumps(entries[0]) + "\n{not json\n")
+    with pytest.raises(CommandError, match="line 2"):
+        call_command("populate_cms_data", "--file", str(export), stdout=StringIO())
+    assert CallToAction.objects.get().page_content.title == "Welcome"
+
+    export.write_text(json.dumps(entries[0]) + '\n{"model": "cms_content.Product"}\n')
+    with pytest.raises(CommandError, match="Line 2 of .* has no model/fields"):
+        call_command("populate_cms_data", "--file", str(export), stdout=StringIO())
+    assert CallToAction.objects.get().page_content.title == "Welcome"
+
+@pytest.mark.django_db
+def test_benchmark_indexes_rolls_back():
+    """Test that the index benchmark reports every query and leaves no rows or dropped indexes behind."""
+    from django.db import connection
+
+    out = StringIO()
+    call_command("benchmark_indexes", "--rows", "200", "--repeat", "1", "--plans", stdout=out)
+    output = out.getvalue()
+    assert "200 rows per table" in output
+    assert "product_order_idx" in output
+    assert "blog posts" in output
+
+    assert not Product.objects.exists()
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, Product._meta.db_table)
+    assert "product_order_idx" in constraints
@@ -66,6 +66,21 @@ class CMSContentTests(TestCase):
         self.assertContains(response, 'This is the content of the test blog post.')
         self.assertTemplateUsed(response, 'pages/blog-details-left-sidebar.html')
 
+    def test_blog_detail_conditional_get(self):
+        url = reverse('cms_content:blog_detail', args=['test-blog-post'])
+        response = self.client.get(url)
+        self.assertTrue(response.has_header('ETag'))
+        self.assertTrue(response.has_header('Last-Modified'))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_case_studies_conditional_get_after_delete(self):
+        url = reverse('cms_content:case_studies')
+        response = self.client.get(url)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code, 304)
+        self.case_study.delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
+
     def test_contact_page_map_integration(self):
         response = self.client.get(reverse('pages:contact'))
         self.assertEqual(response.status_code, 200)
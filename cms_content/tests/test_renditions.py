@@ -0,0 +1,111 @@
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.management import call_command
+from django.template import Context, Template
+from PIL import Image
+
+from cms_content.imaging import supported_formats
+from cms_content.models import ImageRendition, Product
+from cms_content.versioning import get_content_version
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.IMAGE_RENDITION_WIDTHS = [200, 400, 1600]
+    return tmp_path
+
+
+def create_product(media_root, width=800, height=400):
+    (media_root / "product_heroes").mkdir(exist_ok=True)
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), "teal").save(buffer, "PNG")
+    (media_root / "product_heroes" / "hero.png").write_bytes(buffer.getvalue())
+    return Product.objects.create(
+        name="Robodogs",
+        short_description="A short description.",
+        hero_image="product_heroes/hero.png",
+        hero_image_alt_text="Robodog",
+        main_description="Main description.",
+        url_slug="robodogs",
+    )
+
+
+@pytest.mark.django_db
+def test_generate_renditions(media_root):
+    """Test that renditions are made at each width without upscaling, and stale ones are pruned."""
+    product = create_product(media_root)
+    version = get_content_version()
+
+    call_command("generate_renditions", workers=0, stdout=StringIO())
+
+    renditions = ImageRendition.objects.filter(source="product_heroes/hero.png")
+    formats = supported_formats()
+    assert sorted(set(renditions.values_list("format", flat=True))) == sorted(formats)
+    assert sorted(set(renditions.values_list("width", flat=True))) == [200, 400, 800]
+    widest = renditions.get(format="webp", width=800)
+    assert widest.height == 400
+    with Image.open(widest.file.path) as image:
+        assert image.format == "WEBP"
+        assert image.size == (800, 400)
+    assert get_content_version() > version
+
+    # A second run leaves finished images alone.
+    out = StringIO()
+    call_command("generate_renditions", workers=0, stdout=out)
+    assert "Rendered 0 images" in out.getvalue()
+
+    product.delete()
+    call_command("generate_renditions", workers=0, stdout=StringIO())
+    assert not ImageRendition.objects.exists()
+    assert not (media_root / widest.file.name).exists()
+
+
+@pytest.mark.django_db
+def test_generate_renditions_in_worker_processes(media_root):
+    """Test that renditions rendered in a process pool are saved."""
+    create_product(media_root)
+    call_command("generate_renditions", workers=2, stdout=StringIO())
+    assert ImageRendition.objects.filter(format="webp").count() == 3
+
+
+@pytest.mark.django_db
+def test_generate_renditions_skips_decompression_bombs(media_root, monkeypatch):
+    """Test that an image too large to decode is skipped rather than aborting the run."""
+    create_product(media_root)
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 1000)
+    err = StringIO()
+    call_command("generate_renditions", workers=0, stdout=StringIO(), stderr=err)
+    assert "Skipping product_heroes/hero.png" in err.getvalue()
+    assert not ImageRendition.objects.exists()
+
+
+@pytest.mark.django_db
+def test_responsive_image_tag(media_root):
+    """Test that the responsive_image tag offers renditions and falls back to a plain img."""
+    product = create_product(media_root)
+    template = Template('{% load image_tags %}{% responsive_image product.hero_image "Robodog" class="hero" %}')
+
+    html = template.render(Context({"product": product}))
+    assert html == '<img src="/media/product_heroes/hero.png" alt="Robodog" class="hero">'
+
+    call_command("generate_renditions", workers=0, stdout=StringIO())
+    html = template.render(Context({"product": product}))
+    assert html.startswith("<picture>")
+    assert '<source type="image/webp" srcset="/media/renditions/' in html
+    assert "-200w.webp 200w, " in html
+    assert html.endswith('<img src="/media/product_heroes/hero.png" alt="Robodog" class="hero"></picture>')
+
+
+@pytest.mark.django_db
+def test_background_image_tag(media_root):
+    """Test that the background_image tag picks the narrowest rendition wide enough."""
+    create_product(media_root)
+    call_command("generate_renditions", workers=0, stdout=StringIO())
+    template = Template("{% load image_tags %}{% background_image 'product_heroes/hero.png' width=300 %}")
+
+    css = template.render(Context())
+    assert css.startswith("background-image: url(/media/product_heroes/hero.png);")
+    assert "-400w.webp) type('image/webp')" in css
+    assert '"' not in css
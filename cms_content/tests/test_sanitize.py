@@ -0,0 +1,49 @@
+import json
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from cms_content.sanitize import ExportError, sanitize_stream
+
+DIRTY = '{"text": "line one\nline\x01 two\\n \\u00e9\\"", "n": [1, -2.5e3, true, null]\x0c}\n'
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 20])
+def test_sanitize_keeps_escapes_and_newlines(chunk_size):
+    """Test that raw newlines in strings are escaped, stray control characters dropped and escapes kept."""
+    target = StringIO()
+    stats = sanitize_stream(BytesIO(DIRTY.encode()), target, chunk_size)
+    assert json.loads(target.getvalue()) == {"text": 'line one\nline two\n é"', "n": [1, -2500.0, True, None]}
+    assert (stats.dropped, stats.escaped) == (2, 1)
+
+
+@pytest.mark.parametrize("text, message", [
+    ('{"a": [1}', "Unbalanced }"),
+    ('{"a": "\\x"}', "Invalid escape"),
+    ('{"a": "\\u00g0"}', r"Invalid \\u escape"),
+    ('{"a": "open', "Unterminated string"),
+    ('{"a": 1', "Unclosed {"),
+    ('{"a": <b>}', "Unexpected '<'"),
+])
+def test_sanitize_rejects_invalid_json(text, message):
+    """Test that structural errors are reported with their position."""
+    with pytest.raises(ExportError, match=message):
+        sanitize_stream(BytesIO(text.encode()), StringIO(), 4)
+
+
+def test_clean_export_replaces_file_atomically(tmp_path):
+    """Test that the command cleans in place and leaves an invalid export untouched."""
+    export = tmp_path / "extracted_content.json"
+    export.write_text(DIRTY)
+    out = StringIO()
+    call_command("clean_export", str(export), stdout=out)
+    assert "2 control characters dropped, 1 escaped" in out.getvalue()
+    assert json.loads(export.read_text())["text"] == 'line one\nline two\n é"'
+
+    export.write_text('{"a": [1, 2}')
+    with pytest.raises(CommandError, match="not valid JSON"):
+        call_command("clean_export", str(export), stdout=StringIO())
+    assert export.read_text() == '{"a": [1, 2}'
+    assert [path.name for path in tmp_path.iterdir()] == ["extracted_content.json"]
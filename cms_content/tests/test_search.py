@@ -0,0 +1,140 @@
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from cms_content.models import Blog, Product, SearchDocument, Service
+from cms_content.search import get_search_backend
+from cms_content.search.backends import DatabaseSearchBackend, UnionSearchBackend
+
+
+def create_product(name, short_description, url_slug):
+    return Product.objects.create(
+        name=name,
+        short_description=short_description,
+        hero_image="product_heroes/test_hero.jpg",
+        hero_image_alt_text=name,
+        main_description="Main description.",
+        url_slug=url_slug,
+    )
+
+
+@pytest.mark.django_db
+def test_search_documents_follow_saves_and_deletes():
+    """Test that signals keep the search documents in step with the source rows."""
+    product = create_product("Robodogs", "Quadruped inspection robots.", "robodogs")
+    document = SearchDocument.objects.get(kind="product", object_id=product.pk)
+    assert document.title == "Robodogs"
+    assert document.url == "/products/robodogs/"
+
+    product.name = "Robodogs Mk II"
+    product.save()
+    assert SearchDocument.objects.get(kind="product", object_id=product.pk).title == "Robodogs Mk II"
+
+    product.delete()
+    assert not SearchDocument.objects.filter(kind="product").exists()
+
+
+@pytest.mark.django_db
+def test_search_ranks_title_matches_first():
+    """Test that a title hit outranks a body hit and that prefixes match."""
+    create_product("Crowd Monitoring", "Counting people.", "crowd-monitoring")
+    Service.objects.create(
+        name="Mapping",
+        short_description="Mapping for crowd events.",
+        image="service_images/test.jpg",
+        image_alt_text="Mapping",
+        url_slug="mapping",
+    )
+    results = get_search_backend().search("crow")
+    assert [result.title for result in results] == ["Crowd Monitoring", "Mapping"]
+
+
+@pytest.mark.django_db
+def test_search_indexes_blog_text_without_markup():
+    """Test that blog bodies are searchable and stripped of HTML."""
+    Blog.objects.create(
+        title="Field Report",
+        author="Test Author",
+        publish_date=date(2025, 7, 1),
+        image="blog_images/test.jpg",
+        image_alt_text="Field",
+        content="<p>Our <strong>drones</strong> mapped the estate.</p>",
+        url_slug="field-report",
+    )
+    results = get_search_backend().search("drones")
+    assert [result.title for result in results] == ["Field Report"]
+    assert results[0].excerpt == "Our drones mapped the estate."
+
+
+@pytest.mark.django_db
+def test_search_ignores_query_syntax():
+    """Test that FTS operators in user input are treated as plain words."""
+    create_product("Robodogs", "Quadruped inspection robots.", "robodogs")
+    assert get_search_backend().search('robo"*) ^')[0].title == "Robodogs"
+    assert get_search_backend().search('"()*').count() == 0
+
+
+@pytest.mark.django_db
+def test_search_results_are_counted_and_sliced_lazily(django_assert_num_queries):
+    """Test that results load only the requested slice."""
+    for i in range(5):
+        create_product(f"Drone {i}", "Aerial survey.", f"drone-{i}")
+    with django_assert_num_queries(0):
+        results = get_search_backend().search("drone")
+    with django_assert_num_queries(1):
+        assert results.count() == 5
+    with django_assert_num_queries(1):
+        page = results[3:10]
+    assert len(page) == 2
+    assert len({result.object_id for result in results[:3]} | {result.object_id for result in page}) == 5
+
+
+@pytest.mark.django_db
+def test_database_search_backend():
+    """Test the portable fallback backend."""
+    create_product("Robodogs", "Quadruped inspection robots.", "robodogs")
+    results = DatabaseSearchBackend().search("quadruped robo")
+    assert [result.title for result in results] == ["Robodogs"]
+
+
+@pytest.mark.django_db
+def test_rebuild_search_index_command():
+    """Test that rebuild_search_index recreates documents for rows saved without signals."""
+    Product.objects.bulk_create([
+        Product(name="Bulk Product", short_description="Imported.", hero_image="x.jpg",
+                hero_image_alt_text="x", main_description="x", url_slug="bulk-product"),
+    ])
+    assert get_search_backend().search("bulk").count() == 0
+
+    out = StringIO()
+    call_command("rebuild_search_index", stdout=out)
+    assert "Indexed 1 documents" in out.getvalue()
+    assert [result.title for result in get_search_backend().search("bulk")] == ["Bulk Product"]
+
+
+@pytest.mark.django_db
+def test_union_search_backend(django_assert_num_queries):
+    """Test that the UNION ALL backend searches every source table in one query."""
+    create_product("Survey Drone", "Aerial survey.", "survey-drone")
+    Blog.objects.create(
+        title="Drone Diaries",
+        author="Test Author",
+        publish_date=date(2025, 7, 1),
+        image="blog_images/test.jpg",
+        image_alt_text="Diaries",
+        content="<p>Flying <em>drones</em> over the estate.</p>" + "x" * 1000,
+        url_slug="drone-diaries",
+    )
+    SearchDocument.objects.all().delete()
+
+    results = UnionSearchBackend().search("drone")
+    with django_assert_num_queries(1):
+        page = results[0:10]
+    assert [(result.kind, result.title, result.url) for result in page] == [
+        ("blog", "Drone Diaries", "/blog/drone-diaries/"),
+        ("product", "Survey Drone", "/products/survey-drone/"),
+    ]
+    assert page[0].excerpt.startswith("Flying drones over the estate.")
+    assert len(page[0].excerpt) <= 300
+    assert results.count() == 2
@@ -0,0 +1,93 @@
+import pytest
+from cms_content.models import ContentVersion, Product, SearchDocument, Service
+from cms_content.search import get_search_backend, reset_search_backend
+from cms_content.versioning import forget_content_version
+
+
+@pytest.fixture
+def memory_backend(settings):
+    settings.SEARCH_BACKEND = "cms_content.search.memory.InMemorySearchBackend"
+    reset_search_backend()
+    yield get_search_backend()
+    reset_search_backend()
+
+
+def create_product(name, short_description, url_slug):
+    return Product.objects.create(
+        name=name,
+        short_description=short_description,
+        hero_image="product_heroes/test_hero.jpg",
+        hero_image_alt_text=name,
+        main_description="Main description.",
+        url_slug=url_slug,
+    )
+
+
+@pytest.mark.django_db
+def test_memory_search_ranks_and_prefix_matches(memory_backend):
+    """Test BM25 ranking, prefix expansion and AND semantics."""
+    create_product("Crowd Monitoring", "Counting people in crowds.", "crowd-monitoring")
+    create_product("Robodogs", "Inspection robots for crowd control.", "robodogs")
+    create_product("UAVs", "Aerial survey drones.", "uavs")
+
+    results = memory_backend.search("crowd")
+    assert [result.title for result in results] == ["Crowd Monitoring", "Robodogs"]
+    assert [result.title for result in memory_backend.search("insp crow")] == ["Robodogs"]
+    assert memory_backend.search("crowd drones").count() == 0
+    assert results[0].get_absolute_url() == "/products/crowd-monitoring/"
+
+
+@pytest.mark.django_db
+def test_memory_search_answers_without_queries(memory_backend, django_assert_num_queries):
+    """Test that a warm index serves searches from memory."""
+    create_product("Robodogs", "Inspection robots.", "robodogs")
+    memory_backend.search("robodogs")
+    with django_assert_num_queries(0):
+        assert len(memory_backend.search("inspection")) == 1
+
+
+@pytest.mark.django_db
+def test_memory_search_updates_incrementally(memory_backend, django_assert_max_num_queries):
+    """Test that saves and deletes update a warm index in place."""
+    product = create_product("Robodogs", "Inspection robots.", "robodogs")
+    memory_backend.search("robodogs")
+
+    product.name = "Quadrupeds"
+    product.save()
+    Service.objects.create(name="Quadruped Hire", short_description="Rent one.", image="s.jpg",
+                           image_alt_text="Hire", url_slug="quadruped-hire")
+
+    with django_assert_max_num_queries(1):
+        titles = [result.title for result in memory_backend.search("quadruped")]
+    assert sorted(titles) == ["Quadruped Hire", "Quadrupeds"]
+    assert memory_backend.search("robodogs").count() == 0
+
+    product.delete()
+    assert [result.title for result in memory_backend.search("quadruped")] == ["Quadruped Hire"]
+    assert not SearchDocument.objects.exists()
+
+
+@pytest.mark.django_db
+def test_memory_search_rebuilds_after_external_change(memory_backend):
+    """Test that a write made by another worker triggers a rebuild."""
+    memory_backend.search("robodogs")
+    Product.objects.bulk_create([
+        Product(name="Robodogs", short_description="Imported.", hero_image="x.jpg",
+                hero_image_alt_text="x", main_description="x", url_slug="robodogs"),
+    ])
+    ContentVersion.objects.update(version=ContentVersion.objects.get().version + 1)
+    forget_content_version()
+
+    assert [result.title for result in memory_backend.search("robodogs")] == ["Robodogs"]
+
+
+@pytest.mark.django_db
+def test_memory_search_compacts_tombstones(memory_backend):
+    """Test that repeated updates do not grow the index without bound."""
+    product = create_product("Robodogs", "Inspection robots.", "robodogs")
+    memory_backend.search("robodogs")
+    for i in range(200):
+        product.short_description = f"Revision {i}."
+        product.save()
+    assert len(memory_backend._documents) < 100
+    assert [result.title for result in memory_backend.search("revision 199")] == ["Robodogs"]
@@ -0,0 +1,55 @@
+import pytest
+from django.urls import reverse
+from cms_content.models import CaseStudy, Product
+from cms_content.search.suggest import SuggestionIndex, suggest
+
+
+def test_suggestion_index_prefers_title_prefix_matches():
+    """Test that whole-title prefix matches come before later-word matches."""
+    index = SuggestionIndex(1, [
+        ("product", "Crowd Monitoring", "/products/crowd-monitoring/"),
+        ("product", "Monitoring Stations", "/products/monitoring-stations/"),
+        ("service", "Mobile Mapping", "/service/mobile-mapping/"),
+    ])
+    assert [title for _kind, title, _url in index.suggest("mo", 10)] == [
+        "Mobile Mapping", "Monitoring Stations", "Crowd Monitoring",
+    ]
+    assert [title for _kind, title, _url in index.suggest("  CROWD   mon", 10)] == ["Crowd Monitoring"]
+    assert index.suggest("mo", 1) == [("service", "Mobile Mapping", "/service/mobile-mapping/")]
+    assert index.suggest("", 10) == []
+
+
+@pytest.mark.django_db
+def test_suggestions_rebuilt_on_content_change(django_assert_num_queries):
+    """Test that suggestions are served from memory and refreshed after a save."""
+    assert suggest("robo", 5) == []
+    Product.objects.create(
+        name="Robodogs",
+        short_description="Quadrupeds.",
+        hero_image="product_heroes/test_hero.jpg",
+        hero_image_alt_text="Robodogs",
+        main_description="Main description.",
+        url_slug="robodogs",
+    )
+    assert suggest("robo", 5) == [("product", "Robodogs", "/products/robodogs/")]
+    with django_assert_num_queries(0):
+        suggest("rob", 5)
+
+
+@pytest.mark.django_db
+def test_search_suggest_endpoint(client):
+    """Test the JSON typeahead endpoint."""
+    CaseStudy.objects.create(
+        title="Mangrove Mapping",
+        short_description="Mapping mangroves.",
+        image="case_studies/test.jpg",
+        image_alt_text="Mangroves",
+        url_slug="mangrove-mapping",
+    )
+    response = client.get(reverse("pages:search_suggest"), {"q": "mang", "limit": 50})
+    assert response.status_code == 200
+    assert response.json() == {
+        "query": "mang",
+        "suggestions": [{"type": "case_study", "title": "Mangrove Mapping", "url": "/case-studies/"}],
+    }
+    assert client.get(reverse("pages:search_suggest"), {"q": "mang", "limit": "x"}).status_code == 200
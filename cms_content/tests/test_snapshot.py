@@ -0,0 +1,45 @@
+import pytest
+from cms_content.models import ContentVersion, Feature, PageContent, CallToAction
+from cms_content.snapshot import get_snapshot
+from cms_content.versioning import get_content_version
+
+
+@pytest.mark.django_db
+def test_content_version_bumped_on_save_and_delete():
+    """Test that content writes bump the shared version row."""
+    start = get_content_version()
+    feature = Feature.objects.create(title="Autonomy", description="Self-driving.", icon_class="fa fa-cogs")
+    assert get_content_version() == start + 1
+    feature.delete()
+    assert ContentVersion.objects.get().version == start + 2
+
+
+@pytest.mark.django_db
+def test_snapshot_is_reused_while_version_is_unchanged(django_assert_num_queries):
+    """Test that a warm snapshot is served from memory."""
+    Feature.objects.create(title="Autonomy", description="Self-driving.", icon_class="fa fa-cogs")
+    snapshot = get_snapshot()
+    with django_assert_num_queries(0):
+        assert get_snapshot() is snapshot
+    assert [feature.title for feature in snapshot.features] == ["Autonomy"]
+
+
+@pytest.mark.django_db
+def test_snapshot_rebuilt_after_content_change():
+    """Test that a content write makes the next read rebuild the snapshot."""
+    get_snapshot()
+    cta = PageContent.objects.create(page_name="about", section_identifier="cta_section", title="Talk to us")
+    CallToAction.objects.create(page_content=cta, button_text="Contact", button_url="https://example.com", order=1)
+
+    section = get_snapshot().page("about")["cta_section"]
+    assert section.title == "Talk to us"
+    assert [button.button_text for button in section.call_to_actions] == ["Contact"]
+
+
+@pytest.mark.django_db
+def test_snapshot_rebuilt_when_another_worker_bumps_version(settings):
+    """Test that a version bump made elsewhere is picked up once the TTL lapses."""
+    settings.CONTENT_VERSION_TTL = 0
+    snapshot = get_snapshot()
+    ContentVersion.objects.update(version=snapshot.version + 10)
+    assert get_snapshot().version == snapshot.version + 10
@@ -0,0 +1,122 @@
+import os
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from cms_content.thumbnails import evict, thumbnail_url
+
+
+@pytest.fixture
+def thumbnail_settings(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path / "media"
+    settings.THUMBNAIL_CACHE_DIR = str(tmp_path / "thumbs")
+    settings.THUMBNAIL_SIZES = ["200x200"]
+    (tmp_path / "media" / "product_heroes").mkdir(parents=True)
+    buffer = BytesIO()
+    Image.new("RGB", (800, 400), "teal").save(buffer, "JPEG")
+    (tmp_path / "media" / "product_heroes" / "hero.jpg").write_bytes(buffer.getvalue())
+    return settings
+
+
+def cached_files(settings):
+    return [path for path in Path(settings.THUMBNAIL_CACHE_DIR).rglob("*") if path.is_file()]
+
+
+@pytest.mark.django_db
+def test_thumbnail_is_rendered_once_and_cached(client, thumbnail_settings):
+    """Test that a thumbnail fits the requested box and later hits come from the disk cache."""
+    url = thumbnail_url("product_heroes/hero.jpg", 200, 200)
+    response = client.get(url, HTTP_ACCEPT="image/webp,*/*")
+    assert response.status_code == 200
+    assert response["Content-Type"] == "image/webp"
+    assert response["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert "Accept" in response["Vary"]
+    with Image.open(BytesIO(b"".join(response.streaming_content))) as image:
+        assert image.size == (200, 100)
+
+    [cached] = cached_files(thumbnail_settings)
+    os.utime(cached, (0, 0))
+    response = client.get(url, HTTP_ACCEPT="image/webp,*/*")
+    assert response.status_code == 200
+    assert cached_files(thumbnail_settings) == [cached]
+    assert cached.stat().st_mtime > 0
+
+    response = client.get(url, HTTP_ACCEPT="image/*")
+    assert response["Content-Type"] == "image/jpeg"
+    assert len(cached_files(thumbnail_settings)) == 2
+
+
+@pytest.mark.django_db
+def test_thumbnail_rejects_bad_requests(client, thumbnail_settings):
+    """Test that sizes outside THUMBNAIL_SIZES, traversal and missing files are 404s."""
+    version = thumbnail_url("product_heroes/hero.jpg", 200, 200).split("/")[4]
+    assert client.get(f"/media/thumb/5000x200/{version}/product_heroes/hero.jpg").status_code == 404
+    assert client.get(f"/media/thumb/201x200/{version}/product_heroes/hero.jpg").status_code == 404
+    assert not cached_files(thumbnail_settings)
+
+    assert client.get("/media/thumb/200x200/0/../settings.py").status_code == 404
+    assert client.get("/media/thumb/200x200/0/product_heroes/../../secret.jpg").status_code == 404
+    assert client.get("/media/thumb/200x200/0/product_heroes/missing.jpg").status_code == 404
+    assert client.get(thumbnail_url("css/helper.css", 200, 200)).status_code == 404
+
+
+@pytest.mark.django_db
+def test_replaced_image_gets_new_thumbnail_url(client, thumbnail_settings):
+    """Test that replacing a source changes its thumbnail URL and old URLs redirect to the new one."""
+    old_url = thumbnail_url("product_heroes/hero.jpg", 200, 200)
+    assert client.get(old_url).status_code == 200
+
+    hero = thumbnail_settings.MEDIA_ROOT / "product_heroes" / "hero.jpg"
+    buffer = BytesIO()
+    Image.new("RGB", (400, 400), "red").save(buffer, "JPEG")
+    hero.write_bytes(buffer.getvalue())
+    new_url = thumbnail_url("product_heroes/hero.jpg", 200, 200)
+    assert new_url != old_url
+
+    response = client.get(old_url)
+    assert response.status_code == 302
+    assert response["Location"] == new_url
+    response = client.get(new_url)
+    with Image.open(BytesIO(b"".join(response.streaming_content))) as image:
+        assert image.size == (200, 200)
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    """Test that eviction deletes the oldest files until the cache is under its limit."""
+    bucket = tmp_path / "ab"
+    bucket.mkdir()
+    for age, name in enumerate(["newest", "middle", "oldest"]):
+        path = bucket / name
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (1000 - age, 1000 - age))
+
+    assert evict(tmp_path, 300) == 0
+    assert evict(tmp_path, 250) == 1
+    assert sorted(path.name for path in bucket.iterdir()) == ["middle", "newest"]
+
+
+@pytest.mark.django_db
+def test_thumbnail_misses_scan_the_cache_only_after_enough_writes(client, thumbnail_settings, monkeypatch):
+    """Test that misses evict only once this process has written a tenth of the limit, and prune_thumbnails on demand."""
+    from io import StringIO
+    from django.core.management import call_command
+    from cms_content import thumbnails
+
+    scans = []
+    monkeypatch.setattr(thumbnails, "evict", lambda directory, max_bytes: scans.append(max_bytes) or 0)
+    monkeypatch.setattr(thumbnails, "_written", 0)
+    thumbnail_settings.THUMBNAIL_CACHE_MAX_BYTES = 10_000_000
+    assert client.get(thumbnail_url("product_heroes/hero.jpg", 200, 200)).status_code == 200
+    assert scans == []
+
+    thumbnail_settings.THUMBNAIL_CACHE_MAX_BYTES = 100
+    assert client.get(thumbnail_url("product_heroes/hero.jpg", 200, 200), HTTP_ACCEPT="image/webp").status_code == 200
+    assert scans == [100]
+    monkeypatch.undo()
+
+    out = StringIO()
+    call_command("prune_thumbnails", "--max-bytes", "0", stdout=out)
+    assert "Removed 2 thumbnails" in out.getvalue()
+    assert not cached_files(thumbnail_settings)
@@ -0,0 +1,159 @@
+"""On-demand thumbnails kept in a size-capped disk cache.
+
+A cache hit touches the file's mtime, so evicting the oldest mtimes first
+drops the least recently used thumbnails. Measuring the cache means scanning
+it, so a process only does that after it has itself written another tenth of
+the limit; prune_thumbnails does it on demand. Only images on the local disk
+(FileSystemStorage media and static files) can be thumbnailed.
+"""
+import hashlib
+import os
+import posixpath
+import tempfile
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import default_storage
+from django.urls import reverse
+
+from .imaging import MIME_TYPES, render_thumbnail, supported_formats
+
+# Evicting down to this fraction of the limit leaves room for a run of misses.
+EVICT_TO = 0.9
+
+# Bytes this process has added to the cache since it last scanned it.
+_written = 0
+_written_lock = threading.Lock()
+
+
+def is_allowed_size(width, height):
+    return f'{width}x{height}' in settings.THUMBNAIL_SIZES
+
+
+def thumbnail_url(name, width, height):
+    """URL of name's thumbnail. It carries the source's version, so it changes when the file does."""
+    if not is_allowed_size(width, height):
+        raise ValueError(f'{width}x{height} is not one of THUMBNAIL_SIZES.')
+    return reverse('cms_content:thumbnail', kwargs={
+        'width': width, 'height': height, 'version': source_version(name) or '0', 'path': name,
+    })
+
+
+def is_safe_name(name):
+    return bool(name) and posixpath.normpath(name) == name and not name.startswith(('/', '../')) and name != '..'
+
+
+def local_source(name):
+    """Return the filesystem path of a media or static image, or None."""
+    try:
+        if default_storage.exists(name):
+            return default_storage.path(name)
+        return finders.find(name)
+    except (SuspiciousFileOperation, NotImplementedError):
+        return None
+
+
+def source_version(name):
+    """Short token that changes whenever the image at name is replaced, or None if there is none."""
+    source = local_source(name) if is_safe_name(name) else None
+    if source is None:
+        return None
+    stat = os.stat(source)
+    return hashlib.sha1(f'{stat.st_mtime_ns}:{stat.st_size}'.encode()).hexdigest()[:10]
+
+
+def negotiate_format(accept, name):
+    """Pick the best format the client accepts, falling back to the source's own kind."""
+    for image_format in supported_formats():
+        if MIME_TYPES[image_format] in accept:
+            return image_format
+    return 'png' if name.lower().endswith(('.png', '.gif', '.webp', '.avif')) else 'jpeg'
+
+
+def cache_path(source, width, height, image_format):
+    # The source's mtime is part of the key, so replacing a file misses the old entry.
+    key = f'{source}\0{os.stat(source).st_mtime_ns}\0{width}x{height}\0{image_format}'
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return Path(settings.THUMBNAIL_CACHE_DIR, digest[:2], f'{digest}.{image_format}')
+
+
+def write_atomic(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as temp_file:
+            temp_file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def evict(directory, max_bytes):
+    """Delete least recently used thumbnails until the cache fits. Returns the number deleted."""
+    entries = []
+    total = 0
+    with os.scandir(directory) as buckets:
+        for bucket in buckets:
+            if not bucket.is_dir():
+                continue
+            with os.scandir(bucket.path) as files:
+                for entry in files:
+                    if entry.name.startswith('.tmp'):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    total += stat.st_size
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    if total <= max_bytes:
+        return 0
+    removed = 0
+    for _mtime, size, path in sorted(entries):
+        if total <= max_bytes * EVICT_TO:
+            break
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+        total -= size
+    return removed
+
+
+def note_written(size):
+    """Count size bytes added to the cache, evicting once they fill the room the last eviction left."""
+    global _written
+    with _written_lock:
+        _written += size
+        if _written < settings.THUMBNAIL_CACHE_MAX_BYTES * (1 - EVICT_TO):
+            return False
+        _written = 0
+    evict(settings.THUMBNAIL_CACHE_DIR, settings.THUMBNAIL_CACHE_MAX_BYTES)
+    return True
+
+
+def get_thumbnail(name, width, height, image_format):
+    """Return the path of a cached thumbnail, rendering it on a miss.
+
+    Returns None if name is not a local image.
+    """
+    if not is_safe_name(name):
+        return None
+    source = local_source(name)
+    if source is None:
+        return None
+    path = cache_path(source, width, height, image_format)
+    try:
+        os.utime(path)
+        return path
+    except FileNotFoundError:
+        pass
+    data = render_thumbnail(source, width, height, image_format, settings.IMAGE_RENDITION_QUALITY)
+    write_atomic(path, data)
+    note_written(len(data))
+    return path
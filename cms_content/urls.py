@@ -7,4 +7,5 @@ urlpatterns = [
     path('case-studies/', views.case_studies, name='case_studies'),
     path('white-papers/', views.white_papers, name='white_papers'),
     path('blog/<slug:slug>/', views.blog_detail, name='blog_detail'),
+    path('media/thumb/<int:width>x<int:height>/<str:version>/<path:path>', views.thumbnail, name='thumbnail'),
 ]
@@ -0,0 +1,55 @@
+import time
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ContentVersion
+
+CONTENT_VERSION_PK = 1
+# The version the row is created with, by its migration or on first use.
+INITIAL_CONTENT_VERSION = ContentVersion._meta.get_field('version').default
+
+# (version, monotonic time it was read) for this process.
+_cached = (None, 0.0)
+
+
+def get_content_version():
+    """Return the current content version.
+
+    The row is re-read at most once per CONTENT_VERSION_TTL seconds per
+    process, so steady-state requests usually cost no query at all.
+    """
+    global _cached
+    version, checked_at = _cached
+    now = time.monotonic()
+    if version is None or now - checked_at >= settings.CONTENT_VERSION_TTL:
+        version = (
+            ContentVersion.objects.filter(pk=CONTENT_VERSION_PK).values_list('version', flat=True).first()
+        ) or 0
+        _cached = (version, now)
+    return version
+
+
+def bump_content_version(using=None):
+    """Increment the content version on the connection doing the write.
+
+    Called from post_save/post_delete, this runs inside the writer's
+    transaction, so other workers see the new version exactly when they can
+    see the new content.
+    """
+    updated = ContentVersion.objects.using(using).filter(pk=CONTENT_VERSION_PK).update(
+        version=F('version') + 1, updated_at=timezone.now()
+    )
+    if not updated:
+        # The row is missing, so this write is the first one past the initial version.
+        ContentVersion.objects.using(using).get_or_create(
+            pk=CONTENT_VERSION_PK, defaults={'version': INITIAL_CONTENT_VERSION + 1}
+        )
+    forget_content_version()
+
+
+def forget_content_version():
+    """Drop this process's cached version so the next read hits the database."""
+    global _cached
+    _cached = (None, 0.0)
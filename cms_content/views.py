@@ -1,14 +1,60 @@
-from django.shortcuts import render, get_object_or_404
+from django.http import FileResponse, Http404
+from django.shortcuts import aget_object_or_404, redirect
+from django.template.response import TemplateResponse
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.http import require_GET
+from PIL import Image, UnidentifiedImageError
+
+from .conditional import blog_last_modified, case_studies_last_modified, content_condition, white_papers_last_modified
+from .imaging import FALLBACK_MIME_TYPES, MIME_TYPES
 from .models import CaseStudy, WhitePaper, Blog
+from .thumbnails import get_thumbnail, is_allowed_size, negotiate_format, source_version, thumbnail_url
+
+# These views are async and return unrendered responses: the template, which may
+# still query the database, is rendered by the handler in a thread.
+
+@content_condition(case_studies_last_modified)
+async def case_studies(request):
+    case_studies = [case_study async for case_study in CaseStudy.objects.all()]
+    return TemplateResponse(request, 'pages/case_studies.html', {'case_studies': case_studies})
+
+@content_condition(white_papers_last_modified)
+async def white_papers(request):
+    white_papers = [white_paper async for white_paper in WhitePaper.objects.all()]
+    return TemplateResponse(request, 'pages/white_papers.html', {'white_papers': white_papers})
 
-def case_studies(request):
-    case_studies = CaseStudy.objects.all()
-    return render(request, 'pages/case_studies.html', {'case_studies': case_studies})
+@content_condition(blog_last_modified)
+async def blog_detail(request, slug):
+    blog_post = await aget_object_or_404(Blog, url_slug=slug)
+    return TemplateResponse(request, 'pages/blog-details-left-sidebar.html', {'blog_post': blog_post})
 
-def white_papers(request):
-    white_papers = WhitePaper.objects.all()
-    return render(request, 'pages/white_papers.html', {'white_papers': white_papers})
+@require_GET
+def thumbnail(request, width, height, version, path):
+    """Serve a media or static image scaled to fit width x height.
 
-def blog_detail(request, slug):
-    blog_post = get_object_or_404(Blog, url_slug=slug)
-    return render(request, 'pages/blog-details-left-sidebar.html', {'blog_post': blog_post})
+    Thumbnails come from a disk cache and are rendered on a miss. Only the
+    sizes in THUMBNAIL_SIZES are served. The URL carries the source's
+    version, so responses can be cached forever; an old version redirects
+    to the current one. The format follows the Accept header, so the
+    response varies on it.
+    """
+    if not is_allowed_size(width, height):
+        raise Http404('Thumbnail size not allowed.')
+    current = source_version(path)
+    if current is None:
+        raise Http404('Image not found.')
+    if version != current:
+        return redirect(thumbnail_url(path, width, height))
+    image_format = negotiate_format(request.headers.get('Accept', ''), path)
+    try:
+        thumbnail_path = get_thumbnail(path, width, height, image_format)
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        raise Http404('Not an image.')
+    if thumbnail_path is None:
+        raise Http404('Image not found.')
+    response = FileResponse(
+        open(thumbnail_path, 'rb'), content_type={**MIME_TYPES, **FALLBACK_MIME_TYPES}[image_format]
+    )
+    response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    patch_vary_headers(response, ['Accept'])
+    return response
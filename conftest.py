@@ -0,0 +1,23 @@
+import pytest
+from django.core.cache import cache
+
+from cms_content.conditional import clear_last_modified
+from cms_content.renditions import clear_rendition_map
+from cms_content.search.suggest import clear_suggestion_index
+from cms_content.snapshot import clear_snapshot
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Keep cached pages, fragments and in-process indexes from leaking between tests."""
+    cache.clear()
+    clear_snapshot()
+    clear_suggestion_index()
+    clear_rendition_map()
+    clear_last_modified()
+    yield
+    cache.clear()
+    clear_snapshot()
+    clear_suggestion_index()
+    clear_rendition_map()
+    clear_last_modified()
@@ -0,0 +1,15 @@
+"""Gunicorn settings for serving sitecore.asgi through uvicorn workers.
+
+Each worker runs an event loop, so a request waiting on a slow client or on
+the database no longer holds a whole worker process.
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+worker_class = 'uvicorn_worker.UvicornWorker'
+# Requests are answered in under a second; anything far slower is stuck.
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = 30
+keepalive = 5
+accesslog = '-'
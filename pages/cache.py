@@ -0,0 +1,58 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+from cms_content.versioning import get_content_version
+
+
+def page_cache_key(request, version):
+    return f'pages:page:{version}:{request.path}'
+
+
+def is_cacheable(request):
+    # Query strings are left out of the key, so such requests are never
+    # cached; otherwise every ?utm_... variant would be a new entry.
+    return request.method in ('GET', 'HEAD') and not request.META.get('QUERY_STRING')
+
+
+class CachedPageMixin:
+    """Serve anonymous GET requests from a full-page cache.
+
+    Entries are keyed by the request path and the current CMS content
+    version, so any content save or delete makes every cached page stale
+    without having to track which page read which rows. Requests with a
+    query string are always rendered.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.view_is_async:
+            return self.adispatch(request, *args, **kwargs)
+        if not is_cacheable(request) or request.user.is_authenticated:
+            return super().dispatch(request, *args, **kwargs)
+
+        key = page_cache_key(request, get_content_version())
+        response = cache.get(key)
+        if response is not None:
+            return response
+        return self.cache_response(key, super().dispatch(request, *args, **kwargs))
+
+    async def adispatch(self, request, *args, **kwargs):
+        # Async views must not touch the session or database from the event loop.
+        if not is_cacheable(request) or (await request.auser()).is_authenticated:
+            return await super().dispatch(request, *args, **kwargs)
+
+        key = page_cache_key(request, await sync_to_async(get_content_version)())
+        response = await cache.aget(key)
+        if response is not None:
+            return response
+        return self.cache_response(key, await super().dispatch(request, *args, **kwargs))
+
+    def cache_response(self, key, response):
+        if response.status_code == 200:
+            if hasattr(response, 'render') and callable(response.render):
+                response.add_post_render_callback(
+                    lambda r: cache.set(key, r, settings.PAGE_CACHE_TIMEOUT)
+                )
+            else:
+                cache.set(key, response, settings.PAGE_CACHE_TIMEOUT)
+        return response
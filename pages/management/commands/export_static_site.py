@@ -0,0 +1,107 @@
+import gzip
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.urls import reverse
+
+import cms_content.urls
+import pages.urls
+from cms_content.models import Blog, Product, Service
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+URL_MODULES = (pages.urls, cms_content.urls)
+
+# Slug routes and the rows that expand them: url name -> (model, slug field).
+SLUG_SOURCES = {
+    'pages:product_detail': (Product, 'url_slug'),
+    'pages:service_detail': (Service, 'url_slug'),
+    'cms_content:blog_detail': (Blog, 'url_slug'),
+}
+
+
+def public_paths():
+    """Yield the path of every public page, expanding slug routes from the database."""
+    for module in URL_MODULES:
+        for pattern in module.urlpatterns:
+            if not pattern.name:
+                continue
+            name = f'{module.app_name}:{pattern.name}'
+            converters = pattern.pattern.converters
+            if not converters:
+                yield reverse(name)
+            elif name in SLUG_SOURCES and len(converters) == 1:
+                model, field = SLUG_SOURCES[name]
+                kwarg = next(iter(converters))
+                for slug in model.objects.order_by('pk').values_list(field, flat=True):
+                    yield reverse(name, kwargs={kwarg: slug})
+
+
+def output_path(output_dir, path):
+    return Path(output_dir, path.lstrip('/'), 'index.html')
+
+
+def write_atomic(target, content):
+    """Write content to target via a temporary file in the same directory."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f'.{target.name}.')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(content)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, target)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def default_host():
+    for host in settings.ALLOWED_HOSTS:
+        if host != '*' and not host.startswith('.'):
+            return host
+    return 'localhost'
+
+
+class Command(BaseCommand):
+    help = 'Pre-renders every public page to HTML files that can be served without Django.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('output_dir', nargs='?', default=os.path.join(settings.BASE_DIR, 'site_export'),
+                            help='Directory to write the rendered site to.')
+        parser.add_argument('--host', default=None, help='Host name to render pages for.')
+        parser.add_argument('--no-compress', action='store_true',
+                            help='Do not write .gz/.br variants next to each page.')
+
+    def handle(self, *args, **options):
+        output_dir = options['output_dir']
+        client = Client(HTTP_HOST=options['host'] or default_host())
+        secure = getattr(settings, 'SECURE_SSL_REDIRECT', False)
+
+        written = skipped = 0
+        for path in public_paths():
+            response = client.get(path, secure=secure)
+            if response.status_code != 200:
+                self.stdout.write(self.style.WARNING(f'Skipped {path}: HTTP {response.status_code}'))
+                skipped += 1
+                continue
+            if not response.get('Content-Type', '').startswith('text/html'):
+                # Endpoints such as search suggestions need Django at request time.
+                skipped += 1
+                continue
+
+            target = output_path(output_dir, path)
+            write_atomic(target, response.content)
+            if not options['no_compress']:
+                write_atomic(target.with_name(target.name + '.gz'), gzip.compress(response.content, 9, mtime=0))
+                if brotli is not None:
+                    write_atomic(target.with_name(target.name + '.br'), brotli.compress(response.content))
+            written += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Exported {written} pages to {output_dir} ({skipped} skipped).'))
@@ -0,0 +1,104 @@
+import re
+import textwrap
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+STYLE_RE = re.compile(r'^[ \t]*<style(?P<attrs>[^>]*)>(?P<css>.*?)</style>[ \t]*\n?', re.DOTALL | re.MULTILINE)
+FIRST_BLOCK_RE = re.compile(r'^{% block ', re.MULTILINE)
+EXTENDS_RE = re.compile(r'^{% extends [^%]*%}\n?', re.MULTILINE)
+LOAD_STATIC_RE = re.compile(r'{% load [^%]*\bstatic\b')
+STYLESHEETS_BLOCK = '{% block stylesheets %}'
+
+
+def stylesheet_name(template_name):
+    """Static path of the stylesheet holding a template's extracted styles."""
+    return f'css/{Path(template_name).with_suffix(".css").as_posix()}'
+
+
+def extract_styles(source, href, existing=''):
+    """Move a template's <style> blocks out of its source.
+
+    Blocks marked data-critical, and blocks containing template syntax,
+    stay inline. Returns the new source and the CSS to add to the
+    stylesheet, leaving out blocks the existing stylesheet already holds.
+    The CSS is None if nothing was moved.
+    """
+    moved = []
+    extracted = []
+
+    def extract(match):
+        css = match.group('css')
+        if 'data-critical' in match.group('attrs') or '{%' in css or '{{' in css:
+            return match.group(0)
+        block = textwrap.dedent(css).strip('\n')
+        moved.append(block)
+        if block not in extracted and f'\n{block}\n' not in f'\n{existing}\n':
+            extracted.append(block)
+        return ''
+
+    source = STYLE_RE.sub(extract, source)
+    if not moved:
+        return source, None
+    link = f'<link rel="stylesheet" href="{{% static \'{href}\' %}}"/>'
+    if href in source:
+        # Linked by an earlier run.
+        pass
+    elif STYLESHEETS_BLOCK in source:
+        source = source.replace(STYLESHEETS_BLOCK, f'{STYLESHEETS_BLOCK}\n{link}', 1)
+    elif EXTENDS_RE.search(source) and FIRST_BLOCK_RE.search(source):
+        # Child templates link it from base.html's <head>.
+        start = FIRST_BLOCK_RE.search(source).start()
+        source = f'{source[:start]}{STYLESHEETS_BLOCK}\n{link}\n{{% endblock %}}\n\n{source[start:]}'
+    else:
+        source = f'{link}\n{source}'
+    if not LOAD_STATIC_RE.search(source):
+        # {% load %} has to follow {% extends %}, which must come first.
+        extends = EXTENDS_RE.search(source)
+        position = extends.end() if extends else 0
+        source = f'{source[:position]}{{% load static %}}\n{source[position:]}'
+    return source, '\n\n'.join(extracted) + '\n' if extracted else ''
+
+
+class Command(BaseCommand):
+    help = ('Moves inline <style> blocks out of templates into static stylesheets. '
+            'Blocks marked <style data-critical> stay inline.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('templates', nargs='*',
+                            help='Template names to process (default: every template in the template DIRS).')
+        parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing.')
+
+    def template_dirs(self):
+        return [Path(directory) for engine in settings.TEMPLATES for directory in engine.get('DIRS', [])]
+
+    def find_templates(self, names):
+        for directory in self.template_dirs():
+            paths = [directory / name for name in names] if names else sorted(directory.rglob('*.html'))
+            for path in paths:
+                if path.is_file():
+                    yield path.relative_to(directory).as_posix(), path
+
+    def handle(self, *args, **options):
+        static_dir = Path(settings.STATICFILES_DIRS[0])
+        extracted = 0
+        for name, path in self.find_templates(options['templates']):
+            source = path.read_text()
+            href = stylesheet_name(name)
+            stylesheet = static_dir / href
+            existing = stylesheet.read_text() if stylesheet.exists() else ''
+            # Rules the stylesheet already has, e.g. from a template restored after an
+            # earlier run, are not added again, so reruns leave it unchanged.
+            new_source, css = extract_styles(source, href, existing)
+            if css is None:
+                continue
+            extracted += 1
+            self.stdout.write(f'{name}: {len(source) - len(new_source)} bytes moved to {href}')
+            if options['dry_run']:
+                continue
+            if css:
+                stylesheet.parent.mkdir(parents=True, exist_ok=True)
+                stylesheet.write_text(f'{existing}\n{css}' if existing else css)
+            path.write_text(new_source)
+        self.stdout.write(self.style.SUCCESS(f'Extracted styles from {extracted} templates.'))
@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from cms_content.snapshot import get_snapshot
+from cms_content.versioning import get_content_version
+
+PRODUCT_MENU_KEY = 'pages:product_menu'
+PRODUCT_MENU_HTML_KEY = 'pages:product_menu_html'
+
+
+def menu_keys():
+    # Keyed on the content version, so any content change, including bulk
+    # imports and writes in other processes, retires the cached menu. The
+    # entries of old versions expire with PAGE_CACHE_TIMEOUT.
+    version = get_content_version()
+    return f'{PRODUCT_MENU_KEY}:{version}', f'{PRODUCT_MENU_HTML_KEY}:{version}'
+
+
+def build_product_menu():
+    """Return the Products dropdown as a list of (name, url) pairs."""
+    return [(product.name, product.get_absolute_url()) for product in get_snapshot().products]
+
+
+def get_product_menu():
+    key, _html_key = menu_keys()
+    menu = cache.get(key)
+    if menu is None:
+        menu = build_product_menu()
+        cache.set(key, menu, settings.PAGE_CACHE_TIMEOUT)
+    return menu
+
+
+def get_product_menu_html():
+    """Return the pre-rendered <li> items for the Products dropdown."""
+    _key, html_key = menu_keys()
+    html = cache.get(html_key)
+    if html is None:
+        html = render_to_string('pages/includes/product_menu.html', {'menu': get_product_menu()})
+        cache.set(html_key, html, settings.PAGE_CACHE_TIMEOUT)
+    return mark_safe(html)
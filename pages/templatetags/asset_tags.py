@@ -0,0 +1,30 @@
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+register = template.Library()
+
+
+def bundle_paths(name):
+    """Return the bundle itself once collectstatic has built it, otherwise its members."""
+    hashed_files = getattr(staticfiles_storage, 'hashed_files', None)
+    if hashed_files and name in hashed_files:
+        return [name]
+    return settings.ASSET_BUNDLES[name]
+
+
+@register.simple_tag
+def asset_bundle(name, **attrs):
+    """Link a CSS or JS bundle from ASSET_BUNDLES.
+
+    Keyword arguments become attributes; True renders a bare attribute, so
+    {% asset_bundle 'js/site.bundle.js' defer=True %} defers the scripts.
+    """
+    attributes = format_html_join(
+        '', ' {}{}',
+        ((key, '' if value is True else format_html('="{}"', value)) for key, value in attrs.items() if value),
+    )
+    tag = '<link rel="stylesheet" href="{}"{}>' if name.endswith('.css') else '<script src="{}"{}></script>'
+    return format_html_join('\n', tag, ((static(path), attributes) for path in bundle_paths(name)))
@@ -0,0 +1,115 @@
+from django import template
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.files.storage import default_storage
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from cms_content.imaging import MIME_TYPES, webp_sibling
+from cms_content.renditions import get_rendition_map
+from cms_content.thumbnails import thumbnail_url
+
+register = template.Library()
+
+
+def image_source(image):
+    """Return (name, url) for an ImageField file or a name stored by the CMS.
+
+    A stored name is a path into the static files when the staticfiles
+    finders know it, and an upload in the media storage otherwise.
+    """
+    if hasattr(image, 'url'):
+        return (image.name, image.url) if image else ('', '')
+    if not image:
+        return ('', '')
+    return (image, static(image) if finders.find(image) else default_storage.url(image))
+
+
+@register.simple_tag
+def responsive_image(image, alt='', sizes='100vw', **attrs):
+    """Render an image as a <picture> offering its renditions as srcsets.
+
+    Images without renditions render as a plain <img> of the original, or
+    of src if given. Extra keyword arguments become attributes of the <img>.
+    """
+    name, url = image_source(image)
+    url = attrs.pop('src', url)
+    img = format_html(
+        '<img src="{}" alt="{}"{}>', url, alt,
+        format_html_join('', ' {}="{}"', attrs.items()),
+    )
+    renditions = get_rendition_map().get(name)
+    if not renditions:
+        return img
+    sources = format_html_join(
+        '', '<source type="{}" srcset="{}" sizes="{}">',
+        (
+            (mime_type, ', '.join(f'{r.url} {r.width}w' for r in renditions if r.format == image_format), sizes)
+            for image_format, mime_type in MIME_TYPES.items()
+            if any(r.format == image_format for r in renditions)
+        ),
+    )
+    return format_html('<picture>{}{}</picture>', sources, img)
+
+
+@register.simple_tag
+def background_image(image, width=None):
+    """Return background-image declarations for an inline style attribute.
+
+    The original is declared first for browsers without image-set(). The
+    rendition used is the narrowest at least width pixels wide, or the
+    widest there is.
+    """
+    name, url = image_source(image)
+    declaration = format_html('background-image: url({});', url)
+    choices = []
+    for image_format, mime_type in MIME_TYPES.items():
+        renditions = [r for r in get_rendition_map().get(name) if r.format == image_format]
+        if renditions:
+            wide_enough = [r for r in renditions if width is None or r.width >= width]
+            rendition = wide_enough[0] if width is not None and wide_enough else renditions[-1]
+            choices.append((rendition.url, mime_type))
+    if not choices:
+        return declaration
+    image_set = format_html_join(', ', "url({}) type('{}')", choices)
+    return format_html('{} background-image: image-set({}, url({}));', declaration, image_set, url)
+
+
+@register.simple_tag
+def thumbnail(image, width, height):
+    """Return the URL of image scaled to fit within width x height."""
+    name, _url = image_source(image)
+    return thumbnail_url(name, width, height) if name else ''
+
+
+def static_webp_url(path):
+    """Return the URL of the WebP copy collectstatic made of a static image, or None."""
+    hashed_files = getattr(staticfiles_storage, 'hashed_files', None)
+    sibling = webp_sibling(path)
+    return static(sibling) if hashed_files and sibling in hashed_files else None
+
+
+@register.simple_tag
+def static_image(path, alt='', **attrs):
+    """Render a static image, preferring its WebP copy where one was collected."""
+    img = format_html(
+        '<img src="{}" alt="{}"{}>', static(path), alt,
+        format_html_join('', ' {}="{}"', attrs.items()),
+    )
+    webp_url = static_webp_url(path)
+    if webp_url is None:
+        return img
+    return format_html('<picture><source type="image/webp" srcset="{}">{}</picture>', webp_url, img)
+
+
+@register.simple_tag
+def static_background(path):
+    """Return background-image declarations for a static image and its WebP copy."""
+    url = static(path)
+    declaration = format_html('background-image: url({});', url)
+    webp_url = static_webp_url(path)
+    if webp_url is None:
+        return declaration
+    return format_html(
+        "{} background-image: image-set(url({}) type('image/webp'), url({}));", declaration, webp_url, url
+    )
@@ -1,8 +1,14 @@
 from django import template
 from cms_content.models import Product
 
+from pages.navigation import get_product_menu_html
+
 register = template.Library()
 
 @register.simple_tag
 def get_products():
-    return Product.objects.all()
\ No newline at end of file
+    return Product.objects.all()
+
+@register.simple_tag
+def product_menu():
+    return get_product_menu_html()
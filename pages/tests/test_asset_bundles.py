@@ -0,0 +1,79 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.template import Context, Template
+
+from sitecore.bundles import build_css
+
+BUNDLES = {
+    "css/site.bundle.css": ["css/base.css", "vendor/widget/widget.css"],
+    "js/site.bundle.js": ["js/one.js", "js/two.js"],
+}
+
+
+@pytest.fixture
+def bundle_settings(settings, tmp_path):
+    source = tmp_path / "source"
+    for directory in ("css", "js", "fonts", "vendor/widget/img"):
+        (source / directory).mkdir(parents=True)
+    (source / "css" / "base.css").write_text(
+        '@charset "UTF-8";\nbody { font-family: Icons; }\n'
+        '@font-face { src: url("../fonts/icons.woff"); }\n'
+    )
+    (source / "vendor" / "widget" / "widget.css").write_text(
+        '@import url("https://fonts.example.com/css?family=Poppins");\n.widget { background: url(img/bg.png); }\n'
+    )
+    (source / "fonts" / "icons.woff").write_bytes(b"font")
+    (source / "vendor" / "widget" / "img" / "bg.png").write_bytes(b"png")
+    (source / "js" / "one.js").write_text("var one = 1")
+    (source / "js" / "two.js").write_text("var two = 2;")
+
+    settings.STATICFILES_DIRS = [source]
+    settings.STATIC_ROOT = tmp_path / "root"
+    settings.ASSET_BUNDLES = BUNDLES
+    return settings
+
+
+def test_build_css_rebases_urls_and_hoists_imports():
+    """Test that bundled CSS resolves member URLs from the bundle and keeps @import first."""
+    css = build_css("css/site.bundle.css", [
+        ("css/base.css", "a { background: url('../img/a.png'); }\n/*# sourceMappingURL=base.css.map */"),
+        ("vendor/widget/widget.css", '@import url("//fonts.example.com/x");\nb { background: url(img/b.png); }'),
+    ])
+    assert css.startswith('@import url("//fonts.example.com/x");')
+    assert "url('../img/a.png')" in css
+    assert "url(../vendor/widget/img/b.png)" in css
+    assert "sourceMappingURL" not in css
+
+
+def test_collectstatic_builds_hashed_bundles(bundle_settings):
+    """Test that collectstatic writes content-hashed bundles the asset_bundle tag then links."""
+    bundle_settings.STORAGES = {
+        **bundle_settings.STORAGES,
+        "staticfiles": {"BACKEND": "sitecore.storage.OptimizedStaticFilesStorage"},
+    }
+    call_command("collectstatic", interactive=False, verbosity=0, stdout=StringIO())
+    root = bundle_settings.STATIC_ROOT
+    manifest = json.loads((root / "staticfiles.json").read_text())["paths"]
+
+    css = (root / manifest["css/site.bundle.css"]).read_text()
+    assert css.startswith("@import")
+    assert "@charset" not in css
+    assert manifest["fonts/icons.woff"] in css
+    assert manifest["vendor/widget/img/bg.png"] in css
+    js = (root / manifest["js/site.bundle.js"]).read_text()
+    assert "var one = 1" in js and "var two = 2;" in js
+
+    html = Template("{% load asset_tags %}{% asset_bundle 'js/site.bundle.js' defer=True %}").render(Context())
+    assert html == f'<script src="/static/{manifest["js/site.bundle.js"]}" defer></script>'
+
+
+def test_asset_bundle_links_members_before_collectstatic(bundle_settings):
+    """Test that without a manifest each bundle member is linked on its own."""
+    html = Template("{% load asset_tags %}{% asset_bundle 'css/site.bundle.css' media='all' %}").render(Context())
+    assert html == (
+        '<link rel="stylesheet" href="/static/css/base.css" media="all">\n'
+        '<link rel="stylesheet" href="/static/vendor/widget/widget.css" media="all">'
+    )
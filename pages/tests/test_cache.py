@@ -0,0 +1,91 @@
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from cms_content.models import Feature, Product
+
+
+@pytest.fixture
+def test_product(db):
+    """Fixture to create a test product."""
+    return Product.objects.create(
+        name="Cached Product",
+        short_description="A short description.",
+        hero_image="product_heroes/test_hero.jpg",
+        hero_image_alt_text="Test Hero Image",
+        main_description="Main description of the test product.",
+        url_slug="cached-product",
+        order=1,
+    )
+
+
+@pytest.mark.django_db
+def test_home_page_served_from_cache(client, test_product, django_assert_num_queries):
+    """Test that a repeat anonymous hit is answered without touching the database."""
+    first = client.get(reverse("pages:home"))
+    assert first.status_code == 200
+    with django_assert_num_queries(0):
+        second = client.get(reverse("pages:home"))
+    assert second.status_code == 200
+    assert second.content == first.content
+
+
+@pytest.mark.django_db
+def test_cached_page_invalidated_on_save(client, test_product):
+    """Test that saving a product changes the cached product detail page."""
+    url = reverse("pages:product_detail", kwargs={"url_slug": test_product.url_slug})
+    assert "Main description of the test product." in client.get(url).content.decode()
+
+    test_product.main_description = "Updated main description."
+    test_product.save()
+
+    assert "Updated main description." in client.get(url).content.decode()
+
+
+@pytest.mark.django_db
+def test_cached_page_invalidated_on_delete(client):
+    """Test that deleting a feature drops it from the cached about page."""
+    feature = Feature.objects.create(title="Swarm Control", description="Many robots.", icon_class="fa fa-cogs")
+    assert "Swarm Control" in client.get(reverse("pages:about")).content.decode()
+
+    feature.delete()
+
+    assert "Swarm Control" not in client.get(reverse("pages:about")).content.decode()
+
+
+@pytest.mark.django_db
+def test_authenticated_requests_bypass_cache(client, test_product):
+    """Test that logged-in users always get a freshly rendered page."""
+    client.get(reverse("pages:home"))
+    user = User.objects.create_user("editor", password="secret")
+    client.force_login(user)
+    response = client.get(reverse("pages:home"))
+    assert "pages/index.html" in [t.name for t in response.templates]
+
+
+@pytest.mark.django_db
+def test_not_found_is_not_cached(client, test_product):
+    """Test that a 404 for a missing product does not poison the cache."""
+    url = reverse("pages:product_detail", kwargs={"url_slug": "late-product"})
+    assert client.get(url).status_code == 404
+    Product.objects.create(
+        name="Late Product",
+        short_description="Added after the first request.",
+        hero_image="product_heroes/late.jpg",
+        hero_image_alt_text="Late",
+        main_description="Late.",
+        url_slug="late-product",
+    )
+    assert client.get(url).status_code == 200
+
+
+@pytest.mark.django_db
+def test_query_strings_bypass_cache(client, test_product):
+    """Test that a query string neither fills nor reads the page cache."""
+    from django.core.cache import cache
+
+    client.get(reverse("pages:home"))
+    cached = set(cache._cache)
+    for n in range(3):
+        response = client.get(reverse("pages:home"), {"utm_source": n})
+        assert "pages/index.html" in [t.name for t in response.templates]
+    assert set(cache._cache) == cached
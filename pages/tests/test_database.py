@@ -0,0 +1,28 @@
+import pytest
+from django.db import connections
+from django.urls import reverse
+
+
+class FakePool:
+    name = "pool-1"
+    min_size = 2
+    max_size = 10
+
+    def get_stats(self):
+        return {"pool_size": 2, "pool_available": 1, "requests_waiting": 0}
+
+
+@pytest.mark.django_db
+def test_pool_stats_endpoint(client, admin_client, monkeypatch):
+    """Test that staff see each pooled database's statistics and others are sent to log in."""
+    url = reverse("db_pool_stats")
+    assert client.get(url).status_code == 302
+    assert admin_client.get(url).json()["pools"] == {}
+
+    monkeypatch.setattr(connections["default"], "pool", FakePool(), raising=False)
+    response = admin_client.get(url)
+    assert response["Cache-Control"].startswith("max-age=0")
+    assert response.json()["pools"]["default"] == {
+        "name": "pool-1", "min_size": 2, "max_size": 10,
+        "pool_size": 2, "pool_available": 1, "requests_waiting": 0,
+    }
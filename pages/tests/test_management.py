@@ -0,0 +1,100 @@
+import gzip
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from cms_content.models import Product, Service
+
+
+@pytest.mark.django_db
+def test_export_static_site(tmp_path):
+    """Test that export_static_site writes every public page and its slug routes."""
+    Product.objects.create(
+        name="Robodogs",
+        short_description="A short description.",
+        hero_image="product_heroes/test_hero.jpg",
+        hero_image_alt_text="Test Hero Image",
+        main_description="Main description of the robodog.",
+        url_slug="robodogs",
+        order=1,
+    )
+    Service.objects.create(
+        name="Mapping",
+        short_description="Maps things.",
+        image="service_images/test_service.jpg",
+        image_alt_text="Mapping",
+        url_slug="mapping",
+    )
+
+    out = StringIO()
+    call_command("export_static_site", str(tmp_path), stdout=out)
+
+    assert "Exported" in out.getvalue()
+    for page in ["index.html", "about/index.html", "service/index.html", "case-studies/index.html",
+                 "products/robodogs/index.html", "service/mapping/index.html"]:
+        assert (tmp_path / page).exists(), page
+
+    assert not (tmp_path / "search/suggest/index.html").exists()
+
+    html = (tmp_path / "products/robodogs/index.html").read_bytes()
+    assert b"Main description of the robodog." in html
+    assert gzip.decompress((tmp_path / "products/robodogs/index.html.gz").read_bytes()) == html
+
+
+@pytest.mark.django_db
+def test_export_static_site_overwrites_in_place(tmp_path):
+    """Test that re-running the export replaces pages without leaving temporary files."""
+    call_command("export_static_site", str(tmp_path), "--no-compress", stdout=StringIO())
+    call_command("export_static_site", str(tmp_path), "--no-compress", stdout=StringIO())
+
+    about = tmp_path / "about"
+    assert sorted(p.name for p in about.iterdir()) == ["index.html"]
+
+
+def test_extract_inline_styles(settings, tmp_path):
+    """Test that inline styles move to a linked stylesheet while critical ones stay inline."""
+    templates = tmp_path / "templates"
+    (templates / "pages").mkdir(parents=True)
+    page = templates / "pages" / "page.html"
+    page.write_text(
+        '{% extends "base.html" %}\n\n{% block content %}\n'
+        "<style>\n    .a { color: red; }\n</style>\n"
+        "<style data-critical>.hero { height: 100vh; }</style>\n"
+        "<style>.b { color: {{ colour }}; }</style>\n"
+        "<p>Page</p>\n{% endblock %}\n"
+    )
+    settings.TEMPLATES = [{**settings.TEMPLATES[0], "DIRS": [templates]}]
+    settings.STATICFILES_DIRS = [tmp_path / "static"]
+
+    out = StringIO()
+    call_command("extract_inline_styles", stdout=out)
+    assert "Extracted styles from 1 templates." in out.getvalue()
+
+    assert (tmp_path / "static" / "css" / "pages" / "page.css").read_text() == ".a { color: red; }\n"
+    assert page.read_text() == (
+        '{% extends "base.html" %}\n{% load static %}\n\n'
+        "{% block stylesheets %}\n<link rel=\"stylesheet\" href=\"{% static 'css/pages/page.css' %}\"/>\n"
+        "{% endblock %}\n\n{% block content %}\n"
+        "<style data-critical>.hero { height: 100vh; }</style>\n"
+        "<style>.b { color: {{ colour }}; }</style>\n"
+        "<p>Page</p>\n{% endblock %}\n"
+    )
+
+    # Nothing left to move, so a second run changes nothing.
+    call_command("extract_inline_styles", stdout=StringIO())
+    assert (tmp_path / "static" / "css" / "pages" / "page.css").read_text() == ".a { color: red; }\n"
+    linked = page.read_text()
+
+    # Running again on the original template, e.g. after a checkout restored
+    # it, moves the blocks out again without duplicating their rules.
+    page.write_text(
+        '{% extends "base.html" %}\n\n{% block content %}\n'
+        "<style>\n    .a { color: red; }\n</style>\n<style>.c { color: blue; }</style>\n"
+        "<style data-critical>.hero { height: 100vh; }</style>\n"
+        "<style>.b { color: {{ colour }}; }</style>\n"
+        "<p>Page</p>\n{% endblock %}\n"
+    )
+    call_command("extract_inline_styles", stdout=StringIO())
+    call_command("extract_inline_styles", stdout=StringIO())
+    assert (tmp_path / "static" / "css" / "pages" / "page.css").read_text() == ".a { color: red; }\n\n.c { color: blue; }\n"
+    assert page.read_text() == linked
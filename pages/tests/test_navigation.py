@@ -0,0 +1,51 @@
+import pytest
+from django.urls import reverse
+from cms_content.models import Product
+from pages.navigation import get_product_menu
+
+
+def create_product(name, url_slug, order=0):
+    return Product.objects.create(
+        name=name,
+        short_description="A short description.",
+        hero_image="product_heroes/test_hero.jpg",
+        hero_image_alt_text="Test Hero Image",
+        main_description="Main description.",
+        url_slug=url_slug,
+        order=order,
+    )
+
+
+@pytest.mark.django_db
+def test_product_menu_lists_products_in_order():
+    """Test that the menu holds (name, url) pairs in display order."""
+    create_product("Second", "second", order=2)
+    create_product("First", "first", order=1)
+    assert get_product_menu() == [
+        ("First", reverse("pages:product_detail", kwargs={"url_slug": "first"})),
+        ("Second", reverse("pages:product_detail", kwargs={"url_slug": "second"})),
+    ]
+
+
+@pytest.mark.django_db
+def test_product_menu_costs_no_queries_once_built(client, django_assert_num_queries):
+    """Test that base.html renders the Products dropdown without queries."""
+    create_product("Robodogs", "robodogs")
+    client.get(reverse("pages:404"))
+    with django_assert_num_queries(0):
+        response = client.get(reverse("pages:404"))
+    assert '<a href="/products/robodogs/">Robodogs</a>' in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_product_menu_rebuilt_on_save_and_delete(client):
+    """Test that product changes show up in the menu."""
+    product = create_product("Robodogs", "robodogs")
+    assert "Robodogs" in client.get(reverse("pages:404")).content.decode()
+
+    product.name = "Robodogs Mk II"
+    product.save()
+    assert "Robodogs Mk II" in client.get(reverse("pages:404")).content.decode()
+
+    product.delete()
+    assert "Robodogs" not in client.get(reverse("pages:404")).content.decode()
@@ -0,0 +1,100 @@
+import json
+from io import StringIO
+
+import pytest
+from django.contrib.staticfiles import finders
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.template import Context, Template
+from django.urls import reverse
+from PIL import Image
+
+from cms_content.models import Product
+
+
+@pytest.fixture
+def collected(settings, tmp_path):
+    source = tmp_path / "source" / "images"
+    source.mkdir(parents=True)
+    photo = Image.effect_noise((300, 200), 40).convert("RGB")
+    exif = Image.Exif()
+    exif[0x010F] = "Camera maker"
+    photo.save(source / "photo.jpg", "JPEG", quality=95, exif=exif)
+    Image.new("RGBA", (300, 200), (0, 128, 128, 128)).save(source / "logo.png", "PNG")
+    (tmp_path / "source" / "site.css").write_text("body { background: url(images/logo.png); }")
+
+    settings.STATICFILES_DIRS = [tmp_path / "source"]
+    settings.STATIC_ROOT = tmp_path / "root"
+    settings.STATIC_IMAGE_WORKERS = 2
+    settings.ASSET_BUNDLES = {}
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {"BACKEND": "sitecore.storage.OptimizedStaticFilesStorage"},
+    }
+    call_command("collectstatic", interactive=False, verbosity=0, stdout=StringIO())
+    return tmp_path
+
+
+def test_collectstatic_optimises_images(collected):
+    """Test that collected images lose their metadata, shrink and gain hashed WebP copies."""
+    root = collected / "root"
+    source = collected / "source" / "images"
+    manifest = json.loads((root / "staticfiles.json").read_text())["paths"]
+
+    photo = root / manifest["images/photo.jpg"]
+    assert photo.stat().st_size < (source / "photo.jpg").stat().st_size
+    with Image.open(photo) as image:
+        assert not image.getexif()
+    assert manifest["images/photo.jpg.webp"].endswith(".webp")
+    assert manifest["images/logo.png.webp"].endswith(".webp")
+    with Image.open(root / manifest["images/logo.png.webp"]) as image:
+        assert image.mode == "RGBA"
+
+    # The stylesheet refers to the hashed name of the optimised PNG.
+    assert manifest["images/logo.png"] in (root / manifest["site.css"]).read_text()
+
+
+def test_static_image_tags_prefer_webp(collected):
+    """Test that the static image tags offer the collected WebP copy."""
+    html = Template("{% load image_tags %}{% static_image 'images/photo.jpg' alt='Photo' %}").render(Context())
+    assert html.startswith('<picture><source type="image/webp" srcset="/static/images/photo.jpg.')
+    assert '<img src="/static/images/photo.' in html
+
+    css = Template("{% load image_tags %}{% static_background 'images/logo.png' %}").render(Context())
+    assert "image-set(url(/static/images/logo.png." in css
+
+
+def test_static_image_tags_without_manifest():
+    """Test that the static image tags render plain images when nothing was collected."""
+    html = Template("{% load image_tags %}{% static_image 'images/logo.png' class='logo' %}").render(Context())
+    assert html == '<img src="/static/images/logo.png" alt="" class="logo">'
+
+
+@pytest.fixture
+def prod_storages(settings, tmp_path):
+    """Production static storage over a manifest naming every static file as it is."""
+    settings.STATIC_ROOT = tmp_path / "root"
+    settings.STATIC_ROOT.mkdir()
+    paths = {path: path for finder in finders.get_finders() for path, _storage in finder.list([])}
+    (settings.STATIC_ROOT / "staticfiles.json").write_text(json.dumps({"paths": paths, "version": "1.1"}))
+    settings.MEDIA_ROOT = tmp_path / "media"
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {"BACKEND": "sitecore.storage.OptimizedStaticFilesStorage"},
+    }
+
+
+@pytest.mark.django_db
+def test_uploaded_images_render_under_production_storage(client, prod_storages):
+    """Test that uploaded CMS images are served from media, not looked up in the static manifest."""
+    Product.objects.create(
+        name="Test Product",
+        short_description="A short description.",
+        hero_image=SimpleUploadedFile("test_hero.jpg", b"file_content", content_type="image/jpeg"),
+        hero_image_alt_text="Test Hero Image",
+        url_slug="test-product",
+        order=1,
+    )
+    response = client.get(reverse("pages:home"))
+    assert response.status_code == 200
+    assert "/media/product_heroes/test_hero" in response.content.decode()
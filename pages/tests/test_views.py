@@ -38,6 +38,9 @@ def test_product_detail_view(client, test_product):
     assert response.status_code == 200
     assert "pages/product_detail.html" in [t.name for t in response.templates]
     assert response.context["product"].name == test_product.name
+    html = response.content.decode()
+    assert "<style>" not in html
+    assert '<link rel="stylesheet" href="/static/css/pages/product_detail.css"/>' in html.split("</head>")[0]
 
 @pytest.mark.django_db
 def test_product_detail_view_not_found(client):
@@ -74,3 +77,136 @@ def test_custom_500_view(client, monkeypatch):
 
     with pytest.raises(Exception):
         client.get(reverse('pages:home'))
+
+def add_sections(product, sections, items_per_section):
+    from cms_content.models import ProductImage, ProductSection, ProductSectionItem
+    ProductImage.objects.create(product=product, image="product_carousel/test.jpg", alt_text="Carousel", order=0)
+    for section_order in range(sections):
+        section = ProductSection.objects.create(product=product, title=f"Section {section_order}", order=section_order)
+        for item_order in range(items_per_section):
+            ProductSectionItem.objects.create(section=section, text=f"Item {section_order}.{item_order}", order=item_order)
+
+def count_product_detail_queries(client, product):
+    from django.core.cache import cache
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    cache.clear()
+    url = reverse("pages:product_detail", kwargs={"url_slug": product.url_slug})
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(queries)
+
+@pytest.mark.django_db
+def test_product_detail_query_count_is_constant(client, test_product):
+    """Test that the product detail page costs the same number of queries regardless of section count."""
+    add_sections(test_product, sections=1, items_per_section=1)
+    baseline = count_product_detail_queries(client, test_product)
+
+    add_sections(test_product, sections=10, items_per_section=5)
+    assert count_product_detail_queries(client, test_product) == baseline
+
+@pytest.mark.django_db
+def test_product_detail_sections_and_items_ordered(client, test_product):
+    """Test that prefetched sections and items keep their display order."""
+    from cms_content.models import ProductSection, ProductSectionItem
+    second = ProductSection.objects.create(product=test_product, title="Applications", order=2)
+    first = ProductSection.objects.create(product=test_product, title="Key Features", order=1)
+    ProductSectionItem.objects.create(section=first, text="Later item", order=2)
+    ProductSectionItem.objects.create(section=first, text="Earlier item", order=1)
+    ProductSectionItem.objects.create(section=second, text="Inspection", order=1)
+
+    url = reverse("pages:product_detail", kwargs={"url_slug": test_product.url_slug})
+    response = client.get(url)
+    sections = response.context["product_sections"]
+    assert [s.title for s in sections] == ["Key Features", "Applications"]
+    assert [i.text for i in sections[0].items_list] == ["Earlier item", "Later item"]
+    content = response.content.decode()
+    assert content.index("Earlier item") < content.index("Later item") < content.index("Inspection")
+
+@pytest.mark.django_db
+def test_product_detail_conditional_get(client, test_product):
+    """Test that a revalidation with matching validators gets a 304."""
+    url = reverse("pages:product_detail", kwargs={"url_slug": test_product.url_slug})
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response["ETag"]
+    last_modified = response["Last-Modified"]
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    assert client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code == 304
+
+@pytest.mark.django_db
+def test_product_detail_conditional_get_after_change(client, test_product):
+    """Test that changing or deleting a related row invalidates the ETag."""
+    from cms_content.models import ProductImage
+    url = reverse("pages:product_detail", kwargs={"url_slug": test_product.url_slug})
+    etag = client.get(url)["ETag"]
+
+    image = ProductImage.objects.create(product=test_product, image="product_carousel/new.jpg", alt_text="New", order=1)
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    etag = response["ETag"]
+
+    image.delete()
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+@pytest.mark.django_db
+def test_service_detail_conditional_get(client, test_service):
+    """Test that the service detail page answers If-None-Match."""
+    url = reverse("pages:service_detail", kwargs={"url_slug": test_service.url_slug})
+    etag = client.get(url)["ETag"]
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+@pytest.mark.django_db
+def test_search_view_paginates(client):
+    """Test that search results are split into pages."""
+    for i in range(12):
+        Product.objects.create(
+            name=f"Drone {i:02d}",
+            short_description="Aerial survey.",
+            hero_image="product_heroes/test_hero.jpg",
+            hero_image_alt_text="Drone",
+            main_description="Main description.",
+            url_slug=f"drone-{i}",
+        )
+    url = reverse("pages:search")
+    first = client.get(url, {"q": "drone"})
+    assert len(first.context["results"]) == 10
+    assert first.context["paginator"].count == 12
+    assert "page=2" in first.content.decode()
+
+    second = client.get(url, {"q": "drone", "page": 2})
+    assert len(second.context["results"]) == 2
+
+@pytest.mark.django_db
+def test_public_views_run_async(async_client, test_product):
+    """Test that the public pages are served by async views, conditional GETs included."""
+    from asgiref.sync import async_to_sync
+    from pages.views import AboutView, ContactView, HomeView, ProductDetailView, ServiceDetailView, ServiceView
+
+    for view in (HomeView, ServiceView, AboutView, ContactView, ProductDetailView, ServiceDetailView):
+        assert view.view_is_async
+    url = reverse("pages:product_detail", kwargs={"url_slug": test_product.url_slug})
+    response = async_to_sync(async_client.get)(url)
+    assert response.status_code == 200
+    assert "Main description of the test product." in response.content.decode()
+    # The second request is answered from the page cache, and still revalidates.
+    assert async_to_sync(async_client.get)(url, headers={"If-None-Match": response["ETag"]}).status_code == 304
+    missing = reverse("pages:product_detail", kwargs={"url_slug": "missing"})
+    assert async_to_sync(async_client.get)(missing).status_code == 404
+
+@pytest.mark.django_db
+def test_cached_product_revalidation_costs_no_queries(client, test_product, django_assert_num_queries):
+    """Test that a conditional GET on a cached product page reuses its memoised validators."""
+    from cms_content.models import ProductImage, ProductSection, ProductSectionItem
+    section = ProductSection.objects.create(product=test_product, title="Features", order=0)
+    ProductSectionItem.objects.create(section=section, text="Item", order=0)
+    ProductImage.objects.create(product=test_product, image="product_carousel/a.jpg", alt_text="A", order=0)
+    url = reverse("pages:product_detail", kwargs={"url_slug": test_product.url_slug})
+    etag = client.get(url)["ETag"]
+
+    with django_assert_num_queries(0):
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+        assert client.get(url).status_code == 200
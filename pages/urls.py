@@ -10,6 +10,7 @@ from .views import (
     ServiceDetailView,
     AboutView,
     SearchView,
+    search_suggestions,
 )
 
 urlpatterns = [
@@ -19,6 +20,7 @@ urlpatterns = [
     path("service/", ServiceView.as_view(), name="service"),
     path("service/<slug:url_slug>/", ServiceDetailView.as_view(), name="service_detail"),
     path("search/", SearchView.as_view(), name="search"),
+    path("search/suggest/", search_suggestions, name="search_suggest"),
     path("team/", TemplateView.as_view(template_name="pages/team.html"), name="team"),
     path("blog/", TemplateView.as_view(template_name="pages/blog-three-column.html"), name="blog"),
     path("products/<str:url_slug>/", ProductDetailView.as_view(), name="product_detail"),
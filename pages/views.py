@@ -1,47 +1,98 @@
+from asgiref.sync import sync_to_async
 from django.views.generic import TemplateView, DetailView, ListView
 from django.shortcuts import render
-from cms_content.models import Product, PageContent, Service, Feature, TimelineEvent, Capability, Blog, CaseStudy, WhitePaper
-from django.db.models import Q
+from cms_content.models import Product, ProductImage, ProductSection, ProductSectionItem, PageContent, Service
+from cms_content.search import get_search_backend
+from cms_content.search.suggest import suggest
+from cms_content.snapshot import aget_snapshot
+from cms_content.conditional import content_condition, product_last_modified, service_last_modified
+from django.conf import settings
+from django.db.models import Prefetch
+from django.http import Http404, JsonResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_GET
+
+from .cache import CachedPageMixin
 
 
 class StaticTemplateView(TemplateView):
     template_name = ""
 
+class AsyncTemplateView(TemplateView):
+    """TemplateView whose context is built by an async aget_context_data().
+
+    The response is returned unrendered, so templates, which may still query
+    the database, are rendered by the handler in a thread.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        return self.render_to_response(await self.aget_context_data(**kwargs))
+
+    async def aget_context_data(self, **kwargs):
+        return self.get_context_data(**kwargs)
+
 def custom_500_view(request):
     return render(request, "pages/500.html", status=500)
 
-class HomeView(TemplateView):
+class HomeView(CachedPageMixin, AsyncTemplateView):
     template_name = "pages/index.html"
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['products'] = Product.objects.all().order_by('order')
+    async def aget_context_data(self, **kwargs):
+        context = self.get_context_data(**kwargs)
+        context['products'] = (await aget_snapshot()).products
         return context
 
-class ProductDetailView(DetailView):
+# Decorating adispatch keeps the conditional check in front of the page cache,
+# so a cached page still answers revalidations with 304.
+@method_decorator(content_condition(product_last_modified), name='adispatch')
+class ProductDetailView(CachedPageMixin, DetailView):
     model = Product
     template_name = 'pages/product_detail.html'
     context_object_name = 'product'
     slug_field = 'url_slug'
     slug_url_kwarg = 'url_slug'
 
+    def get_queryset(self):
+        # Load the whole product tree in a fixed number of queries: one for the
+        # product, one each for its images, sections and section items.
+        items = ProductSectionItem.objects.only('id', 'section_id', 'text', 'order').order_by('order')
+        sections = ProductSection.objects.only('id', 'product_id', 'title', 'order').order_by('order').prefetch_related(
+            Prefetch('items', queryset=items, to_attr='items_list')
+        )
+        images = ProductImage.objects.only('id', 'product_id', 'image', 'alt_text', 'order').order_by('order')
+        return Product.objects.only(
+            'id', 'name', 'short_description', 'hero_image', 'hero_image_alt_text',
+            'main_description', 'conclusion_text', 'url_slug',
+        ).prefetch_related(
+            Prefetch('images', queryset=images, to_attr='images_list'),
+            Prefetch('sections', queryset=sections, to_attr='sections_list'),
+        )
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            self.object = await self.get_queryset().aget(url_slug=kwargs[self.slug_url_kwarg])
+        except Product.DoesNotExist:
+            raise Http404('No product found matching the query')
+        return self.render_to_response(self.get_context_data(object=self.object))
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['product_images'] = self.object.images.all().order_by('order')
-        context['product_sections'] = self.object.sections.all().order_by('order')
-        for section in context['product_sections']:
-            section.items_list = section.items.all().order_by('order')
+        context['product_images'] = self.object.images_list
+        context['product_sections'] = self.object.sections_list
         return context
 
-class ServiceView(TemplateView):
+class ServiceView(CachedPageMixin, AsyncTemplateView):
     template_name = "pages/service.html"
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['services'] = Service.objects.all().order_by('order')
-        context['hero_content'] = PageContent.objects.filter(page_name='service', section_identifier='hero_section').first()
+    async def aget_context_data(self, **kwargs):
+        context = self.get_context_data(**kwargs)
+        snapshot = await aget_snapshot()
+        context['services'] = snapshot.services
+        context['hero_content'] = snapshot.page('service').get('hero_section')
         return context
 
+@method_decorator(content_condition(service_last_modified), name='get')
 class ServiceDetailView(DetailView):
     model = Service
     template_name = 'pages/service_detail.html'
@@ -49,20 +100,31 @@ class ServiceDetailView(DetailView):
     slug_field = 'url_slug'
     slug_url_kwarg = 'url_slug'
 
-class AboutView(TemplateView):
+    async def get(self, request, *args, **kwargs):
+        try:
+            self.object = await self.get_queryset().aget(url_slug=kwargs[self.slug_url_kwarg])
+        except Service.DoesNotExist:
+            raise Http404('No service found matching the query')
+        return self.render_to_response(self.get_context_data(object=self.object))
+
+class AboutView(CachedPageMixin, AsyncTemplateView):
     template_name = "pages/about.html"
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['hero_content'] = PageContent.objects.filter(page_name='about', section_identifier='hero_section').first()
-        context['mission_content'] = PageContent.objects.filter(page_name='about', section_identifier='mission_section').first()
-        context['vision_content'] = PageContent.objects.filter(page_name='about', section_identifier='vision_section').first()
-        context['cta_content'] = PageContent.objects.filter(page_name='about', section_identifier='cta_section').first()
+    async def aget_context_data(self, **kwargs):
+        # The page contents, capabilities, features and timeline all come from
+        # one snapshot, so a request issues no queries of its own for them.
+        context = self.get_context_data(**kwargs)
+        snapshot = await aget_snapshot()
+        sections = snapshot.page('about')
+        context['hero_content'] = sections.get('hero_section')
+        context['mission_content'] = sections.get('mission_section')
+        context['vision_content'] = sections.get('vision_section')
+        context['cta_content'] = sections.get('cta_section')
         if context['cta_content']:
-            context['cta_buttons'] = context['cta_content'].call_to_actions.all().order_by('order')
-        context['capabilities'] = Capability.objects.all().order_by('order')
-        context['features'] = Feature.objects.all().order_by('order')
-        context['timeline_events'] = TimelineEvent.objects.all().order_by('order')
+            context['cta_buttons'] = context['cta_content'].call_to_actions
+        context['capabilities'] = snapshot.capabilities
+        context['features'] = snapshot.features
+        context['timeline_events'] = snapshot.timeline_events
         return context
 
 class CaseStudiesView(TemplateView):
@@ -74,19 +136,12 @@ class WhitePapersView(TemplateView):
 class SearchView(ListView):
     template_name = "pages/search.html"
     context_object_name = 'results'
+    paginate_by = settings.SEARCH_RESULTS_PER_PAGE
 
     def get_queryset(self):
         query = self.request.GET.get('q')
         if query:
-            products = Product.objects.filter(Q(name__icontains=query) | Q(short_description__icontains=query))
-            services = Service.objects.filter(Q(name__icontains=query) | Q(short_description__icontains=query))
-            blogs = Blog.objects.filter(Q(title__icontains=query) | Q(content__icontains=query))
-            case_studies = CaseStudy.objects.filter(Q(title__icontains=query) | Q(short_description__icontains=query))
-            white_papers = WhitePaper.objects.filter(Q(title__icontains=query) | Q(short_description__icontains=query))
-
-            # Combine querysets
-            results = list(products) + list(services) + list(blogs) + list(case_studies) + list(white_papers)
-            return results
+            return get_search_backend().search(query)
         return []
 
     def get_context_data(self, **kwargs):
@@ -94,17 +149,32 @@ class SearchView(ListView):
         context['query'] = self.request.GET.get('q', '')
         return context
 
+@require_GET
+@cache_control(public=True, max_age=60)
+def search_suggestions(request):
+    query = request.GET.get('q', '')[:100]
+    try:
+        limit = min(int(request.GET.get('limit', settings.SEARCH_SUGGESTIONS_LIMIT)), settings.SEARCH_SUGGESTIONS_LIMIT)
+    except ValueError:
+        limit = settings.SEARCH_SUGGESTIONS_LIMIT
+    suggestions = [
+        {'type': kind, 'title': title, 'url': url}
+        for kind, title, url in suggest(query, limit)
+    ]
+    return JsonResponse({'query': query, 'suggestions': suggestions})
+
 # Remove Product7View as it will be handled by ProductDetailView
 # Remove service_view, service_non_gps_view, service_nature_digitization_view, service_crowd_monitoring_view
 # as they will be handled by ServiceView or ServiceDetailView
 
 
-class ContactView(TemplateView):
+class ContactView(AsyncTemplateView):
     template_name = "pages/contact.html"
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['contact_content'] = PageContent.objects.filter(page_name='contact', section_identifier='contact_section').first()
+    async def aget_context_data(self, **kwargs):
+        context = self.get_context_data(**kwargs)
+        sections = await sync_to_async(PageContent.objects.for_page)('contact')
+        context['contact_content'] = sections.get('contact_section')
         return context
 
 class BlogView(TemplateView):
@@ -0,0 +1,61 @@
+"""Concatenate and minify the CSS and JS bundles listed in ASSET_BUNDLES.
+
+rcssmin and rjsmin are used when installed; without them bundles are only
+concatenated, which still saves the requests.
+"""
+import posixpath
+import re
+
+try:
+    import rcssmin
+except ImportError:  # pragma: no cover - optional dependency
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:  # pragma: no cover - optional dependency
+    rjsmin = None
+
+CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+CSS_IMPORT_RE = re.compile(r'@import\s[^;]+;')
+CSS_CHARSET_RE = re.compile(r'@charset\s[^;]+;')
+# A member's source map does not describe the bundle it ends up in.
+SOURCE_MAP_RE = re.compile(r'/\*# sourceMappingURL=[^*]*\*/|^//# sourceMappingURL=.*$', re.MULTILINE)
+
+
+def rebase_css_urls(css, source, bundle):
+    """Rewrite relative url()s in css so they resolve from the bundle's directory."""
+    source_dir = posixpath.dirname(source)
+    bundle_dir = posixpath.dirname(bundle)
+
+    def rebase(match):
+        quote, url = match.groups()
+        if url.startswith(('data:', '#', '/')) or '//' in url:
+            return match.group(0)
+        target = posixpath.normpath(posixpath.join(source_dir, url))
+        return f'url({quote}{posixpath.relpath(target, bundle_dir or ".")}{quote})'
+
+    return CSS_URL_RE.sub(rebase, css)
+
+
+def build_css(name, sources):
+    """Join (path, text) stylesheets into one, keeping @import rules first."""
+    imports = []
+    bodies = []
+    for path, css in sources:
+        css = CSS_CHARSET_RE.sub('', SOURCE_MAP_RE.sub('', rebase_css_urls(css, path, name)))
+        imports.extend(CSS_IMPORT_RE.findall(css))
+        bodies.append(CSS_IMPORT_RE.sub('', css))
+    css = '\n'.join([*imports, *bodies])
+    return rcssmin.cssmin(css) if rcssmin else css
+
+
+def build_js(name, sources):
+    # The semicolons stop a file without a trailing one running into the next.
+    js = '\n;'.join(SOURCE_MAP_RE.sub('', text) for _path, text in sources)
+    return rjsmin.jsmin(js) if rjsmin else js
+
+
+def build_bundle(name, sources):
+    """Return the text of bundle name built from (path, text) sources."""
+    return build_css(name, sources) if name.endswith('.css') else build_js(name, sources)
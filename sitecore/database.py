@@ -0,0 +1,34 @@
+"""Database connection statistics.
+
+Each worker process has its own psycopg pool per database alias. Statistics
+come from the pool of the process that serves the request, so under several
+workers each response describes one of them.
+"""
+import os
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db import connections
+from django.http import JsonResponse
+from django.views.decorators.cache import never_cache
+
+
+def pool_stats():
+    """Return psycopg_pool statistics keyed by the alias of each pooled database."""
+    stats = {}
+    for alias in connections:
+        # Only the PostgreSQL backend has a pool attribute, None when pooling is off.
+        pool = getattr(connections[alias], 'pool', None)
+        if pool is not None:
+            stats[alias] = {
+                'name': pool.name,
+                'min_size': pool.min_size,
+                'max_size': pool.max_size,
+                **pool.get_stats(),
+            }
+    return stats
+
+
+@never_cache
+@staff_member_required
+def pool_stats_view(request):
+    return JsonResponse({'pid': os.getpid(), 'pools': pool_stats()})
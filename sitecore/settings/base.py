@@ -56,6 +56,57 @@ ASGI_APPLICATION = "sitecore.asgi.application"
 
 DATABASES = {"default": env.db(default=f'sqlite:///{BASE_DIR / "db.sqlite3"}')}
 
+# CONN_MAX_AGE keeps a connection open between requests for that many seconds,
+# and CONN_HEALTH_CHECKS tests it before a request reuses it. That only helps
+# sync (WSGI) workers: under ASGI each request runs in its own thread, so
+# connections are never reused and should not be kept.
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=0)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = env.bool("CONN_HEALTH_CHECKS", default=True)
+
+# On PostgreSQL each worker process keeps a psycopg pool of DB_POOL_MIN_SIZE to
+# DB_POOL_MAX_SIZE connections instead. A request waits up to DB_POOL_TIMEOUT
+# seconds for a free one. The pool checks connections itself and replaces
+# persistent connections, so CONN_MAX_AGE is ignored while it is on.
+if env.bool("DB_POOL", default=True) and DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": env.int("DB_POOL_MIN_SIZE", default=2),
+        "max_size": env.int("DB_POOL_MAX_SIZE", default=10),
+        "timeout": env.float("DB_POOL_TIMEOUT", default=10.0),
+    }
+
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
+# Full-page cache for anonymous hits on CMS-driven pages. Entries are keyed by
+# content version, so this only bounds how long unreferenced entries linger.
+PAGE_CACHE_TIMEOUT = env.int("PAGE_CACHE_TIMEOUT", default=60 * 60 * 24)
+
+# How long a worker trusts its last read of the content version row before
+# checking again. Content edits reach other workers within this window.
+CONTENT_VERSION_TTL = env.float("CONTENT_VERSION_TTL", default=1.0)
+
+# Dotted path to a search backend class; empty picks one for the database vendor.
+SEARCH_BACKEND = env.str("SEARCH_BACKEND", default="")
+SEARCH_RESULTS_PER_PAGE = env.int("SEARCH_RESULTS_PER_PAGE", default=10)
+SEARCH_SUGGESTIONS_LIMIT = env.int("SEARCH_SUGGESTIONS_LIMIT", default=8)
+
+# Widths, in pixels, of the WebP/AVIF renditions generate_renditions makes of
+# every CMS image. Images are never upscaled past their own width.
+IMAGE_RENDITION_WIDTHS = env.list("IMAGE_RENDITION_WIDTHS", cast=int, default=[480, 960, 1440, 1920])
+IMAGE_RENDITION_QUALITY = env.int("IMAGE_RENDITION_QUALITY", default=75)
+
+# On-demand thumbnails (/media/thumb/<w>x<h>/<version>/<path>) are kept in this
+# directory, evicting the least recently used once it passes the byte limit.
+THUMBNAIL_CACHE_DIR = env.str("THUMBNAIL_CACHE_DIR", default=str(BASE_DIR / "thumbnail_cache"))
+THUMBNAIL_CACHE_MAX_BYTES = env.int("THUMBNAIL_CACHE_MAX_BYTES", default=256 * 1024 * 1024)
+# Only these WIDTHxHEIGHT sizes are rendered, the ones the templates and the
+# admin ask for. Any other size is a 404, so clients cannot make the server
+# render and store every size they can think of.
+THUMBNAIL_SIZES = env.list("THUMBNAIL_SIZES", default=["160x120", "1200x900"])
+
+# Worker processes collectstatic uses to optimise static images (default: one per CPU).
+STATIC_IMAGE_WORKERS = env.int("STATIC_IMAGE_WORKERS", default=None)
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},  # noqa: E501
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},  # noqa: E501
@@ -72,6 +123,27 @@ STATIC_URL = "/static/"
 STATICFILES_DIRS = [BASE_DIR / "static"]
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# Files concatenated into one file per bundle by collectstatic. The
+# asset_bundle template tag links each member separately until then.
+ASSET_BUNDLES = {
+    "css/site.bundle.css": [
+        "css/bootstrap.min.css",
+        "css/fontawesome.min.css",
+        "css/plugins.css",
+        "css/helper.css",
+        "css/style.css",
+        "css/modern.css",
+    ],
+    "js/site.bundle.js": [
+        "js/vendor/jquery-1.12.4.min.js",
+        "js/popper.min.js",
+        "js/bootstrap.min.js",
+        "js/plugins.js",
+        "js/ajax-mail.js",
+        "js/main.js",
+    ],
+}
+
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
@@ -0,0 +1,63 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from PIL import UnidentifiedImageError
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+from cms_content.imaging import optimize_static_image, webp_sibling
+
+from .bundles import build_bundle
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+
+class OptimizedStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """Hashed, compressed static files with bundles, recompressed images and WebP copies.
+
+    collectstatic copies the source files into STATIC_ROOT before post
+    processing. The PNG and JPEG copies are optimised there, across worker
+    processes, and the hashed names are then taken from the optimised
+    files. Each image's WebP copy is named by webp_sibling() and lands in
+    the manifest like any other file, so templates can look it up.
+
+    The ASSET_BUNDLES are built from the collected files too, and hashed
+    and compressed like the rest.
+    """
+
+    def read_member(self, paths, name):
+        if name not in paths:
+            raise ImproperlyConfigured(f'Asset bundle member {name} was not collected.')
+        storage, path = paths[name]
+        with storage.open(path) as member:
+            return member.read().decode('utf-8')
+
+    def build_bundles(self, paths):
+        for name, members in settings.ASSET_BUNDLES.items():
+            text = build_bundle(name, [(member, self.read_member(paths, member)) for member in members])
+            if self.exists(name):
+                self.delete(name)
+            self._save(name, ContentFile(text.encode('utf-8')))
+            paths[name] = (self, name)
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            paths = dict(paths)
+            images = [name for name in paths if name.lower().endswith(IMAGE_EXTENSIONS)]
+            with ProcessPoolExecutor(max_workers=settings.STATIC_IMAGE_WORKERS) as executor:
+                futures = [
+                    executor.submit(optimize_static_image, self.path(name), settings.IMAGE_RENDITION_QUALITY)
+                    for name in images
+                ]
+                for name, future in zip(images, futures):
+                    try:
+                        sibling = future.result()
+                    except (OSError, UnidentifiedImageError):
+                        # Leave anything Pillow cannot read as collected.
+                        continue
+                    paths[name] = (self, name)
+                    if sibling:
+                        paths[webp_sibling(name)] = (self, webp_sibling(name))
+            self.build_bundles(paths)
+        yield from super().post_process(paths, dry_run, **options)
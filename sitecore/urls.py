@@ -2,7 +2,10 @@ from django.contrib import admin
 from django.urls import include, path
 from django.conf import settings
 
+from .database import pool_stats_view
+
 urlpatterns = [
+    path("admin/db-pool/", pool_stats_view, name="db_pool_stats"),
     path("admin/", admin.site.urls),
     path("", include(("cms_content.urls", "cms_content"), namespace="cms_content")),
     path("", include(("pages.urls", "pages"), namespace="pages")),